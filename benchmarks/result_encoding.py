@@ -0,0 +1,105 @@
+"""Result encoding benchmark.
+
+Compares the original ``json.dumps(..., indent=2, default=str)`` path with
+``server.encode_result`` on a synthetic query result whose rows mix ints,
+strings, Decimal, datetime, bytes and ObjectId values.
+
+Usage:
+    python benchmarks/result_encoding.py --rows 100000 --repeat 3
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+try:
+    from bson import ObjectId
+except ImportError:
+    ObjectId = None
+
+
+def build_result(rows: int) -> dict:
+    started = datetime(2024, 1, 1)
+    result = []
+    for i in range(rows):
+        row = {
+            "id": i,
+            "name": f"customer-{i}",
+            "balance": Decimal(i) / Decimal(100),
+            "created_at": started + timedelta(seconds=i),
+            "token": i.to_bytes(8, "big"),
+            "active": i % 3 != 0,
+        }
+        if ObjectId is not None:
+            row["_id"] = ObjectId()
+        result.append(row)
+    return {"rows": result, "count": rows}
+
+
+def time_encoder(encode, payload: dict, repeat: int) -> tuple[float, int]:
+    timings = []
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        output = encode(payload)
+        timings.append((time.perf_counter() - started) * 1000)
+        size = len(output.encode("utf-8"))
+    return statistics.median(timings), size
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    payload = build_result(args.rows)
+
+    def baseline(result):
+        return json.dumps(result, indent=2, default=str)
+
+    encoders = {"baseline (indent=2, default=str)": baseline}
+    for result_format in ("compact", "pretty"):
+        os.environ["MCP_RESULT_FORMAT"] = result_format
+        sys.modules.pop("server", None)
+        import server
+
+        encoders[f"encode_result ({result_format})"] = server.encode_result
+        if server.orjson is not None:
+            encoders[f"encode_result ({result_format}, stdlib)"] = (
+                lambda result, module=server: _without_orjson(module, result)
+            )
+
+    base_ms, base_size = time_encoder(baseline, payload, args.repeat)
+    report = {"rows": args.rows, "results": []}
+    for name, encode in encoders.items():
+        elapsed_ms, size = time_encoder(encode, payload, args.repeat)
+        report["results"].append({
+            "encoder": name,
+            "median_ms": round(elapsed_ms, 1),
+            "bytes": size,
+            "speedup": round(base_ms / elapsed_ms, 2),
+            "size_vs_baseline": round(size / base_size, 3),
+        })
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+def _without_orjson(module, result) -> str:
+    orjson, module.orjson = module.orjson, None
+    try:
+        return module.encode_result(result)
+    finally:
+        module.orjson = orjson
+
+
+if __name__ == "__main__":
+    sys.exit(main())
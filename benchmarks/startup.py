@@ -0,0 +1,136 @@
+"""Startup benchmark for the MCP server.
+
+Measures two numbers for a cold server process:
+
+* import time - how long ``import server`` takes in a fresh interpreter
+* time to first tools/list - from spawning ``python src/server.py`` over
+  stdio until the ``tools/list`` response arrives
+
+Usage:
+    python benchmarks/startup.py --runs 5
+    python benchmarks/startup.py --max-import-ms 1500 --max-first-list-ms 3000
+    MCP_TOOL_GROUPS=filesystem python benchmarks/startup.py
+
+Exits with status 1 when a median exceeds its ``--max-*`` threshold, so it
+can be used to catch startup regressions.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+IMPORT_SNIPPET = (
+    "import time; t = time.perf_counter(); import server; "
+    "print((time.perf_counter() - t) * 1000)"
+)
+
+
+def measure_import_ms() -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET],
+        cwd=SRC_DIR,
+        env={**os.environ, "PYTHONPATH": str(SRC_DIR)},
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def _send(proc: subprocess.Popen, message: dict) -> None:
+    proc.stdin.write(json.dumps(message) + "\n")
+    proc.stdin.flush()
+
+
+def _read_response(proc: subprocess.Popen, request_id: int) -> dict:
+    for line in proc.stdout:
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if message.get("id") == request_id:
+            return message
+    raise RuntimeError("server exited before responding")
+
+
+def measure_first_list_ms() -> tuple[float, int]:
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, str(SRC_DIR / "server.py")],
+        cwd=SRC_DIR.parent,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    try:
+        _send(proc, {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {},
+                "clientInfo": {"name": "startup-benchmark", "version": "1.0.0"},
+            },
+        })
+        _read_response(proc, 1)
+        _send(proc, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+        _send(proc, {"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        response = _read_response(proc, 2)
+        elapsed = (time.perf_counter() - started) * 1000
+        return elapsed, len(response.get("result", {}).get("tools", []))
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="number of cold starts to time")
+    parser.add_argument("--max-import-ms", type=float, help="fail if median import time exceeds this")
+    parser.add_argument(
+        "--max-first-list-ms", type=float, help="fail if median time to tools/list exceeds this"
+    )
+    args = parser.parse_args()
+
+    import_times = [measure_import_ms() for _ in range(args.runs)]
+    list_runs = [measure_first_list_ms() for _ in range(args.runs)]
+    list_times = [elapsed for elapsed, _ in list_runs]
+
+    report = {
+        "runs": args.runs,
+        "tool_groups": os.getenv("MCP_TOOL_GROUPS", "all"),
+        "tools_listed": list_runs[-1][1],
+        "import_ms": {
+            "median": round(statistics.median(import_times), 1),
+            "min": round(min(import_times), 1),
+            "max": round(max(import_times), 1),
+        },
+        "first_tools_list_ms": {
+            "median": round(statistics.median(list_times), 1),
+            "min": round(min(list_times), 1),
+            "max": round(max(list_times), 1),
+        },
+    }
+    print(json.dumps(report, indent=2))
+
+    failed = False
+    if args.max_import_ms and report["import_ms"]["median"] > args.max_import_ms:
+        print(f"import time regression: > {args.max_import_ms} ms", file=sys.stderr)
+        failed = True
+    if args.max_first_list_ms and report["first_tools_list_ms"]["median"] > args.max_first_list_ms:
+        print(f"time to first tools/list regression: > {args.max_first_list_ms} ms", file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
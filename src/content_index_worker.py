@@ -0,0 +1,55 @@
+"""Worker process for the content search index.
+
+Computes the trigram sets of files for ``ContentIndex`` in server.py. It is
+started as a script and imports only the standard library, so a worker does
+not load the server module, its dependencies or its module-level setup.
+
+Protocol: the parent writes pickled ``(paths, max_bytes)`` batches to stdin
+and reads back one pickled list of ``index_file`` results per batch.
+"""
+
+import os
+import pickle
+import sys
+from array import array
+
+
+def index_file(path: str, max_bytes: int) -> tuple[int, int, bytes | None] | None:
+    """Compute the trigram set of one file.
+
+    Returns ``(size, mtime_ns, trigrams)`` with trigrams packed as uint32s,
+    or ``None`` trigrams for binary and oversized files. Returns ``None`` if
+    the file disappeared.
+    """
+    try:
+        st = os.stat(path)
+        if st.st_size > max_bytes:
+            return st.st_size, st.st_mtime_ns, None
+        with open(path, "rb") as f:
+            data = f.read(max_bytes + 1)
+    except OSError:
+        return None
+    if b"\x00" in data[:8192]:
+        return st.st_size, st.st_mtime_ns, None
+
+    data = data.lower()
+    grams = array("I", sorted(
+        (a << 16) | (b << 8) | c for a, b, c in set(zip(data, data[1:], data[2:]))
+    ))
+    return st.st_size, st.st_mtime_ns, grams.tobytes()
+
+
+def main() -> int:
+    stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+    while True:
+        try:
+            paths, max_bytes = pickle.load(stdin)
+        except EOFError:
+            return 0
+        results = [index_file(path, max_bytes) for path in paths]
+        pickle.dump(results, stdout, protocol=pickle.HIGHEST_PROTOCOL)
+        stdout.flush()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
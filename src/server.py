@@ -1,24 +1,133 @@
-import os
+import asyncio
+import atexit
+import base64
+import functools
+import importlib.util
 import json
+import mmap
+import os
+import re
+import secrets
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from datetime import time as dt_time
+from decimal import Decimal
 from pathlib import Path
-from typing import Any
-from datetime import datetime
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
 
 from fastmcp import FastMCP
 from pydantic import BaseModel
-import pymysql
-import pymongo
-import psycopg2
-import psycopg2.extras
-import requests
-from github import Github
-from sqlalchemy import create_engine, text
-import aiofiles
-import git
-from git import Repo
+
+# Backend drivers (pymysql, psycopg2, pymongo, PyGithub, GitPython, httpx)
+# are imported on first use so a server that only serves a few tool groups
+# does not pay for loading the others at startup.
+if TYPE_CHECKING:
+    from git import Repo
+
+try:
+    import orjson
+except ImportError:  # optional: pip install -e ".[fast-json]"
+    orjson = None
 
 mcp = FastMCP("Universal MCP Server")
 
+TOOL_GROUPS = ("github", "mysql", "postgresql", "mongodb", "filesystem", "custom_api", "git")
+
+SERVER_CONFIG = {
+    "tool_groups": os.getenv("MCP_TOOL_GROUPS", "all"),
+    "disabled_tool_groups": os.getenv("MCP_DISABLED_TOOL_GROUPS", ""),
+    "result_format": os.getenv("MCP_RESULT_FORMAT", "compact").lower(),
+}
+
+
+def _parse_tool_groups(value: str) -> set[str]:
+    return {group.strip().lower() for group in value.split(",") if group.strip()}
+
+
+_requested_groups = _parse_tool_groups(SERVER_CONFIG["tool_groups"])
+ENABLED_TOOL_GROUPS = (
+    set(TOOL_GROUPS) if "all" in _requested_groups else _requested_groups & set(TOOL_GROUPS)
+) - _parse_tool_groups(SERVER_CONFIG["disabled_tool_groups"])
+
+
+def group_tool(*groups: str):
+    """Register a tool with FastMCP only when one of its tool groups is enabled."""
+    if ENABLED_TOOL_GROUPS.intersection(groups):
+        return mcp.tool()
+    return lambda func: func
+
+
+# =============================================================================
+# RESULT ENCODING
+# =============================================================================
+
+
+def _encode_bytes(value: bytes | bytearray | memoryview) -> str:
+    data = bytes(value)
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return base64.b64encode(data).decode("ascii")
+
+
+# Exact-type lookups hit this table directly; other types (ObjectId, driver
+# subclasses) are resolved once by isinstance and cached here, with str as
+# the last resort.
+_RESULT_ENCODERS: dict[type, Callable[[Any], Any]] = {
+    Decimal: str,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    dt_time: dt_time.isoformat,
+    timedelta: str,
+    bytes: _encode_bytes,
+    bytearray: _encode_bytes,
+    memoryview: _encode_bytes,
+    UUID: str,
+    set: list,
+    frozenset: list,
+}
+
+
+def _encode_default(value: Any) -> Any:
+    encoder = _RESULT_ENCODERS.get(type(value))
+    if encoder is None:
+        encoder = next(
+            (enc for typ, enc in list(_RESULT_ENCODERS.items()) if isinstance(value, typ)),
+            str,
+        )
+        _RESULT_ENCODERS[type(value)] = encoder
+    return encoder(value)
+
+
+_PRETTY_RESULTS = SERVER_CONFIG["result_format"] == "pretty"
+_JSON_OPTIONS: dict[str, Any] = (
+    {"indent": 2} if _PRETTY_RESULTS else {"separators": (",", ":")}
+)
+_ORJSON_OPTIONS = 0
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if _PRETTY_RESULTS else 0)
+
+
+def encode_result(result: Any) -> str:
+    """Serialize a tool or resource result to JSON.
+
+    Output is compact unless MCP_RESULT_FORMAT=pretty. orjson is used when it
+    is installed; values it rejects (such as integers wider than 64 bits)
+    fall back to the standard library encoder.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(result, default=_encode_default, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            pass
+    return json.dumps(result, default=_encode_default, ensure_ascii=False, **_JSON_OPTIONS)
+
 DATABASE_CONFIG = {
     "mysql": {
         "host": os.getenv("MYSQL_HOST", "localhost"),
@@ -26,6 +135,17 @@ DATABASE_CONFIG = {
         "user": os.getenv("MYSQL_USER", "root"),
         "password": os.getenv("MYSQL_PASSWORD", ""),
         "database": os.getenv("MYSQL_DATABASE", "test"),
+        "pool_min_size": int(os.getenv("MYSQL_POOL_MIN_SIZE", "1")),
+        "pool_max_size": int(os.getenv("MYSQL_POOL_MAX_SIZE", "10")),
+        "pool_idle_timeout": float(os.getenv("MYSQL_POOL_IDLE_TIMEOUT", "300")),
+        "pool_max_lifetime": float(os.getenv("MYSQL_POOL_MAX_LIFETIME", "3600")),
+        "pool_timeout": float(os.getenv("MYSQL_POOL_TIMEOUT", "30")),
+        "max_workers": int(os.getenv("MYSQL_MAX_WORKERS", "10")),
+        "cursor_idle_timeout": float(os.getenv("MYSQL_CURSOR_IDLE_TIMEOUT", "60")),
+        "max_open_cursors": int(os.getenv("MYSQL_MAX_OPEN_CURSORS", "5")),
+        "schema_cache_ttl": float(os.getenv("MYSQL_SCHEMA_CACHE_TTL", "60")),
+        "result_cache_ttl": float(os.getenv("MYSQL_RESULT_CACHE_TTL", "0")),
+        "result_cache_max_bytes": int(os.getenv("MYSQL_RESULT_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
     },
     "postgresql": {
         "host": os.getenv("POSTGRES_HOST", "localhost"),
@@ -33,11 +153,32 @@ DATABASE_CONFIG = {
         "user": os.getenv("POSTGRES_USER", "postgres"),
         "password": os.getenv("POSTGRES_PASSWORD", ""),
         "database": os.getenv("POSTGRES_DATABASE", "test"),
+        "pool_min_size": int(os.getenv("POSTGRES_POOL_MIN_SIZE", "1")),
+        "pool_max_size": int(os.getenv("POSTGRES_POOL_MAX_SIZE", "10")),
+        "pool_idle_timeout": float(os.getenv("POSTGRES_POOL_IDLE_TIMEOUT", "300")),
+        "pool_max_lifetime": float(os.getenv("POSTGRES_POOL_MAX_LIFETIME", "3600")),
+        "pool_timeout": float(os.getenv("POSTGRES_POOL_TIMEOUT", "30")),
+        "max_workers": int(os.getenv("POSTGRES_MAX_WORKERS", "10")),
+        "cursor_itersize": int(os.getenv("POSTGRES_CURSOR_ITERSIZE", "2000")),
+        "cursor_idle_timeout": float(os.getenv("POSTGRES_CURSOR_IDLE_TIMEOUT", "60")),
+        "cursor_ttl": float(os.getenv("POSTGRES_CURSOR_TTL", "600")),
+        "max_open_cursors": int(os.getenv("POSTGRES_MAX_OPEN_CURSORS", "5")),
+        "schema_cache_ttl": float(os.getenv("POSTGRES_SCHEMA_CACHE_TTL", "60")),
+        "result_cache_ttl": float(os.getenv("POSTGRES_RESULT_CACHE_TTL", "0")),
+        "result_cache_max_bytes": int(os.getenv("POSTGRES_RESULT_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+        "search_path": os.getenv("POSTGRES_SEARCH_PATH", ""),
+        "application_name": os.getenv("POSTGRES_APPLICATION_NAME", "mcp-universal-server"),
+        "read_only": os.getenv("POSTGRES_READ_ONLY", "false").lower() in ("1", "true", "yes"),
     },
     "mongodb": {
         "host": os.getenv("MONGO_HOST", "localhost"),
         "port": int(os.getenv("MONGO_PORT", "27017")),
         "database": os.getenv("MONGO_DATABASE", "test"),
+        "max_pool_size": int(os.getenv("MONGO_MAX_POOL_SIZE", "100")),
+        "min_pool_size": int(os.getenv("MONGO_MIN_POOL_SIZE", "0")),
+        "server_selection_timeout_ms": int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000")),
+        "compressors": os.getenv("MONGO_COMPRESSORS", ""),
+        "max_workers": int(os.getenv("MONGO_MAX_WORKERS", "10")),
     },
 }
 
@@ -45,25 +186,728 @@ GITHUB_CONFIG = {
     "token": os.getenv("GITHUB_TOKEN", ""),
     "owner": os.getenv("GITHUB_OWNER", ""),
     "repo": os.getenv("GITHUB_REPO", ""),
+    "cache_max_entries": int(os.getenv("GITHUB_CACHE_MAX_ENTRIES", "256")),
 }
 
 CUSTOM_API_CONFIG = {
     "base_url": os.getenv("CUSTOM_API_URL", ""),
     "api_key": os.getenv("CUSTOM_API_KEY", ""),
     "headers": json.loads(os.getenv("CUSTOM_API_HEADERS", "{}")),
+    "timeout": float(os.getenv("CUSTOM_API_TIMEOUT", "30")),
+    "connect_timeout": float(os.getenv("CUSTOM_API_CONNECT_TIMEOUT", "10")),
+    "max_connections": int(os.getenv("CUSTOM_API_MAX_CONNECTIONS", "100")),
+    "max_keepalive_connections": int(os.getenv("CUSTOM_API_MAX_KEEPALIVE", "20")),
+    "keepalive_expiry": float(os.getenv("CUSTOM_API_KEEPALIVE_EXPIRY", "30")),
+    "http2": os.getenv("CUSTOM_API_HTTP2", "false").lower() in ("1", "true", "yes"),
 }
 
 LOCAL_GIT_CONFIG = {
     "base_path": os.getenv("LOCAL_GIT_BASE_PATH", "/home/slave/Desktop/tuiTest"),
     "default_branch": os.getenv("LOCAL_GIT_DEFAULT_BRANCH", "main"),
+    "repo_cache_size": int(os.getenv("LOCAL_GIT_REPO_CACHE_SIZE", "16")),
+    "rename_limit": int(os.getenv("LOCAL_GIT_RENAME_LIMIT", "1000")),
+    "status_untracked_cache": os.getenv("LOCAL_GIT_STATUS_UNTRACKED_CACHE", "false").lower() == "true",
+    "status_fsmonitor": os.getenv("LOCAL_GIT_STATUS_FSMONITOR", "false").lower() == "true",
+    "commit_graph_interval": float(os.getenv("LOCAL_GIT_COMMIT_GRAPH_INTERVAL", "3600")),
+    "diff_max_bytes": int(os.getenv("LOCAL_GIT_DIFF_MAX_BYTES", str(1024 * 1024))),
+    "diff_file_max_bytes": int(os.getenv("LOCAL_GIT_DIFF_FILE_MAX_BYTES", str(64 * 1024))),
+}
+
+FILESYSTEM_CONFIG = {
+    "max_read_bytes": int(os.getenv("FILESYSTEM_MAX_READ_BYTES", str(8 * 1024 * 1024))),
+    "mmap_threshold": int(os.getenv("FILESYSTEM_MMAP_THRESHOLD", str(1024 * 1024))),
+    "batch_max_bytes": int(os.getenv("FILESYSTEM_BATCH_MAX_BYTES", str(16 * 1024 * 1024))),
+    "batch_concurrency": int(os.getenv("FILESYSTEM_BATCH_CONCURRENCY", "8")),
+    "write_fsync": os.getenv("FILESYSTEM_WRITE_FSYNC", "none").lower(),
+    "search_exclude": {
+        name.strip()
+        for name in os.getenv("FILESYSTEM_SEARCH_EXCLUDE", ".git,node_modules").split(",")
+        if name.strip()
+    },
+    "search_workers": int(os.getenv("FILESYSTEM_SEARCH_WORKERS", "8")),
+    "index_roots": [
+        root.strip()
+        for root in os.getenv("FILESYSTEM_INDEX_ROOTS", "").split(os.pathsep)
+        if root.strip()
+    ],
+    "index_path": os.getenv(
+        "FILESYSTEM_INDEX_PATH",
+        str(Path.home() / ".cache" / "mcp-universal-server" / "content-index.db"),
+    ),
+    "index_workers": int(os.getenv("FILESYSTEM_INDEX_WORKERS", "0")),
+    "index_max_file_bytes": int(os.getenv("FILESYSTEM_INDEX_MAX_FILE_BYTES", str(1024 * 1024))),
+    "index_refresh_interval": float(os.getenv("FILESYSTEM_INDEX_REFRESH_INTERVAL", "300")),
+}
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no pooled connection becomes available in time."""
+
+
+class ConnectionPool:
+    """Bounded, thread-safe pool of DB-API connections.
+
+    Connections are created lazily up to ``max_size``. Idle connections above
+    ``min_size`` are closed after ``idle_timeout`` seconds and every connection
+    is retired once it is older than ``max_lifetime``. ``check`` is called on
+    checkout and must raise if the connection is no longer usable; ``reset``
+    is called on return to clear any open transaction.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        connect: Callable[[], Any],
+        *,
+        min_size: int = 1,
+        max_size: int = 10,
+        idle_timeout: float = 300.0,
+        max_lifetime: float = 3600.0,
+        timeout: float = 30.0,
+        check: Callable[[Any], None] | None = None,
+        reset: Callable[[Any], None] | None = None,
+    ):
+        self.name = name
+        self._connect = connect
+        self._check = check
+        self._reset = reset
+        self.min_size = max(0, min_size)
+        self.max_size = max(1, max_size, self.min_size)
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        self.timeout = timeout
+
+        self._cond = threading.Condition()
+        # Idle entries are (connection, created_at, returned_at); the most
+        # recently returned connection is reused first so it stays warm.
+        self._idle: deque[tuple[Any, float, float]] = deque()
+        self._created_at: dict[int, float] = {}
+        self._size = 0
+        self._in_use = 0
+        self._closed = False
+        self._stats = {
+            "connections_created": 0,
+            "connections_closed": 0,
+            "checkouts": 0,
+            "failed_checks": 0,
+            "waits": 0,
+            "wait_time_ms": 0.0,
+            "timeouts": 0,
+        }
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return bool(self.max_lifetime) and now - created_at >= self.max_lifetime
+
+    def _reap_locked(self, now: float) -> list[Any]:
+        """Drop expired and surplus idle connections; caller closes them."""
+        doomed = []
+        kept: deque[tuple[Any, float, float]] = deque()
+        for conn, created_at, returned_at in self._idle:
+            surplus = self._size - len(doomed) > self.min_size
+            idle_too_long = bool(self.idle_timeout) and now - returned_at >= self.idle_timeout
+            if self._expired(created_at, now) or (surplus and idle_too_long):
+                doomed.append(conn)
+            else:
+                kept.append((conn, created_at, returned_at))
+        self._idle = kept
+        self._size -= len(doomed)
+        return doomed
+
+    def _discard(self, conns: list[Any]) -> None:
+        for conn in conns:
+            self._created_at.pop(id(conn), None)
+            try:
+                conn.close()
+            except Exception:
+                pass
+        if conns:
+            with self._cond:
+                self._stats["connections_closed"] += len(conns)
+
+    def _open(self) -> Any:
+        try:
+            conn = self._connect()
+        except BaseException:
+            with self._cond:
+                self._size -= 1
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._created_at[id(conn)] = time.monotonic()
+            self._stats["connections_created"] += 1
+            self._stats["checkouts"] += 1
+        return conn
+
+    def acquire(self) -> Any:
+        """Check out a live connection, waiting up to ``timeout`` seconds."""
+        deadline = time.monotonic() + self.timeout
+
+        while True:
+            entry = None
+            create = False
+            doomed: list[Any] = []
+            wait_started = None
+            with self._cond:
+                if self._closed:
+                    raise RuntimeError(f"{self.name} connection pool is closed")
+                while True:
+                    doomed += self._reap_locked(time.monotonic())
+                    if self._idle:
+                        entry = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        create = True
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        break
+                    if wait_started is None:
+                        wait_started = time.monotonic()
+                        self._stats["waits"] += 1
+                    self._cond.wait(remaining)
+                if wait_started is not None:
+                    self._stats["wait_time_ms"] += (time.monotonic() - wait_started) * 1000
+                if entry is not None or create:
+                    self._in_use += 1
+
+            self._discard(doomed)
+            if entry is None and not create:
+                raise PoolTimeoutError(
+                    f"Timed out after {self.timeout}s waiting for a {self.name} connection"
+                )
+            if create:
+                return self._open()
+
+            conn = entry[0]
+            try:
+                if self._check is not None:
+                    self._check(conn)
+            except Exception:
+                with self._cond:
+                    self._stats["failed_checks"] += 1
+                self.release(conn, discard=True)
+                continue
+            with self._cond:
+                self._stats["checkouts"] += 1
+            return conn
+
+    def release(self, conn: Any, discard: bool = False) -> None:
+        """Return a connection to the pool, or close it if ``discard`` is set."""
+        if not discard and self._reset is not None:
+            try:
+                self._reset(conn)
+            except Exception:
+                discard = True
+
+        now = time.monotonic()
+        created_at = self._created_at.get(id(conn), now)
+        with self._cond:
+            self._in_use -= 1
+            if discard or self._closed or self._expired(created_at, now):
+                self._size -= 1
+                doomed = [conn]
+            else:
+                self._idle.append((conn, created_at, now))
+                doomed = []
+            doomed += self._reap_locked(now)
+            self._cond.notify()
+        self._discard(doomed)
+
+    @contextmanager
+    def connection(self):
+        """Context manager that checks a connection out and returns it.
+
+        Connections that raised a driver-level error are closed instead of
+        being returned, so a broken socket never goes back into the pool.
+        """
+        conn = self.acquire()
+        try:
+            yield conn
+        except Exception:
+            self.release(conn, discard=_is_disconnect(conn))
+            raise
+        else:
+            self.release(conn)
+
+    def close(self) -> None:
+        """Close all idle connections; in-use ones are closed on return."""
+        with self._cond:
+            self._closed = True
+            doomed = [conn for conn, _, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(doomed)
+            self._cond.notify_all()
+        self._discard(doomed)
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "size": self._size,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                **self._stats,
+                "wait_time_ms": round(self._stats["wait_time_ms"], 3),
+            }
+
+
+def _is_disconnect(conn: Any) -> bool:
+    """Best-effort check whether a connection died while it was checked out."""
+    if getattr(conn, "closed", False):
+        return True
+    open_attr = getattr(conn, "open", None)
+    return open_attr is False
+
+
+class CursorStream:
+    """An open server-side cursor that is read one bounded page at a time.
+
+    ``key`` identifies the query that opened it, so a continuation token is
+    only honoured for that query.
+    """
+
+    def __init__(self, conn: Any, cursor: Any, release: Callable[..., None], key: Any = None):
+        self.conn = conn
+        self.cursor = cursor
+        self.key = key
+        self._release = release
+        self._rows = iter(cursor)
+        self._pending: Any = None
+        self.rows_sent = 0
+        self.created_at = self.last_used = time.monotonic()
+
+    def read_page(self, max_rows: int, max_bytes: int) -> tuple[list, bool]:
+        """Return up to ``max_rows`` rows totalling at most ``max_bytes``.
+
+        At least one row is returned per page so a single oversized row cannot
+        stall the stream. The second value is True once the cursor is drained.
+        """
+        rows = []
+        size = 0
+        while len(rows) < max(1, max_rows):
+            if self._pending is not None:
+                row, self._pending = self._pending, None
+            else:
+                row = next(self._rows, None)
+                if row is None:
+                    self.rows_sent += len(rows)
+                    return rows, True
+            row_size = len(encode_result(row))
+            if rows and size + row_size > max_bytes:
+                self._pending = row
+                break
+            rows.append(row)
+            size += row_size
+        self.rows_sent += len(rows)
+        self.last_used = time.monotonic()
+        return rows, False
+
+    def close(self, discard: bool = False) -> None:
+        """Release the connection; ``discard`` drops it without draining rows."""
+        if discard:
+            self._release(self.conn, discard=True)
+            return
+        try:
+            self.cursor.close()
+        except Exception:
+            self._release(self.conn, discard=True)
+        else:
+            self._release(self.conn)
+
+
+class CursorRegistry:
+    """Open cursor streams addressable by continuation token.
+
+    A stream is removed while a page is being read, so the idle reaper and
+    concurrent callers never touch a cursor that is in use. Streams idle for
+    longer than ``idle_timeout`` or older than ``max_age`` (when set) are
+    closed by a background thread, and the least recently used stream is
+    closed when ``max_open`` is exceeded.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        idle_timeout: float = 60.0,
+        max_open: int = 5,
+        max_age: float | None = None,
+    ):
+        self.name = name
+        self.idle_timeout = idle_timeout
+        self.max_age = max_age
+        self.max_open = max(1, max_open)
+        self._streams: dict[str, CursorStream] = {}
+        self._lock = threading.Lock()
+        self._reaper: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self._stats = {"opened": 0, "completed": 0, "reclaimed": 0}
+
+    def open(self, stream: CursorStream) -> None:
+        with self._lock:
+            self._stats["opened"] += 1
+
+    def put(self, stream: CursorStream, token: str | None = None) -> str:
+        """Park a stream for later resumption and return its token."""
+        token = token or secrets.token_urlsafe(16)
+        stream.last_used = time.monotonic()
+        evicted = []
+        with self._lock:
+            self._streams[token] = stream
+            while len(self._streams) > self.max_open:
+                oldest = min(self._streams, key=lambda t: self._streams[t].last_used)
+                evicted.append(self._streams.pop(oldest))
+            self._stats["reclaimed"] += len(evicted)
+            if self._reaper is None and (self.idle_timeout or self.max_age):
+                self._reaper = threading.Thread(
+                    target=self._reap_forever, name=f"{self.name}-cursor-reaper", daemon=True
+                )
+                self._reaper.start()
+        for old in evicted:
+            old.close(discard=True)
+        return token
+
+    def finish(self, stream: CursorStream, discard: bool = False) -> None:
+        with self._lock:
+            self._stats["completed"] += 1
+        stream.close(discard=discard)
+
+    def _expired(self, stream: CursorStream, now: float) -> bool:
+        if self.max_age and now - stream.created_at >= self.max_age:
+            return True
+        return bool(self.idle_timeout) and now - stream.last_used >= self.idle_timeout
+
+    def take(self, token: str, key: Any = None) -> CursorStream:
+        """Remove and return a parked stream opened for ``key``.
+
+        A token presented with a different query is rejected and its stream
+        stays parked for the query it belongs to.
+        """
+        with self._lock:
+            stream = self._streams.pop(token, None)
+            if stream is not None and key is not None and stream.key != key:
+                self._streams[token] = stream
+                raise ValueError(
+                    f"{self.name} continuation token belongs to a different query or params"
+                )
+        if stream is not None and self._expired(stream, time.monotonic()):
+            with self._lock:
+                self._stats["reclaimed"] += 1
+            stream.close(discard=True)
+            stream = None
+        if stream is None:
+            raise KeyError(f"Unknown or expired {self.name} continuation token")
+        return stream
+
+    def reap(self) -> int:
+        now = time.monotonic()
+        with self._lock:
+            expired = [t for t, stream in self._streams.items() if self._expired(stream, now)]
+            doomed = [self._streams.pop(t) for t in expired]
+            self._stats["reclaimed"] += len(doomed)
+        for stream in doomed:
+            stream.close(discard=True)
+        return len(doomed)
+
+    def _reap_forever(self) -> None:
+        limits = [limit for limit in (self.idle_timeout, self.max_age) if limit]
+        interval = max(1.0, min(min(limits) / 2, 30.0))
+        while not self._stopped.wait(interval):
+            self.reap()
+
+    def close(self) -> None:
+        self._stopped.set()
+        with self._lock:
+            doomed = list(self._streams.values())
+            self._streams.clear()
+        for stream in doomed:
+            stream.close(discard=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "open": len(self._streams),
+                "max_open": self.max_open,
+                "idle_timeout": self.idle_timeout,
+                "max_age": self.max_age,
+                **self._stats,
+            }
+
+
+class SchemaCache:
+    """In-process cache for introspection results, keyed per backend.
+
+    Entries are served straight from memory for ``ttl`` seconds. After that a
+    single cheap catalog fingerprint query is run for the backend; entries
+    recorded under the same fingerprint are kept, anything else is reloaded.
+    """
+
+    def __init__(self):
+        self._sources: dict[str, tuple[Callable[[], Any], Callable[[Any], Any]]] = {}
+        self._entries: dict[tuple[str, str], tuple[Any, Any]] = {}
+        self._versions: dict[str, tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "revalidations": 0, "misses": 0, "invalidations": 0}
+
+    def register(
+        self,
+        backend: str,
+        connection: Callable[[], Any],
+        version: Callable[[Any], Any],
+    ) -> None:
+        """Set how to borrow a connection and fetch the schema fingerprint."""
+        self._sources[backend] = (connection, version)
+
+    def peek(self, backend: str, key: str, ttl: float) -> Any | None:
+        """Return a cached value that needs no revalidation, else None."""
+        if ttl <= 0:
+            return None
+        with self._lock:
+            entry = self._entries.get((backend, key))
+            state = self._versions.get(backend)
+            if entry is None or state is None or entry[1] != state[0]:
+                return None
+            if time.monotonic() - state[1] >= ttl:
+                return None
+            self._stats["hits"] += 1
+            return entry[0]
+
+    def load(self, backend: str, key: str, ttl: float, loader: Callable[[Any], Any]) -> Any:
+        """Revalidate or (re)load an entry; runs blocking database calls."""
+        connection, version_query = self._sources[backend]
+        with connection() as conn:
+            if ttl <= 0:
+                return loader(conn)
+
+            now = time.monotonic()
+            with self._lock:
+                state = self._versions.get(backend)
+            if state is None or now - state[1] >= ttl:
+                state = (version_query(conn), now)
+                with self._lock:
+                    self._versions[backend] = state
+
+            with self._lock:
+                entry = self._entries.get((backend, key))
+                if entry is not None and entry[1] == state[0]:
+                    self._stats["revalidations"] += 1
+                    return entry[0]
+
+            value = loader(conn)
+            with self._lock:
+                self._stats["misses"] += 1
+                self._entries[(backend, key)] = (value, state[0])
+            return value
+
+    def invalidate(self, backend: str | None = None, key: str | None = None) -> int:
+        """Drop matching entries; dropping a whole backend also forgets its fingerprint."""
+        with self._lock:
+            doomed = [
+                entry_key for entry_key in self._entries
+                if (backend is None or entry_key[0] == backend)
+                and (key is None or entry_key[1] == key)
+            ]
+            for entry_key in doomed:
+                del self._entries[entry_key]
+            if key is None:
+                for name in [name for name in self._versions if backend in (None, name)]:
+                    del self._versions[name]
+            self._stats["invalidations"] += len(doomed)
+            return len(doomed)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), **self._stats}
+
+
+class QueryResultCache:
+    """Byte-bounded LRU cache of encoded read-only query results.
+
+    Entries are sized by the length of their encoded JSON.
+    Each entry carries its own expiry and the set of tables the query read.
+    Invalidation drops entries by table and bumps a generation counter, so a
+    read that was already running when a write landed cannot store its
+    (possibly stale) result afterwards.
+    """
+
+    def __init__(self, name: str, max_bytes: int):
+        self.name = name
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple, tuple[str, int, float, frozenset[str]]] = OrderedDict()
+        self._bytes = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "invalidations": 0,
+        }
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: tuple) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            if entry[2] <= time.monotonic():
+                self._drop(key)
+                self._stats["expirations"] += 1
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry[0]
+
+    def put(
+        self,
+        key: tuple,
+        value: str,
+        ttl: float,
+        tables: frozenset[str],
+        generation: int,
+    ) -> bool:
+        """Store a result unless it is too large or an invalidation raced it."""
+        size = len(value)
+        if ttl <= 0 or size > self.max_bytes:
+            return False
+        with self._lock:
+            if generation != self._generation:
+                return False
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (value, size, time.monotonic() + ttl, tables)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self._stats["evictions"] += 1
+            return True
+
+    def invalidate(self, tables: frozenset[str] | None = None) -> int:
+        """Drop entries that read any of ``tables``; ``None`` drops everything."""
+        with self._lock:
+            self._generation += 1
+            doomed = [
+                key for key, entry in self._entries.items()
+                if tables is None or entry[3] & tables
+            ]
+            for key in doomed:
+                self._drop(key)
+            self._stats["invalidations"] += len(doomed)
+            return len(doomed)
+
+    def _drop(self, key: tuple) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry[1]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                **self._stats,
+            }
+
+
+_SQL_LEXERS = {
+    # MySQL quotes strings with ' or " and honours backslash escapes;
+    # PostgreSQL uses " for identifiers and adds dollar quoting.
+    "mysql": re.compile(
+        r"(?P<literal>'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.|\"\")*\")"
+        r"|(?P<ident>`[^`]*`)"
+        r"|(?P<comment>--[^\n]*|#[^\n]*|/\*.*?\*/)"
+        r"|(?P<space>\s+)",
+        re.S,
+    ),
+    "postgresql": re.compile(
+        r"(?P<literal>'(?:[^']|'')*'|\$(\w*)\$.*?\$\2\$)"
+        r"|(?P<ident>\"(?:[^\"]|\"\")*\")"
+        r"|(?P<comment>--[^\n]*|/\*.*?\*/)"
+        r"|(?P<space>\s+)",
+        re.S,
+    ),
 }
+_SQL_READ_VERBS = {"select", "with", "show", "values", "table", "explain", "describe", "desc"}
+_SQL_WRITE_WORDS = re.compile(
+    r"\b(?:insert|update|delete|merge|replace|into|create|alter|drop|truncate|rename"
+    r"|grant|revoke|lock|call|do|copy|load|set|vacuum|analyze|refresh|reindex|cluster"
+    r"|comment|nextval|setval)\b"
+)
+_SQL_TABLE_LISTS = re.compile(
+    r"\b(?:from|join|update|into|table|truncate|using)\s+(.+?)"
+    r"(?=\b(?:where|join|on|set|values|select|group|order|having|limit|offset|union"
+    r"|intersect|except|returning|inner|left|right|full|cross|natural|window|for)\b|[();]|$)",
+    re.S,
+)
+_SQL_NOT_TABLES = {"table", "only", "lateral", "if", "ignore", "low_priority", "quick"}
+
+
+def _scan_sql(backend: str, query: str) -> tuple[str, bool, frozenset[str]]:
+    """Normalize a statement and classify it for the result cache.
+
+    Returns the statement with comments dropped and whitespace collapsed
+    outside literals, whether it is a plain read, and the unqualified,
+    lower-cased names of the tables it mentions.
+    """
+    normalized: list[str] = []
+    skeleton: list[str] = []
+    pos = 0
+    for match in _SQL_LEXERS[backend].finditer(query):
+        if match.start() > pos:
+            text = query[pos:match.start()]
+            normalized.append(text)
+            skeleton.append(text.lower())
+        pos = match.end()
+        kind = match.lastgroup
+        if kind == "literal":
+            normalized.append(match.group())
+            skeleton.append("?")
+        elif kind == "ident":
+            normalized.append(match.group())
+            skeleton.append(match.group()[1:-1].lower())
+        elif normalized and normalized[-1] != " ":
+            normalized.append(" ")
+            skeleton.append(" ")
+    normalized.append(query[pos:])
+    skeleton.append(query[pos:].lower())
+
+    statement = "".join(normalized).strip().rstrip(";").rstrip()
+    shape = "".join(skeleton)
+    verb = shape.split(None, 1)[0] if shape.strip() else ""
+    read_only = verb in _SQL_READ_VERBS and not _SQL_WRITE_WORDS.search(shape)
+
+    tables = set()
+    for table_list in _SQL_TABLE_LISTS.findall(shape):
+        for item in table_list.split(","):
+            words = [word for word in item.split() if word not in _SQL_NOT_TABLES]
+            if words and re.fullmatch(r"[\w$.]+", words[0]):
+                tables.add(words[0].rsplit(".", 1)[-1])
+    return statement, read_only, frozenset(tables)
 
 
 class MySQLConnection:
     def __init__(self):
         self.config = DATABASE_CONFIG["mysql"]
+        self.pool = ConnectionPool(
+            "mysql",
+            self.get_connection,
+            min_size=self.config["pool_min_size"],
+            max_size=self.config["pool_max_size"],
+            idle_timeout=self.config["pool_idle_timeout"],
+            max_lifetime=self.config["pool_max_lifetime"],
+            timeout=self.config["pool_timeout"],
+            check=lambda conn: conn.ping(reconnect=False),
+            reset=lambda conn: conn.rollback(),
+        )
 
     def get_connection(self):
+        import pymysql
+
         return pymysql.connect(
             host=self.config["host"],
             port=self.config["port"],
@@ -73,35 +917,834 @@ class MySQLConnection:
             cursorclass=pymysql.cursors.DictCursor,
         )
 
+    def connection(self):
+        """Borrow a pooled connection for the duration of a ``with`` block."""
+        return self.pool.connection()
+
+    def close(self):
+        self.pool.close()
+
+
+def _check_postgresql_connection(conn) -> None:
+    """Reject connections that psycopg2 already knows are broken."""
+    import psycopg2
+    import psycopg2.extensions
+
+    if conn.closed:
+        raise psycopg2.InterfaceError("connection already closed")
+    if conn.get_transaction_status() == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN:
+        raise psycopg2.OperationalError("connection is in an unknown state")
+
 
 class PostgreSQLConnection:
-    def __init__(self):
+    def __init__(self, session_setup: Callable[[Any], None] | None = None):
         self.config = DATABASE_CONFIG["postgresql"]
+        self.session_setup = session_setup or self.setup_session
+        self.pool = ConnectionPool(
+            "postgresql",
+            self._connect_pooled,
+            min_size=self.config["pool_min_size"],
+            max_size=self.config["pool_max_size"],
+            idle_timeout=self.config["pool_idle_timeout"],
+            max_lifetime=self.config["pool_max_lifetime"],
+            timeout=self.config["pool_timeout"],
+            check=_check_postgresql_connection,
+            reset=lambda conn: conn.rollback(),
+        )
 
     def get_connection(self):
+        import psycopg2
+
         return psycopg2.connect(
             host=self.config["host"],
             port=self.config["port"],
             user=self.config["user"],
             password=self.config["password"],
             database=self.config["database"],
+            application_name=self.config["application_name"],
         )
 
+    def setup_session(self, conn) -> None:
+        """Apply the configured session defaults to a freshly opened connection."""
+        if self.config["search_path"]:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    "SELECT set_config('search_path', %s, false)",
+                    (self.config["search_path"],),
+                )
+            conn.commit()
+        if self.config["read_only"]:
+            conn.set_session(readonly=True)
+
+    def _connect_pooled(self):
+        conn = self.get_connection()
+        try:
+            self.session_setup(conn)
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+    def connection(self):
+        """Borrow a pooled connection for the duration of a ``with`` block."""
+        return self.pool.connection()
+
+    def close(self):
+        self.pool.close()
+
+
+class _MongoMonitor:
+    """Counts driver pool and heartbeat events for the status resource."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {
+            "connections_created": 0,
+            "connections_closed": 0,
+            "checkouts": 0,
+            "checkout_failures": 0,
+            "checkins": 0,
+            "pool_clears": 0,
+            "heartbeats_succeeded": 0,
+            "heartbeats_failed": 0,
+        }
+        self.last_heartbeat: dict[str, Any] = {}
+
+    def _bump(self, key: str) -> None:
+        with self._lock:
+            self.counters[key] += 1
+
+    def _heartbeat(self, event, ok: bool) -> None:
+        with self._lock:
+            self.counters["heartbeats_succeeded" if ok else "heartbeats_failed"] += 1
+            self.last_heartbeat[f"{event.connection_id[0]}:{event.connection_id[1]}"] = {
+                "ok": ok,
+                "duration_ms": round(event.duration * 1000, 3),
+                "at": datetime.now().isoformat(),
+            }
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self._bump("pool_clears")
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        self._bump("connections_created")
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._bump("connections_closed")
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        self._bump("checkout_failures")
+
+    def connection_checked_out(self, event):
+        self._bump("checkouts")
+
+    def connection_checked_in(self, event):
+        self._bump("checkins")
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        self._heartbeat(event, True)
+
+    def failed(self, event):
+        self._heartbeat(event, False)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {**self.counters, "last_heartbeat": dict(self.last_heartbeat)}
+
+
+@functools.cache
+def _mongo_listener_type() -> type:
+    """Combine _MongoMonitor with pymongo's listener bases once pymongo is loaded."""
+    from pymongo import monitoring
+
+    return type(
+        "MongoListener",
+        (_MongoMonitor, monitoring.ConnectionPoolListener, monitoring.ServerHeartbeatListener),
+        {},
+    )
+
 
 class MongoDBConnection:
     def __init__(self):
         self.config = DATABASE_CONFIG["mongodb"]
+        self.monitor: _MongoMonitor | None = None
+        self._client = None
+        self._lock = threading.Lock()
 
     def get_client(self):
-        return pymongo.MongoClient(
-            host=self.config["host"],
-            port=self.config["port"],
+        """Return the process-wide MongoClient, creating it on first use."""
+        client = self._client
+        if client is not None:
+            return client
+        with self._lock:
+            if self._client is None:
+                import pymongo
+
+                self.monitor = _mongo_listener_type()()
+                options = {
+                    "maxPoolSize": self.config["max_pool_size"],
+                    "minPoolSize": self.config["min_pool_size"],
+                    "serverSelectionTimeoutMS": self.config["server_selection_timeout_ms"],
+                    "event_listeners": [self.monitor],
+                }
+                if self.config["compressors"]:
+                    options["compressors"] = self.config["compressors"]
+                self._client = pymongo.MongoClient(
+                    host=self.config["host"],
+                    port=self.config["port"],
+                    **options,
+                )
+            return self._client
+
+    def close(self):
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    def stats(self) -> dict:
+        client = self._client
+        status = {
+            "client_open": client is not None,
+            "max_pool_size": self.config["max_pool_size"],
+            "min_pool_size": self.config["min_pool_size"],
+            "compressors": self.config["compressors"] or None,
+            **(self.monitor.snapshot() if self.monitor else {}),
+        }
+        if client is not None:
+            description = client.topology_description
+            status["topology_type"] = description.topology_type_name
+            status["servers"] = [
+                {
+                    "address": f"{server.address[0]}:{server.address[1]}",
+                    "type": server.server_type_name,
+                    "round_trip_time_ms": (
+                        round(server.round_trip_time * 1000, 3)
+                        if server.round_trip_time is not None else None
+                    ),
+                }
+                for server in description.server_descriptions().values()
+            ]
+        return status
+
+
+class GitHubConnection:
+    """Process-wide GitHub client with an ETag/Last-Modified response cache.
+
+    Conditional GETs that come back ``304 Not Modified`` are answered from
+    the cache and do not count against the GitHub rate limit.
+    """
+
+    def __init__(self):
+        self.config = GITHUB_CONFIG
+        self._client = None
+        self._repo = None
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[str, tuple[str | None, str | None, Any]] = OrderedDict()
+        self._stats = {"requests": 0, "not_modified": 0, "evictions": 0}
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.config['owner']}/{self.config['repo']}"
+
+    def get_client(self):
+        with self._lock:
+            if self._client is None:
+                from github import Auth, Github
+
+                self._client = Github(auth=Auth.Token(self.config["token"]))
+            return self._client
+
+    def get_repo(self):
+        """Return the configured repository without a lookup round trip."""
+        client = self.get_client()
+        with self._lock:
+            if self._repo is None:
+                self._repo = client.get_repo(self.full_name, lazy=True)
+            return self._repo
+
+    def get_json(self, path: str, params: dict | None = None) -> Any:
+        """GET a REST API path, revalidating any cached copy with the server."""
+        requester = self.get_client().requester
+        key = path + "?" + "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+        with self._lock:
+            cached = self._cache.get(key)
+
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        status, response_headers, output = requester.requestJson(
+            "GET", path, parameters=params, headers=headers
         )
+        with self._lock:
+            self._stats["requests"] += 1
+            if status == 304 and cached:
+                self._stats["not_modified"] += 1
+                self._cache.move_to_end(key)
+                return cached[2]
+
+        data = json.loads(output) if output else None
+        if status >= 400:
+            raise requester.createException(status, response_headers, data)
+
+        etag = response_headers.get("etag")
+        last_modified = response_headers.get("last-modified")
+        if etag or last_modified:
+            with self._lock:
+                self._cache[key] = (etag, last_modified, data)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.config["cache_max_entries"]:
+                    self._cache.popitem(last=False)
+                    self._stats["evictions"] += 1
+        return data
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"cached_responses": len(self._cache), **self._stats}
+
+
+def _git_ref_fingerprint(git_dir: Path, common_dir: Path) -> tuple:
+    """Return mtimes that change whenever ``HEAD`` or any ref is updated."""
+    stamps = []
+    for path in (git_dir / "HEAD", common_dir / "packed-refs"):
+        try:
+            stamps.append(path.stat().st_mtime_ns)
+        except OSError:
+            stamps.append(0)
+
+    # Ref updates are written to a lock file in the ref's own directory and
+    # renamed into place, so every directory under refs/ is stamped, however
+    # deeply the ref is nested, along with the loose ref files themselves.
+    stack = [str(common_dir / "refs")]
+    while stack:
+        path = stack.pop()
+        try:
+            stamps.append((path, os.stat(path).st_mtime_ns))
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    stamps.append((entry.name, entry.stat(follow_symlinks=False).st_mtime_ns))
+            except OSError:
+                continue
+    return tuple(stamps)
+
+
+class GitRepoCache:
+    """Pool of idle GitPython ``Repo`` handles keyed by resolved path.
+
+    A pooled ``Repo`` keeps its persistent ``git cat-file --batch`` workers,
+    so object reads do not fork a new ``git`` per call. Those workers are not
+    thread-safe, so each handle is checked out to one caller at a time and a
+    concurrent caller gets a handle of its own. Handles are closed only while
+    idle: when evicted, or when ``HEAD`` or the refs changed since they were
+    opened.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._idle: OrderedDict[int, tuple[Path, Any, tuple]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._in_use = 0
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0, "evictions": 0}
+
+    @staticmethod
+    def _fingerprint(repo) -> tuple:
+        return _git_ref_fingerprint(Path(repo.git_dir), Path(repo.common_dir))
+
+    def _take_idle(self, path: Path):
+        """Pop the most recently used valid idle handle for ``path``."""
+        stale = []
+        found = None
+        with self._lock:
+            for key in reversed(self._idle):
+                entry_path, repo, fingerprint = self._idle[key]
+                if entry_path != path:
+                    continue
+                del self._idle[key]
+                if self._fingerprint(repo) == fingerprint:
+                    found = (repo, fingerprint)
+                    self._stats["hits"] += 1
+                    break
+                stale.append(repo)
+                self._stats["invalidations"] += 1
+            if found is None:
+                self._stats["misses"] += 1
+            self._in_use += 1
+        for repo in stale:
+            repo.close()
+        return found
+
+    @contextmanager
+    def checkout(self, path: Path):
+        """Lend a ``Repo`` for ``path`` to the caller until the block exits."""
+        from git import Repo
+
+        try:
+            found = self._take_idle(path)
+            if found is None:
+                repo = Repo(path)
+                fingerprint = self._fingerprint(repo)
+            else:
+                repo, fingerprint = found
+        except BaseException:
+            with self._lock:
+                self._in_use -= 1
+            raise
+        try:
+            yield repo
+        finally:
+            self._release(path, repo, fingerprint)
+
+    def _release(self, path: Path, repo, fingerprint: tuple) -> None:
+        doomed = []
+        with self._lock:
+            self._in_use -= 1
+            if self.max_size <= 0:
+                doomed.append(repo)
+            elif self._fingerprint(repo) != fingerprint:
+                doomed.append(repo)
+                self._stats["invalidations"] += 1
+            else:
+                self._idle[id(repo)] = (path, repo, fingerprint)
+                while len(self._idle) > self.max_size:
+                    _, (_, evicted, _) = self._idle.popitem(last=False)
+                    doomed.append(evicted)
+                    self._stats["evictions"] += 1
+        for handle in doomed:
+            handle.close()
+
+    def invalidate(self, path: Path | None = None) -> None:
+        """Close idle handles; handles in use are closed when released."""
+        with self._lock:
+            keys = [key for key, entry in self._idle.items() if path is None or entry[0] == path]
+            doomed = [self._idle.pop(key)[1] for key in keys]
+        for repo in doomed:
+            repo.close()
+
+    def close(self) -> None:
+        self.invalidate()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "idle_repos": len(self._idle),
+                "in_use": self._in_use,
+                "max_size": self.max_size,
+                **self._stats,
+            }
+
+
+class CommitGraphMaintainer:
+    """Keeps commit-graph files current for repositories the server opens.
+
+    A commit-graph stores parents, generation numbers and changed-path Bloom
+    filters, which lets git answer ancestry queries and path-limited logs
+    without inflating every commit object. Repositories are registered on
+    first use; a background thread writes an incremental (``--split``) graph
+    for each one whose refs changed since its last write, at most once per
+    ``interval`` seconds.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._repos: dict[Path, dict] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._stats = {"writes": 0, "skips": 0, "failures": 0}
+
+    def track(self, repo) -> None:
+        if self.interval <= 0 or self._stopped.is_set():
+            return
+        path = Path(repo.working_tree_dir or repo.git_dir)
+        with self._lock:
+            if path in self._repos:
+                return
+            self._repos[path] = {
+                "git_dir": Path(repo.git_dir),
+                "common_dir": Path(repo.common_dir),
+                "fingerprint": None,
+                "last_write": None,
+                "duration_s": None,
+                "error": None,
+            }
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._maintain_forever, name="commit-graph", daemon=True
+                )
+                self._thread.start()
+        self._wake.set()
+
+    def _write(self, path: Path, state: dict) -> None:
+        from git import Git
+
+        fingerprint = _git_ref_fingerprint(state["git_dir"], state["common_dir"])
+        if fingerprint == state["fingerprint"]:
+            with self._lock:
+                self._stats["skips"] += 1
+            return
+        started = time.monotonic()
+        try:
+            Git(str(path)).commit_graph(
+                "write", "--reachable", "--changed-paths", "--split", "--no-progress"
+            )
+        except Exception as e:
+            with self._lock:
+                state["error"] = str(e)
+                self._stats["failures"] += 1
+            return
+        with self._lock:
+            state.update(
+                fingerprint=fingerprint,
+                last_write=datetime.now().isoformat(),
+                duration_s=round(time.monotonic() - started, 3),
+                error=None,
+            )
+            self._stats["writes"] += 1
+
+    def _maintain_forever(self) -> None:
+        next_pass = 0.0
+        while not self._stopped.is_set():
+            self._wake.clear()
+            due = time.monotonic() >= next_pass
+            if due:
+                next_pass = time.monotonic() + self.interval
+            with self._lock:
+                tracked = list(self._repos.items())
+            for path, state in tracked:
+                if self._stopped.is_set():
+                    return
+                # Newly tracked repositories get their first graph right away;
+                # the rest wait for the next periodic pass.
+                if due or (state["last_write"] is None and state["error"] is None):
+                    self._write(path, state)
+            self._wake.wait(max(0.0, next_pass - time.monotonic()))
+
+    def close(self) -> None:
+        self._stopped.set()
+        self._wake.set()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "interval_s": self.interval,
+                "tracked_repos": len(self._repos),
+                **self._stats,
+                "repos": {
+                    str(path): {
+                        key: value
+                        for key, value in state.items()
+                        if key in ("last_write", "duration_s", "error")
+                    }
+                    for path, state in self._repos.items()
+                },
+            }
 
 
 mysql_conn = MySQLConnection()
 postgresql_conn = PostgreSQLConnection()
 mongodb_conn = MongoDBConnection()
+github_conn = GitHubConnection()
+git_repos = GitRepoCache(LOCAL_GIT_CONFIG["repo_cache_size"])
+commit_graphs = CommitGraphMaintainer(LOCAL_GIT_CONFIG["commit_graph_interval"])
+
+mysql_cursors = CursorRegistry(
+    "mysql",
+    idle_timeout=DATABASE_CONFIG["mysql"]["cursor_idle_timeout"],
+    max_open=DATABASE_CONFIG["mysql"]["max_open_cursors"],
+)
+postgresql_cursors = CursorRegistry(
+    "postgresql",
+    idle_timeout=DATABASE_CONFIG["postgresql"]["cursor_idle_timeout"],
+    max_open=DATABASE_CONFIG["postgresql"]["max_open_cursors"],
+    max_age=DATABASE_CONFIG["postgresql"]["cursor_ttl"],
+)
+
+atexit.register(mysql_conn.close)
+atexit.register(mysql_cursors.close)
+atexit.register(postgresql_conn.close)
+atexit.register(postgresql_cursors.close)
+atexit.register(mongodb_conn.close)
+atexit.register(git_repos.close)
+atexit.register(commit_graphs.close)
+
+
+def _mysql_schema_version(conn) -> tuple:
+    """Fingerprint every column, index and foreign key in the current database."""
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT (SELECT COUNT(*) FROM information_schema.COLUMNS
+                    WHERE TABLE_SCHEMA = DATABASE()) AS columns,
+                   (SELECT COALESCE(SUM(CRC32(CONCAT_WS(':', TABLE_NAME, COLUMN_NAME, COLUMN_TYPE,
+                       IS_NULLABLE, COALESCE(COLUMN_DEFAULT, ''), COLUMN_KEY, EXTRA))), 0)
+                    FROM information_schema.COLUMNS
+                    WHERE TABLE_SCHEMA = DATABASE()) AS column_checksum,
+                   (SELECT COUNT(*) FROM information_schema.STATISTICS
+                    WHERE TABLE_SCHEMA = DATABASE()) AS index_columns,
+                   (SELECT COALESCE(SUM(CRC32(CONCAT_WS(':', TABLE_NAME, INDEX_NAME,
+                       SEQ_IN_INDEX, COLUMN_NAME, NON_UNIQUE))), 0)
+                    FROM information_schema.STATISTICS
+                    WHERE TABLE_SCHEMA = DATABASE()) AS index_checksum,
+                   (SELECT COUNT(*) FROM information_schema.KEY_COLUMN_USAGE
+                    WHERE TABLE_SCHEMA = DATABASE()
+                      AND REFERENCED_TABLE_NAME IS NOT NULL) AS foreign_key_columns,
+                   (SELECT COALESCE(SUM(CRC32(CONCAT_WS(':', TABLE_NAME, CONSTRAINT_NAME,
+                       ORDINAL_POSITION, COLUMN_NAME, REFERENCED_TABLE_NAME,
+                       REFERENCED_COLUMN_NAME))), 0)
+                    FROM information_schema.KEY_COLUMN_USAGE
+                    WHERE TABLE_SCHEMA = DATABASE()
+                      AND REFERENCED_TABLE_NAME IS NOT NULL) AS foreign_key_checksum
+        """)
+        row = cursor.fetchone()
+    return tuple(int(value) for value in row.values())
+
+
+def _postgresql_schema_version(conn) -> tuple:
+    """Fingerprint the user schemas from the catalog rows DDL rewrites.
+
+    Only relations outside the system schemas are counted, and their columns
+    and constraints are reached through the catalogs' relation indexes, so a
+    revalidation does not scan the whole of pg_attribute.
+    """
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            WITH rels AS (
+                SELECT c.oid, c.xmin::text::bigint AS xid
+                FROM pg_catalog.pg_class c
+                JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname <> 'information_schema' AND n.nspname !~ '^pg_'
+            )
+            SELECT (SELECT count(*) FROM rels),
+                   (SELECT max(xid) FROM rels),
+                   (SELECT max(a.xmin::text::bigint)
+                    FROM rels JOIN pg_catalog.pg_attribute a
+                      ON a.attrelid = rels.oid AND a.attnum > 0),
+                   (SELECT count(*) FROM rels JOIN pg_catalog.pg_constraint con
+                      ON con.conrelid = rels.oid),
+                   (SELECT max(con.xmin::text::bigint)
+                    FROM rels JOIN pg_catalog.pg_constraint con ON con.conrelid = rels.oid)
+        """)
+        return tuple(cursor.fetchone())
+
+
+schema_cache = SchemaCache()
+schema_cache.register("mysql", mysql_conn.connection, _mysql_schema_version)
+schema_cache.register("postgresql", postgresql_conn.connection, _postgresql_schema_version)
+
+query_caches = {
+    backend: QueryResultCache(backend, DATABASE_CONFIG[backend]["result_cache_max_bytes"])
+    for backend in ("mysql", "postgresql")
+}
+
+_db_executors: dict[str, ThreadPoolExecutor] = {}
+_db_executors_lock = threading.Lock()
+_db_in_flight: dict[str, int] = {}
+
+
+def _db_executor(backend: str) -> ThreadPoolExecutor:
+    executor = _db_executors.get(backend)
+    if executor is not None:
+        return executor
+    with _db_executors_lock:
+        if backend not in _db_executors:
+            _db_executors[backend] = ThreadPoolExecutor(
+                max_workers=max(1, DATABASE_CONFIG[backend]["max_workers"]),
+                thread_name_prefix=f"{backend}-db",
+            )
+        return _db_executors[backend]
+
+
+async def _run_db(backend: str, func: Callable[..., Any], *args: Any) -> Any:
+    """Run blocking driver work on the backend's own bounded executor.
+
+    Each backend gets a separate executor, so a slow database only queues
+    its own calls and never blocks the event loop or the other backends.
+    """
+    loop = asyncio.get_running_loop()
+    _db_in_flight[backend] = _db_in_flight.get(backend, 0) + 1
+    try:
+        return await loop.run_in_executor(
+            _db_executor(backend), functools.partial(func, *args)
+        )
+    finally:
+        _db_in_flight[backend] -= 1
+
+
+def _db_executor_stats() -> dict:
+    return {
+        backend: {
+            "max_workers": max(1, DATABASE_CONFIG[backend]["max_workers"]),
+            "started": backend in _db_executors,
+            "in_flight": _db_in_flight.get(backend, 0),
+        }
+        for backend in ("mysql", "postgresql", "mongodb")
+    }
+
+
+def _shutdown_db_executors() -> None:
+    with _db_executors_lock:
+        executors = list(_db_executors.values())
+        _db_executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(_shutdown_db_executors)
+
+
+async def _cached_schema(
+    backend: str,
+    key: str,
+    loader: Callable[..., str],
+    *args: Any,
+    ttl: float | None = None,
+) -> str:
+    """Serve an introspection result from the schema cache, loading it if needed.
+
+    ``ttl=0`` borrows a connection and runs the loader without caching.
+    """
+    if ttl is None:
+        ttl = DATABASE_CONFIG[backend]["schema_cache_ttl"]
+    cached = schema_cache.peek(backend, key, ttl)
+    if cached is not None:
+        return cached
+    return await _run_db(
+        backend, schema_cache.load, backend, key, ttl, functools.partial(loader, *args)
+    )
+
+
+def _build_schema_dump(
+    column_rows: list[dict],
+    key_rows: list[dict],
+    row_estimates: bool,
+) -> list[dict]:
+    """Group one-row-per-column catalog results into per-table descriptions.
+
+    ``key_rows`` hold one row per index or foreign key column, in key order,
+    with ``kind`` set to ``'index'`` or ``'foreign_key'``.
+    """
+    tables: dict[str, dict] = {}
+    for row in column_rows:
+        table = tables.get(row["table_name"])
+        if table is None:
+            table = tables[row["table_name"]] = {
+                "name": row["table_name"],
+                "type": row["table_type"],
+                "columns": [],
+                "primary_key": [],
+                "foreign_keys": [],
+                "indexes": [],
+            }
+            if row_estimates:
+                estimate = row["row_estimate"]
+                table["row_estimate"] = int(estimate) if estimate is not None and estimate >= 0 else None
+        table["columns"].append({
+            "column_name": row["column_name"],
+            "data_type": row["data_type"],
+            "is_nullable": row["is_nullable"],
+            "column_default": row["column_default"],
+        })
+
+    keys: dict[tuple[str, str, str], dict] = {}
+    for row in key_rows:
+        table = tables.get(row["table_name"])
+        if table is None:
+            continue
+        key = keys.get((row["table_name"], row["kind"], row["name"]))
+        if key is None:
+            if row["kind"] == "foreign_key":
+                key = {
+                    "name": row["name"],
+                    "columns": [],
+                    "referenced_table": row["referenced_table"],
+                    "referenced_columns": [],
+                }
+                table["foreign_keys"].append(key)
+            else:
+                key = {
+                    "name": row["name"],
+                    "columns": [],
+                    "unique": bool(row["is_unique"]),
+                    "primary": bool(row["is_primary"]),
+                }
+                table["indexes"].append(key)
+            keys[(row["table_name"], row["kind"], row["name"])] = key
+        key["columns"].append(row["column_name"])
+        if row["kind"] == "foreign_key":
+            key["referenced_columns"].append(row["referenced_column"])
+        elif row["is_primary"]:
+            table["primary_key"].append(row["column_name"])
+    return list(tables.values())
+
+
+async def _cached_query(
+    backend: str,
+    runner: Callable[[str, list | None], str],
+    query: str,
+    params: list | None,
+    cache_ttl: float | None,
+) -> str:
+    """Run a non-paged SQL query through the backend's result cache.
+
+    Reads are served from the cache when ``cache_ttl`` (or the backend's
+    default TTL) is positive. Anything else bypasses the cache and, once it
+    has run, invalidates the cached results of every table it mentions.
+    """
+    cache = query_caches[backend]
+    config = DATABASE_CONFIG[backend]
+    ttl = config["result_cache_ttl"] if cache_ttl is None else cache_ttl
+    statement, read_only, tables = _scan_sql(backend, query)
+
+    if not read_only:
+        try:
+            return await _run_db(backend, runner, query, params)
+        finally:
+            cache.invalidate(tables or None)
+    if ttl <= 0:
+        return await _run_db(backend, runner, query, params)
+
+    key = (
+        config["host"], config["port"], config["database"], config.get("search_path", ""),
+        statement, json.dumps(params, default=str),
+    )
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    generation = cache.generation
+    result = await _run_db(backend, runner, query, params)
+    cache.put(key, result, ttl, tables, generation)
+    return result
 
 
 # =============================================================================
@@ -109,7 +1752,14 @@ mongodb_conn = MongoDBConnection()
 # =============================================================================
 
 
-@mcp.tool()
+def _github_timestamp(value: str | None) -> str | None:
+    """Normalize a GitHub API timestamp to the isoformat PyGithub objects produce."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).isoformat()
+
+
+@group_tool("github")
 async def github_list_issues(
     state: str = "open",
     limit: int = 10,
@@ -124,30 +1774,38 @@ async def github_list_issues(
         JSON string containing list of issues with title, number, state, and body
     """
     if not GITHUB_CONFIG["token"]:
-        return json.dumps({"error": "GITHUB_TOKEN not configured"})
+        return encode_result({"error": "GITHUB_TOKEN not configured"})
     
     try:
-        g = Github(GITHUB_CONFIG["token"])
-        repo = g.get_repo(f"{GITHUB_CONFIG['owner']}/{GITHUB_CONFIG['repo']}")
-        issues = repo.get_issues(state=state)
+        issues = []
+        page = 1
+        while len(issues) < limit:
+            batch = github_conn.get_json(
+                f"/repos/{github_conn.full_name}/issues",
+                {"state": state, "per_page": min(limit, 100), "page": page},
+            )
+            issues.extend(batch)
+            if len(batch) < min(limit, 100):
+                break
+            page += 1
         
         result = []
         for issue in issues[:limit]:
             result.append({
-                "number": issue.number,
-                "title": issue.title,
-                "state": issue.state,
-                "body": issue.body,
-                "labels": [label.name for label in issue.labels],
-                "created_at": issue.created_at.isoformat() if issue.created_at else None,
+                "number": issue["number"],
+                "title": issue["title"],
+                "state": issue["state"],
+                "body": issue["body"],
+                "labels": [label["name"] for label in issue["labels"]],
+                "created_at": _github_timestamp(issue["created_at"]),
             })
         
-        return json.dumps(result, indent=2)
+        return encode_result(result)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
-@mcp.tool()
+@group_tool("github")
 async def github_get_issue(issue_number: int) -> str:
     """Get a specific GitHub issue by number.
     
@@ -158,30 +1816,28 @@ async def github_get_issue(issue_number: int) -> str:
         JSON string containing issue details
     """
     if not GITHUB_CONFIG["token"]:
-        return json.dumps({"error": "GITHUB_TOKEN not configured"})
+        return encode_result({"error": "GITHUB_TOKEN not configured"})
     
     try:
-        g = Github(GITHUB_CONFIG["token"])
-        repo = g.get_repo(f"{GITHUB_CONFIG['owner']}/{GITHUB_CONFIG['repo']}")
-        issue = repo.get_issue(issue_number)
+        issue = github_conn.get_json(f"/repos/{github_conn.full_name}/issues/{issue_number}")
         
         result = {
-            "number": issue.number,
-            "title": issue.title,
-            "state": issue.state,
-            "body": issue.body,
-            "labels": [label.name for label in issue.labels],
-            "comments": issue.comments,
-            "created_at": issue.created_at.isoformat() if issue.created_at else None,
-            "updated_at": issue.updated_at.isoformat() if issue.updated_at else None,
+            "number": issue["number"],
+            "title": issue["title"],
+            "state": issue["state"],
+            "body": issue["body"],
+            "labels": [label["name"] for label in issue["labels"]],
+            "comments": issue["comments"],
+            "created_at": _github_timestamp(issue["created_at"]),
+            "updated_at": _github_timestamp(issue["updated_at"]),
         }
         
-        return json.dumps(result, indent=2)
+        return encode_result(result)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
-@mcp.tool()
+@group_tool("github")
 async def github_create_issue(
     title: str,
     body: str = "",
@@ -198,11 +1854,10 @@ async def github_create_issue(
         JSON string containing created issue details
     """
     if not GITHUB_CONFIG["token"]:
-        return json.dumps({"error": "GITHUB_TOKEN not configured"})
+        return encode_result({"error": "GITHUB_TOKEN not configured"})
     
     try:
-        g = Github(GITHUB_CONFIG["token"])
-        repo = g.get_repo(f"{GITHUB_CONFIG['owner']}/{GITHUB_CONFIG['repo']}")
+        repo = github_conn.get_repo()
         issue = repo.create_issue(title=title, body=body, labels=labels or [])
         
         result = {
@@ -212,12 +1867,12 @@ async def github_create_issue(
             "url": issue.html_url,
         }
         
-        return json.dumps(result, indent=2)
+        return encode_result(result)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
-@mcp.tool()
+@group_tool("github")
 async def github_list_pulls(state: str = "open") -> str:
     """List pull requests from a GitHub repository.
     
@@ -228,31 +1883,32 @@ async def github_list_pulls(state: str = "open") -> str:
         JSON string containing list of pull requests
     """
     if not GITHUB_CONFIG["token"]:
-        return json.dumps({"error": "GITHUB_TOKEN not configured"})
+        return encode_result({"error": "GITHUB_TOKEN not configured"})
     
     try:
-        g = Github(GITHUB_CONFIG["token"])
-        repo = g.get_repo(f"{GITHUB_CONFIG['owner']}/{GITHUB_CONFIG['repo']}")
-        pulls = repo.get_pulls(state=state)
+        pulls = github_conn.get_json(
+            f"/repos/{github_conn.full_name}/pulls",
+            {"state": state, "per_page": 20},
+        )
         
         result = []
         for pr in pulls[:20]:
             result.append({
-                "number": pr.number,
-                "title": pr.title,
-                "state": pr.state,
-                "body": pr.body,
-                "head_branch": pr.head.ref,
-                "base_branch": pr.base.ref,
-                "created_at": pr.created_at.isoformat() if pr.created_at else None,
+                "number": pr["number"],
+                "title": pr["title"],
+                "state": pr["state"],
+                "body": pr["body"],
+                "head_branch": pr["head"]["ref"],
+                "base_branch": pr["base"]["ref"],
+                "created_at": _github_timestamp(pr["created_at"]),
             })
         
-        return json.dumps(result, indent=2)
+        return encode_result(result)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
-@mcp.tool()
+@group_tool("github")
 async def github_get_file_content(path: str, ref: str = "main") -> str:
     """Get file content from a GitHub repository.
     
@@ -264,11 +1920,10 @@ async def github_get_file_content(path: str, ref: str = "main") -> str:
         JSON string containing file content (base64 encoded)
     """
     if not GITHUB_CONFIG["token"]:
-        return json.dumps({"error": "GITHUB_TOKEN not configured"})
+        return encode_result({"error": "GITHUB_TOKEN not configured"})
     
     try:
-        g = Github(GITHUB_CONFIG["token"])
-        repo = g.get_repo(f"{GITHUB_CONFIG['owner']}/{GITHUB_CONFIG['repo']}")
+        repo = github_conn.get_repo()
         file_content = repo.get_contents(path, ref=ref)
         
         result = {
@@ -280,9 +1935,9 @@ async def github_get_file_content(path: str, ref: str = "main") -> str:
             "sha": file_content.sha,
         }
         
-        return json.dumps(result, indent=2)
+        return encode_result(result)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
 # =============================================================================
@@ -290,41 +1945,116 @@ async def github_get_file_content(path: str, ref: str = "main") -> str:
 # =============================================================================
 
 
-@mcp.tool()
-async def mysql_execute_query(query: str, params: list | None = None) -> str:
+def _mysql_execute_query(query: str, params: list | None) -> str:
+    with mysql_conn.connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(query, params or ())
+            results = cursor.fetchall()
+
+            if not results:
+                return encode_result({"message": "No results found", "rows": []})
+
+            return encode_result({
+                "rows": results,
+                "count": len(results),
+            })
+
+
+def _mysql_execute_query_paged(
+    query: str,
+    params: list | None,
+    max_rows: int,
+    max_bytes: int,
+    continuation_token: str | None,
+) -> str:
+    key = (query, params or [])
+    if continuation_token:
+        stream = mysql_cursors.take(continuation_token, key)
+    else:
+        from pymysql.cursors import SSDictCursor
+
+        conn = mysql_conn.pool.acquire()
+        try:
+            cursor = conn.cursor(SSDictCursor)
+            cursor.execute(query, params or ())
+        except Exception:
+            mysql_conn.pool.release(conn, discard=_is_disconnect(conn))
+            raise
+        stream = CursorStream(conn, cursor, mysql_conn.pool.release, key)
+        mysql_cursors.open(stream)
+
+    try:
+        rows, exhausted = stream.read_page(max_rows, max_bytes)
+    except Exception:
+        mysql_cursors.finish(stream, discard=True)
+        raise
+
+    if exhausted:
+        mysql_cursors.finish(stream)
+        token = None
+    else:
+        token = mysql_cursors.put(stream, continuation_token)
+
+    return encode_result({
+        "rows": rows,
+        "count": len(rows),
+        "rows_sent": stream.rows_sent,
+        "has_more": not exhausted,
+        "continuation_token": token,
+    })
+
+
+@group_tool("mysql")
+async def mysql_execute_query(
+    query: str,
+    params: list | None = None,
+    paged: bool = False,
+    max_rows: int = 1000,
+    max_bytes: int = 1_000_000,
+    continuation_token: str | None = None,
+    cache_ttl: float | None = None,
+) -> str:
     """Execute a read-only SQL query on MySQL database.
     
     Args:
         query: SQL SELECT query to execute (read-only for safety)
         params: Optional list of query parameters
+        paged: Stream results through a server-side cursor, one page per call
+        max_rows: Maximum rows per page in paged mode (default 1000)
+        max_bytes: Approximate maximum encoded size of a page (default 1 MB)
+        continuation_token: Token from a previous page; resumes that cursor
+            instead of running the query again (pass the same query and params)
+        cache_ttl: Seconds to serve this result from the query cache
+            (default MYSQL_RESULT_CACHE_TTL; 0 bypasses the cache)
     
     Returns:
-        JSON string containing query results
+        JSON string containing query results. Paged results include
+        has_more and a continuation_token for the next page.
     """
     if not DATABASE_CONFIG["mysql"]["database"]:
-        return json.dumps({"error": "MySQL not configured"})
+        return encode_result({"error": "MySQL not configured"})
     
     try:
-        conn = mysql_conn.get_connection()
-        try:
-            with conn.cursor() as cursor:
-                cursor.execute(query, params or ())
-                results = cursor.fetchall()
-                
-                if not results:
-                    return json.dumps({"message": "No results found", "rows": []})
-                
-                return json.dumps({
-                    "rows": results,
-                    "count": len(results),
-                }, indent=2, default=str)
-        finally:
-            conn.close()
+        if paged or continuation_token:
+            return await _run_db(
+                "mysql", _mysql_execute_query_paged,
+                query, params, max_rows, max_bytes, continuation_token,
+            )
+        return await _cached_query("mysql", _mysql_execute_query, query, params, cache_ttl)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
-@mcp.tool()
+def _mysql_list_tables(conn) -> str:
+    with conn.cursor() as cursor:
+        cursor.execute("SHOW TABLES")
+        tables = cursor.fetchall()
+
+        table_names = [list(row.values())[0] for row in tables]
+        return encode_result({"tables": table_names})
+
+
+@group_tool("mysql")
 async def mysql_list_tables() -> str:
     """List all tables in the MySQL database.
     
@@ -332,24 +2062,26 @@ async def mysql_list_tables() -> str:
         JSON string containing list of table names
     """
     if not DATABASE_CONFIG["mysql"]["database"]:
-        return json.dumps({"error": "MySQL not configured"})
+        return encode_result({"error": "MySQL not configured"})
     
     try:
-        conn = mysql_conn.get_connection()
-        try:
-            with conn.cursor() as cursor:
-                cursor.execute("SHOW TABLES")
-                tables = cursor.fetchall()
-                
-                table_names = [list(row.values())[0] for row in tables]
-                return json.dumps({"tables": table_names}, indent=2)
-        finally:
-            conn.close()
+        return await _cached_schema("mysql", "tables", _mysql_list_tables)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
+
 
+def _mysql_describe_table(table_name: str, conn) -> str:
+    with conn.cursor() as cursor:
+        cursor.execute(f"DESCRIBE `{table_name}`")
+        columns = cursor.fetchall()
 
-@mcp.tool()
+        return encode_result({
+            "table": table_name,
+            "columns": columns,
+        })
+
+
+@group_tool("mysql")
 async def mysql_describe_table(table_name: str) -> str:
     """Get table schema/structure from MySQL.
     
@@ -360,23 +2092,80 @@ async def mysql_describe_table(table_name: str) -> str:
         JSON string containing table schema
     """
     if not DATABASE_CONFIG["mysql"]["database"]:
-        return json.dumps({"error": "MySQL not configured"})
+        return encode_result({"error": "MySQL not configured"})
     
     try:
-        conn = mysql_conn.get_connection()
-        try:
-            with conn.cursor() as cursor:
-                cursor.execute(f"DESCRIBE `{table_name}`")
-                columns = cursor.fetchall()
-                
-                return json.dumps({
-                    "table": table_name,
-                    "columns": columns,
-                }, indent=2, default=str)
-        finally:
-            conn.close()
+        return await _cached_schema(
+            "mysql", f"describe:{table_name}", _mysql_describe_table, table_name
+        )
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
+
+
+def _mysql_dump_schema(table_filter: str, row_estimates: bool, conn) -> str:
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT c.TABLE_NAME AS table_name, t.TABLE_TYPE AS table_type,
+                   t.TABLE_ROWS AS row_estimate, c.COLUMN_NAME AS column_name,
+                   c.COLUMN_TYPE AS data_type, c.IS_NULLABLE AS is_nullable,
+                   c.COLUMN_DEFAULT AS column_default
+            FROM information_schema.COLUMNS c
+            JOIN information_schema.TABLES t
+              ON t.TABLE_SCHEMA = c.TABLE_SCHEMA AND t.TABLE_NAME = c.TABLE_NAME
+            WHERE c.TABLE_SCHEMA = DATABASE() AND c.TABLE_NAME LIKE %s
+            ORDER BY c.TABLE_NAME, c.ORDINAL_POSITION
+        """, (table_filter,))
+        column_rows = cursor.fetchall()
+
+        cursor.execute("""
+            SELECT 'index' AS kind, s.TABLE_NAME AS table_name, s.INDEX_NAME AS name,
+                   s.COLUMN_NAME AS column_name, s.SEQ_IN_INDEX AS position,
+                   s.NON_UNIQUE = 0 AS is_unique, s.INDEX_NAME = 'PRIMARY' AS is_primary,
+                   NULL AS referenced_table, NULL AS referenced_column
+            FROM information_schema.STATISTICS s
+            WHERE s.TABLE_SCHEMA = DATABASE() AND s.TABLE_NAME LIKE %s
+            UNION ALL
+            SELECT 'foreign_key', k.TABLE_NAME, k.CONSTRAINT_NAME, k.COLUMN_NAME,
+                   k.ORDINAL_POSITION, 0, 0, k.REFERENCED_TABLE_NAME, k.REFERENCED_COLUMN_NAME
+            FROM information_schema.KEY_COLUMN_USAGE k
+            WHERE k.TABLE_SCHEMA = DATABASE() AND k.TABLE_NAME LIKE %s
+              AND k.REFERENCED_TABLE_NAME IS NOT NULL
+            ORDER BY table_name, kind, name, position
+        """, (table_filter, table_filter))
+        key_rows = cursor.fetchall()
+
+        tables = _build_schema_dump(column_rows, key_rows, row_estimates)
+        return encode_result({
+            "database": DATABASE_CONFIG["mysql"]["database"],
+            "tables": tables,
+            "count": len(tables),
+        })
+
+
+@group_tool("mysql")
+async def mysql_dump_schema(table_filter: str | None = None, row_estimates: bool = False) -> str:
+    """Describe every table in the MySQL database in one call.
+
+    Args:
+        table_filter: Optional SQL LIKE pattern on table names (e.g. 'order%')
+        row_estimates: Include approximate row counts from table statistics
+            (information_schema.TABLES.TABLE_ROWS) instead of COUNT(*)
+
+    Returns:
+        JSON string containing columns, primary key, foreign keys and
+        indexes for each table
+    """
+    if not DATABASE_CONFIG["mysql"]["database"]:
+        return encode_result({"error": "MySQL not configured"})
+
+    table_filter = table_filter or "%"
+    try:
+        return await _cached_schema(
+            "mysql", f"dump:{table_filter}", _mysql_dump_schema, table_filter, row_estimates,
+            ttl=0 if row_estimates else None,
+        )
+    except Exception as e:
+        return encode_result({"error": str(e)})
 
 
 # =============================================================================
@@ -384,41 +2173,132 @@ async def mysql_describe_table(table_name: str) -> str:
 # =============================================================================
 
 
-@mcp.tool()
-async def postgresql_execute_query(query: str, params: list | None = None) -> str:
+def _postgresql_execute_query(query: str, params: list | None) -> str:
+    from psycopg2.extras import RealDictCursor
+
+    with postgresql_conn.connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            cursor.execute(query, params or ())
+            results = cursor.fetchall()
+
+            if not results:
+                return encode_result({"message": "No results found", "rows": []})
+
+            return encode_result({
+                "rows": results,
+                "count": len(results),
+            })
+
+
+def _postgresql_execute_query_paged(
+    query: str,
+    params: list | None,
+    max_rows: int,
+    max_bytes: int,
+    itersize: int | None,
+    continuation_token: str | None,
+) -> str:
+    key = (query, params or [])
+    if continuation_token:
+        stream = postgresql_cursors.take(continuation_token, key)
+    else:
+        from psycopg2.extras import RealDictCursor
+
+        conn = postgresql_conn.pool.acquire()
+        try:
+            cursor = conn.cursor(
+                name=f"mcp_{secrets.token_hex(8)}",
+                cursor_factory=RealDictCursor,
+            )
+            cursor.itersize = itersize or DATABASE_CONFIG["postgresql"]["cursor_itersize"]
+            cursor.execute(query, params or ())
+        except Exception:
+            postgresql_conn.pool.release(conn, discard=_is_disconnect(conn))
+            raise
+        stream = CursorStream(conn, cursor, postgresql_conn.pool.release, key)
+        postgresql_cursors.open(stream)
+
+    try:
+        rows, exhausted = stream.read_page(max_rows, max_bytes)
+    except Exception:
+        postgresql_cursors.finish(stream, discard=True)
+        raise
+
+    if exhausted:
+        postgresql_cursors.finish(stream)
+        token = None
+    else:
+        token = postgresql_cursors.put(stream, continuation_token)
+
+    return encode_result({
+        "rows": rows,
+        "count": len(rows),
+        "rows_sent": stream.rows_sent,
+        "has_more": not exhausted,
+        "continuation_token": token,
+    })
+
+
+@group_tool("postgresql")
+async def postgresql_execute_query(
+    query: str,
+    params: list | None = None,
+    paged: bool = False,
+    max_rows: int = 1000,
+    max_bytes: int = 1_000_000,
+    itersize: int | None = None,
+    continuation_token: str | None = None,
+    cache_ttl: float | None = None,
+) -> str:
     """Execute a read-only SQL query on PostgreSQL database.
     
     Args:
         query: SQL SELECT query to execute
         params: Optional list of query parameters
+        paged: Stream results through a named server-side cursor, one page per call
+        max_rows: Maximum rows per page in paged mode (default 1000)
+        max_bytes: Approximate maximum encoded size of a page (default 1 MB)
+        itersize: Rows fetched from the server per round trip in paged mode
+        continuation_token: Token from a previous page; resumes that cursor and
+            its transaction instead of running the query again (pass the same
+            query and params)
+        cache_ttl: Seconds to serve this result from the query cache
+            (default POSTGRES_RESULT_CACHE_TTL; 0 bypasses the cache)
     
     Returns:
-        JSON string containing query results
+        JSON string containing query results. Paged results include
+        has_more and a continuation_token for the next page.
     """
     if not DATABASE_CONFIG["postgresql"]["database"]:
-        return json.dumps({"error": "PostgreSQL not configured"})
+        return encode_result({"error": "PostgreSQL not configured"})
     
     try:
-        conn = postgresql_conn.get_connection()
-        try:
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
-                cursor.execute(query, params or ())
-                results = cursor.fetchall()
-                
-                if not results:
-                    return json.dumps({"message": "No results found", "rows": []})
-                
-                return json.dumps({
-                    "rows": [dict(row) for row in results],
-                    "count": len(results),
-                }, indent=2, default=str)
-        finally:
-            conn.close()
+        if paged or continuation_token:
+            return await _run_db(
+                "postgresql", _postgresql_execute_query_paged,
+                query, params, max_rows, max_bytes, itersize, continuation_token,
+            )
+        return await _cached_query(
+            "postgresql", _postgresql_execute_query, query, params, cache_ttl
+        )
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
-@mcp.tool()
+def _postgresql_list_tables(conn) -> str:
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT table_name
+            FROM information_schema.tables
+            WHERE table_schema = 'public'
+        """)
+        tables = cursor.fetchall()
+
+        table_names = [row[0] for row in tables]
+        return encode_result({"tables": table_names})
+
+
+@group_tool("postgresql")
 async def postgresql_list_tables() -> str:
     """List all tables in the PostgreSQL database.
     
@@ -426,28 +2306,33 @@ async def postgresql_list_tables() -> str:
         JSON string containing list of table names
     """
     if not DATABASE_CONFIG["postgresql"]["database"]:
-        return json.dumps({"error": "PostgreSQL not configured"})
+        return encode_result({"error": "PostgreSQL not configured"})
     
     try:
-        conn = postgresql_conn.get_connection()
-        try:
-            with conn.cursor() as cursor:
-                cursor.execute("""
-                    SELECT table_name 
-                    FROM information_schema.tables 
-                    WHERE table_schema = 'public'
-                """)
-                tables = cursor.fetchall()
-                
-                table_names = [row[0] for row in tables]
-                return json.dumps({"tables": table_names}, indent=2)
-        finally:
-            conn.close()
+        return await _cached_schema("postgresql", "tables", _postgresql_list_tables)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
+
 
+def _postgresql_describe_table(table_name: str, conn) -> str:
+    from psycopg2.extras import RealDictCursor
 
-@mcp.tool()
+    with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+        cursor.execute("""
+            SELECT column_name, data_type, is_nullable, column_default
+            FROM information_schema.columns
+            WHERE table_name = %s
+            ORDER BY ordinal_position
+        """, (table_name,))
+        columns = cursor.fetchall()
+
+        return encode_result({
+            "table": table_name,
+            "columns": [dict(col) for col in columns],
+        })
+
+
+@group_tool("postgresql")
 async def postgresql_describe_table(table_name: str) -> str:
     """Get table schema/structure from PostgreSQL.
     
@@ -458,28 +2343,176 @@ async def postgresql_describe_table(table_name: str) -> str:
         JSON string containing table schema
     """
     if not DATABASE_CONFIG["postgresql"]["database"]:
-        return json.dumps({"error": "PostgreSQL not configured"})
+        return encode_result({"error": "PostgreSQL not configured"})
     
     try:
-        conn = postgresql_conn.get_connection()
-        try:
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
-                cursor.execute(f"""
-                    SELECT column_name, data_type, is_nullable, column_default
-                    FROM information_schema.columns
-                    WHERE table_name = %s
-                    ORDER BY ordinal_position
-                """, (table_name,))
-                columns = cursor.fetchall()
-                
-                return json.dumps({
-                    "table": table_name,
-                    "columns": [dict(col) for col in columns],
-                }, indent=2, default=str)
-        finally:
-            conn.close()
+        return await _cached_schema(
+            "postgresql", f"describe:{table_name}", _postgresql_describe_table, table_name
+        )
+    except Exception as e:
+        return encode_result({"error": str(e)})
+
+
+def _postgresql_dump_schema(schema: str, table_filter: str, row_estimates: bool, conn) -> str:
+    from psycopg2.extras import RealDictCursor
+
+    params = {"schema": schema, "pattern": table_filter}
+    with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+        cursor.execute("""
+            SELECT c.relname AS table_name,
+                   CASE c.relkind
+                       WHEN 'r' THEN 'BASE TABLE'
+                       WHEN 'p' THEN 'PARTITIONED TABLE'
+                       WHEN 'v' THEN 'VIEW'
+                       WHEN 'm' THEN 'MATERIALIZED VIEW'
+                       ELSE 'FOREIGN TABLE'
+                   END AS table_type,
+                   c.reltuples::bigint AS row_estimate,
+                   a.attname AS column_name,
+                   pg_catalog.format_type(a.atttypid, a.atttypmod) AS data_type,
+                   CASE WHEN a.attnotnull THEN 'NO' ELSE 'YES' END AS is_nullable,
+                   pg_catalog.pg_get_expr(d.adbin, d.adrelid) AS column_default
+            FROM pg_catalog.pg_class c
+            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            JOIN pg_catalog.pg_attribute a
+              ON a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+            LEFT JOIN pg_catalog.pg_attrdef d ON d.adrelid = c.oid AND d.adnum = a.attnum
+            WHERE n.nspname = %(schema)s AND c.relname LIKE %(pattern)s
+              AND c.relkind IN ('r', 'p', 'v', 'm', 'f')
+            ORDER BY c.relname, a.attnum
+        """, params)
+        column_rows = cursor.fetchall()
+
+        cursor.execute("""
+            SELECT 'index' AS kind, c.relname AS table_name, i.relname AS name,
+                   a.attname AS column_name, k.ord AS position,
+                   ix.indisunique AS is_unique, ix.indisprimary AS is_primary,
+                   NULL::name AS referenced_table, NULL::name AS referenced_column
+            FROM pg_catalog.pg_index ix
+            JOIN pg_catalog.pg_class c ON c.oid = ix.indrelid
+            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            JOIN pg_catalog.pg_class i ON i.oid = ix.indexrelid
+            CROSS JOIN LATERAL unnest(ix.indkey::int2[]) WITH ORDINALITY AS k(attnum, ord)
+            LEFT JOIN pg_catalog.pg_attribute a ON a.attrelid = c.oid AND a.attnum = k.attnum
+            WHERE n.nspname = %(schema)s AND c.relname LIKE %(pattern)s
+            UNION ALL
+            SELECT 'foreign_key', c.relname, con.conname, a.attname, k.ord,
+                   false, false, r.relname, ra.attname
+            FROM pg_catalog.pg_constraint con
+            JOIN pg_catalog.pg_class c ON c.oid = con.conrelid
+            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            JOIN pg_catalog.pg_class r ON r.oid = con.confrelid
+            CROSS JOIN LATERAL unnest(con.conkey, con.confkey)
+                WITH ORDINALITY AS k(attnum, ref_attnum, ord)
+            JOIN pg_catalog.pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+            JOIN pg_catalog.pg_attribute ra
+              ON ra.attrelid = con.confrelid AND ra.attnum = k.ref_attnum
+            WHERE con.contype = 'f' AND n.nspname = %(schema)s AND c.relname LIKE %(pattern)s
+            ORDER BY table_name, kind, name, position
+        """, params)
+        key_rows = cursor.fetchall()
+
+        tables = _build_schema_dump(column_rows, key_rows, row_estimates)
+        return encode_result({
+            "schema": schema,
+            "tables": tables,
+            "count": len(tables),
+        })
+
+
+@group_tool("postgresql")
+async def postgresql_dump_schema(
+    schema: str = "public",
+    table_filter: str | None = None,
+    row_estimates: bool = False,
+) -> str:
+    """Describe every table in a PostgreSQL schema in one call.
+
+    Args:
+        schema: Schema to describe (default 'public')
+        table_filter: Optional SQL LIKE pattern on table names (e.g. 'order%')
+        row_estimates: Include approximate row counts from planner statistics
+            (pg_class.reltuples) instead of COUNT(*); null if never analyzed
+
+    Returns:
+        JSON string containing columns, primary key, foreign keys and
+        indexes for each table, view and materialized view
+    """
+    if not DATABASE_CONFIG["postgresql"]["database"]:
+        return encode_result({"error": "PostgreSQL not configured"})
+
+    table_filter = table_filter or "%"
+    try:
+        return await _cached_schema(
+            "postgresql", f"dump:{schema}:{table_filter}", _postgresql_dump_schema,
+            schema, table_filter, row_estimates,
+            ttl=0 if row_estimates else None,
+        )
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
+
+
+# =============================================================================
+# DATABASE CACHE TOOLS
+# =============================================================================
+
+
+@group_tool("mysql", "postgresql")
+async def database_invalidate_schema_cache(
+    backend: str | None = None,
+    table_name: str | None = None,
+) -> str:
+    """Drop cached table lists, table descriptions and schema dumps.
+
+    Args:
+        backend: 'mysql' or 'postgresql' (default: both)
+        table_name: Table that changed; reported back only, since table
+            lists and schema dumps may include it, every entry is dropped
+
+    Returns:
+        JSON string containing the number of invalidated entries
+    """
+    if backend is not None and backend not in ("mysql", "postgresql"):
+        return encode_result({"error": f"Unknown backend: {backend}"})
+
+    invalidated = schema_cache.invalidate(backend)
+
+    return encode_result({
+        "backend": backend or "all",
+        "table": table_name,
+        "invalidated": invalidated,
+    })
+
+
+@group_tool("mysql", "postgresql")
+async def database_invalidate_query_cache(
+    backend: str | None = None,
+    table_name: str | None = None,
+) -> str:
+    """Drop cached query results.
+
+    Args:
+        backend: 'mysql' or 'postgresql' (default: both)
+        table_name: Only drop results of queries that read this table
+
+    Returns:
+        JSON string containing the number of invalidated entries
+    """
+    if backend is not None and backend not in query_caches:
+        return encode_result({"error": f"Unknown backend: {backend}"})
+
+    tables = frozenset([table_name.rsplit(".", 1)[-1].strip('"`').lower()]) if table_name else None
+    invalidated = sum(
+        cache.invalidate(tables)
+        for name, cache in query_caches.items()
+        if backend in (None, name)
+    )
+
+    return encode_result({
+        "backend": backend or "all",
+        "table": table_name,
+        "invalidated": invalidated,
+    })
 
 
 # =============================================================================
@@ -487,7 +2520,15 @@ async def postgresql_describe_table(table_name: str) -> str:
 # =============================================================================
 
 
-@mcp.tool()
+def _mongodb_list_collections() -> str:
+    client = mongodb_conn.get_client()
+    db = client[DATABASE_CONFIG["mongodb"]["database"]]
+    collections = db.list_collection_names()
+
+    return encode_result({"collections": collections})
+
+
+@group_tool("mongodb")
 async def mongodb_list_collections() -> str:
     """List all collections in the MongoDB database.
     
@@ -495,25 +2536,149 @@ async def mongodb_list_collections() -> str:
         JSON string containing list of collection names
     """
     if not DATABASE_CONFIG["mongodb"]["database"]:
-        return json.dumps({"error": "MongoDB not configured"})
+        return encode_result({"error": "MongoDB not configured"})
     
     try:
-        client = mongodb_conn.get_client()
-        db = client[DATABASE_CONFIG["mongodb"]["database"]]
-        collections = db.list_collection_names()
-        
-        return json.dumps({"collections": collections}, indent=2)
+        return await _run_db("mongodb", _mongodb_list_collections)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
+
+
+def _parse_mongo_sort(
+    sort: str | None,
+    sort_field: str | None,
+    sort_order: int,
+) -> list[tuple[str, int]]:
+    if sort:
+        spec = json.loads(sort)
+        items = spec.items() if isinstance(spec, dict) else spec
+        return [(str(field), int(direction)) for field, direction in items]
+    if sort_field:
+        return [(sort_field, sort_order)]
+    return []
+
+
+def _mongo_field_value(doc: dict, path: str) -> Any:
+    value: Any = doc
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _mongo_keyset_filter(sort_spec: list[tuple[str, int]], after: list) -> dict:
+    """Match documents strictly after ``after`` in ``sort_spec`` order."""
+    clauses = []
+    for i, (field, direction) in enumerate(sort_spec):
+        clause = {prev: after[j] for j, (prev, _) in enumerate(sort_spec[:i])}
+        clause[field] = {"$gt" if direction > 0 else "$lt": after[i]}
+        clauses.append(clause)
+    return {"$or": clauses}
+
+
+def _encode_mongo_token(sort_spec: list[tuple[str, int]], doc: dict) -> str:
+    from bson import json_util
+
+    payload = {
+        "sort": [[field, direction] for field, direction in sort_spec],
+        "after": [_mongo_field_value(doc, field) for field, _ in sort_spec],
+    }
+    return base64.urlsafe_b64encode(json_util.dumps(payload).encode()).decode()
+
+
+def _decode_mongo_token(token: str, sort_spec: list[tuple[str, int]]) -> list:
+    from bson import json_util
+
+    payload = json_util.loads(base64.urlsafe_b64decode(token.encode()))
+    if [tuple(item) for item in payload["sort"]] != sort_spec:
+        raise ValueError("continuation_token does not match the requested sort")
+    return payload["after"]
 
 
-@mcp.tool()
+def _mongodb_find(
+    collection: str,
+    filter: str,
+    limit: int,
+    sort_field: str | None,
+    sort_order: int,
+    projection: str | None = None,
+    sort: str | None = None,
+    batch_size: int | None = None,
+    max_time_ms: int | None = None,
+    hint: str | None = None,
+    paginate: bool = False,
+    continuation_token: str | None = None,
+) -> str:
+    client = mongodb_conn.get_client()
+    db = client[DATABASE_CONFIG["mongodb"]["database"]]
+    coll = db[collection]
+
+    query_filter = json.loads(filter)
+    sort_spec = _parse_mongo_sort(sort, sort_field, sort_order)
+    fields = json.loads(projection) if projection else None
+    paginate = paginate or bool(continuation_token)
+
+    if paginate:
+        # Keyset paging needs a total order, so _id breaks ties.
+        if not any(field == "_id" for field, _ in sort_spec):
+            sort_spec.append(("_id", sort_spec[-1][1] if sort_spec else 1))
+        if fields:
+            inclusive = any(v not in (0, False) for k, v in fields.items() if k != "_id")
+            for field, _ in sort_spec:
+                if inclusive:
+                    fields[field] = 1
+                else:
+                    fields.pop(field, None)
+        if continuation_token:
+            after = _decode_mongo_token(continuation_token, sort_spec)
+            query_filter = {"$and": [query_filter, _mongo_keyset_filter(sort_spec, after)]}
+
+    cursor = coll.find(query_filter, fields or None)
+    if sort_spec:
+        cursor = cursor.sort(sort_spec)
+    if hint:
+        cursor = cursor.hint(_parse_mongo_sort(hint, None, 1) if hint[:1] in "{[" else hint)
+    if batch_size:
+        cursor = cursor.batch_size(batch_size)
+    if max_time_ms:
+        cursor = cursor.max_time_ms(max_time_ms)
+    cursor = cursor.limit(limit + 1 if paginate else limit)
+
+    results = list(cursor)
+
+    if not paginate:
+        return encode_result({
+            "count": len(results),
+            "documents": results,
+        })
+
+    has_more = len(results) > limit
+    results = results[:limit]
+    return encode_result({
+        "count": len(results),
+        "documents": results,
+        "has_more": has_more,
+        "continuation_token": (
+            _encode_mongo_token(sort_spec, results[-1]) if has_more and results else None
+        ),
+    })
+
+
+@group_tool("mongodb")
 async def mongodb_find(
     collection: str,
     filter: str = "{}",
     limit: int = 10,
     sort_field: str | None = None,
     sort_order: int = -1,
+    projection: str | None = None,
+    sort: str | None = None,
+    batch_size: int | None = None,
+    max_time_ms: int | None = None,
+    hint: str | None = None,
+    paginate: bool = False,
+    continuation_token: str | None = None,
 ) -> str:
     """Find documents in a MongoDB collection.
     
@@ -523,39 +2688,50 @@ async def mongodb_find(
         limit: Maximum number of documents to return (default 10)
         sort_field: Field to sort by (optional)
         sort_order: Sort order: 1 for ascending, -1 for descending
+        projection: JSON projection, e.g. '{"name": 1, "email": 1}'
+        sort: JSON compound sort, e.g. '{"created": -1, "name": 1}'; overrides sort_field
+        batch_size: Documents per server round trip
+        max_time_ms: Server-side time limit for the query in milliseconds
+        hint: Index name, or JSON index spec, to force
+        paginate: Return a continuation_token based on the last sort key
+        continuation_token: Token from a previous page with the same filter and sort
     
     Returns:
-        JSON string containing matching documents
+        JSON string containing matching documents. Paginated results include
+        has_more and a continuation_token for the next page.
     """
     if not DATABASE_CONFIG["mongodb"]["database"]:
-        return json.dumps({"error": "MongoDB not configured"})
+        return encode_result({"error": "MongoDB not configured"})
     
     try:
-        client = mongodb_conn.get_client()
-        db = client[DATABASE_CONFIG["mongodb"]["database"]]
-        coll = db[collection]
-        
-        query_filter = json.loads(filter)
-        
-        cursor = coll.find(query_filter).limit(limit)
-        
-        if sort_field:
-            cursor = cursor.sort(sort_field, sort_order)
-        
-        results = list(cursor)
-        
-        for doc in results:
-            doc["_id"] = str(doc["_id"])
-        
-        return json.dumps({
-            "count": len(results),
-            "documents": results,
-        }, indent=2, default=str)
+        return await _run_db(
+            "mongodb", _mongodb_find, collection, filter, limit, sort_field, sort_order,
+            projection, sort, batch_size, max_time_ms, hint, paginate, continuation_token,
+        )
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
+
+
+def _mongodb_aggregate(collection: str, pipeline: str) -> str:
+    client = mongodb_conn.get_client()
+    db = client[DATABASE_CONFIG["mongodb"]["database"]]
+    coll = db[collection]
+
+    pipeline_stages = json.loads(pipeline)
+
+    results = list(coll.aggregate(pipeline_stages))
+
+    for doc in results:
+        if "_id" in doc:
+            doc["_id"] = str(doc["_id"])
 
+    return encode_result({
+        "count": len(results),
+        "results": results,
+    })
 
-@mcp.tool()
+
+@group_tool("mongodb")
 async def mongodb_aggregate(collection: str, pipeline: str) -> str:
     """Run an aggregation pipeline on a MongoDB collection.
     
@@ -567,30 +2743,26 @@ async def mongodb_aggregate(collection: str, pipeline: str) -> str:
         JSON string containing aggregated results
     """
     if not DATABASE_CONFIG["mongodb"]["database"]:
-        return json.dumps({"error": "MongoDB not configured"})
+        return encode_result({"error": "MongoDB not configured"})
     
     try:
-        client = mongodb_conn.get_client()
-        db = client[DATABASE_CONFIG["mongodb"]["database"]]
-        coll = db[collection]
-        
-        pipeline_stages = json.loads(pipeline)
-        
-        results = list(coll.aggregate(pipeline_stages))
-        
-        for doc in results:
-            if "_id" in doc:
-                doc["_id"] = str(doc["_id"])
-        
-        return json.dumps({
-            "count": len(results),
-            "results": results,
-        }, indent=2, default=str)
+        return await _run_db("mongodb", _mongodb_aggregate, collection, pipeline)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
+
+
+def _mongodb_count(collection: str, filter: str) -> str:
+    client = mongodb_conn.get_client()
+    db = client[DATABASE_CONFIG["mongodb"]["database"]]
+    coll = db[collection]
 
+    query_filter = json.loads(filter)
+    count = coll.count_documents(query_filter)
 
-@mcp.tool()
+    return encode_result({"collection": collection, "count": count})
+
+
+@group_tool("mongodb")
 async def mongodb_count(collection: str, filter: str = "{}") -> str:
     """Count documents in a MongoDB collection.
     
@@ -602,19 +2774,12 @@ async def mongodb_count(collection: str, filter: str = "{}") -> str:
         JSON string containing count
     """
     if not DATABASE_CONFIG["mongodb"]["database"]:
-        return json.dumps({"error": "MongoDB not configured"})
+        return encode_result({"error": "MongoDB not configured"})
     
     try:
-        client = mongodb_conn.get_client()
-        db = client[DATABASE_CONFIG["mongodb"]["database"]]
-        coll = db[collection]
-        
-        query_filter = json.loads(filter)
-        count = coll.count_documents(query_filter)
-        
-        return json.dumps({"collection": collection, "count": count}, indent=2)
+        return await _run_db("mongodb", _mongodb_count, collection, filter)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
 # =============================================================================
@@ -622,110 +2787,824 @@ async def mongodb_count(collection: str, filter: str = "{}") -> str:
 # =============================================================================
 
 
-@mcp.tool()
-async def filesystem_read_file(path: str) -> str:
-    """Read contents of a file.
+def _decode_window(window: bytes, encoding: str, at_eof: bool) -> tuple[str, str, int]:
+    """Decode a byte window as UTF-8 text, falling back to base64.
+
+    Returns ``(content, encoding, consumed)``. A multi-byte character cut off
+    by the end of the window is left for the next read rather than mangled.
+    """
+    if encoding == "base64" or (encoding == "auto" and b"\x00" in window[:8192]):
+        return base64.b64encode(window).decode("ascii"), "base64", len(window)
+    try:
+        return window.decode("utf-8"), "utf-8", len(window)
+    except UnicodeDecodeError as e:
+        if not at_eof and e.reason == "unexpected end of data" and e.start > 0:
+            return window[:e.start].decode("utf-8", errors="replace"), "utf-8", e.start
+        if encoding == "text":
+            return window.decode("utf-8", errors="replace"), "utf-8", len(window)
+        return base64.b64encode(window).decode("ascii"), "base64", len(window)
+
+
+def _line_window(buf, first: int, last: int | None, length: int) -> tuple[int, int, int]:
+    """Locate lines ``first``..``last`` (1-based) within ``length`` bytes.
+
+    Returns ``(start, end, last_line)``. If not even the first line fits,
+    the window is cut at ``length`` bytes and ``last_line`` is ``first - 1``.
+    """
+    start = 0
+    for _ in range(first - 1):
+        newline = buf.find(b"\n", start)
+        if newline < 0:
+            return len(buf), len(buf), first - 1
+        start = newline + 1
+
+    end, line = start, first - 1
+    while end < len(buf) and (last is None or line < last):
+        newline = buf.find(b"\n", end)
+        stop = len(buf) if newline < 0 else newline + 1
+        if stop - start > length:
+            if line < first:
+                end = start + length
+            break
+        end, line = stop, line + 1
+    return start, end, line
+
+
+def _read_file_window(
+    file_path: Path,
+    offset: int,
+    length: int | None,
+    start_line: int | None,
+    end_line: int | None,
+    encoding: str,
+) -> dict:
+    limit = FILESYSTEM_CONFIG["max_read_bytes"]
+    length = limit if length is None else max(0, min(length, limit))
+    stat = file_path.stat()
+
+    with open(file_path, "rb") as f:
+        # Large files are mapped so only the pages of the requested window are
+        # read; small ones are cheaper to read in one call.
+        if stat.st_size >= FILESYSTEM_CONFIG["mmap_threshold"]:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            buf = f.read()
+        try:
+            size = len(buf)
+            if start_line is not None or end_line is not None:
+                first = max(1, start_line or 1)
+                start, end, last = _line_window(buf, first, end_line, length)
+            else:
+                start = min(max(0, offset), size)
+                end = min(start + length, size)
+            content, used_encoding, consumed = _decode_window(
+                buf[start:end], encoding, at_eof=end >= size
+            )
+        finally:
+            if isinstance(buf, mmap.mmap):
+                buf.close()
+
+    end = start + consumed
+    result = {
+        "path": str(file_path),
+        "content": content,
+        "encoding": used_encoding,
+        "offset": start,
+        "length": consumed,
+        "next_offset": end if end < size else None,
+        "eof": end >= size,
+    }
+    if start_line is not None or end_line is not None:
+        # A first line longer than the window comes back partial; the rest of
+        # it is read by byte offset, since repeating next_line would not move.
+        line_truncated = last < first and end < size
+        more_lines = end < size and (end_line is None or last < end_line)
+        result.update({
+            "start_line": first,
+            "end_line": last,
+            "next_line": last + 1 if more_lines and not line_truncated else None,
+            "line_truncated": line_truncated,
+        })
+    result.update({
+        "size": size,
+        "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+        "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
+    })
+    return result
+
+
+@group_tool("filesystem")
+async def filesystem_read_file(
+    path: str,
+    offset: int = 0,
+    length: int | None = None,
+    start_line: int | None = None,
+    end_line: int | None = None,
+    encoding: str = "auto",
+) -> str:
+    """Read contents of a file, or a window of it.
     
     Args:
         path: Absolute path to the file
+        offset: Byte offset to start reading at (default 0)
+        length: Maximum bytes to return (default and cap FILESYSTEM_MAX_READ_BYTES)
+        start_line: First line to return (1-based); selects line mode
+        end_line: Last line to return (inclusive) in line mode
+        encoding: 'auto' (UTF-8 text, base64 for binary data), 'text' or 'base64'
     
     Returns:
-        JSON string containing file content and metadata
+        JSON string containing file content and metadata. next_offset (and
+        next_line in line mode) is set when more of the file remains. If the
+        first requested line does not fit, line_truncated is set and the
+        partial line is returned; continue from next_offset.
     """
+    if encoding not in ("auto", "text", "base64"):
+        return encode_result({"error": f"Unknown encoding: {encoding}"})
+
     try:
         file_path = Path(path).resolve()
         
         if not file_path.exists():
-            return json.dumps({"error": f"File not found: {path}"})
+            return encode_result({"error": f"File not found: {path}"})
         
         if not file_path.is_file():
-            return json.dumps({"error": f"Not a file: {path}"})
-        
-        async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
-            content = await f.read()
+            return encode_result({"error": f"Not a file: {path}"})
         
-        stat = file_path.stat()
-        
-        return json.dumps({
-            "path": str(file_path),
-            "content": content,
-            "size": stat.st_size,
-            "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-            "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-        }, indent=2)
+        result = await asyncio.to_thread(
+            _read_file_window, file_path, offset, length, start_line, end_line, encoding
+        )
+        return encode_result(result)
+    except Exception as e:
+        return encode_result({"error": str(e)})
+
+
+class FileReadRequest(BaseModel):
+    """One file of a filesystem_read_files batch."""
+
+    path: str
+    offset: int = 0
+    length: int | None = None
+    start_line: int | None = None
+    end_line: int | None = None
+
+
+class _ByteBudget:
+    """Byte allowance shared by the reads of one batch."""
+
+    def __init__(self, total: int):
+        self.remaining = total
+        self._lock = threading.Lock()
+
+    def reserve(self, wanted: int) -> int:
+        with self._lock:
+            granted = max(0, min(wanted, self.remaining))
+            self.remaining -= granted
+            return granted
+
+    def refund(self, unused: int) -> None:
+        with self._lock:
+            self.remaining += unused
+
+
+def _read_batch_entry(request: FileReadRequest, encoding: str, budget: _ByteBudget) -> dict:
+    file_path = Path(request.path).resolve()
+    if not file_path.is_file():
+        raise FileNotFoundError(f"File not found: {request.path}")
+
+    # Reserve no more than this file can produce, so small files do not
+    # starve the rest of the batch while large reads are still running.
+    limit = FILESYSTEM_CONFIG["max_read_bytes"]
+    wanted = min(request.length if request.length is not None else limit, limit)
+    size = file_path.stat().st_size
+    if request.start_line is None and request.end_line is None:
+        size -= min(max(0, request.offset), size)
+    granted = budget.reserve(min(wanted, size))
+    if granted == 0 and size > 0 and wanted > 0:
+        return {"path": str(file_path), "error": "Batch byte budget exhausted", "skipped": True}
+
+    try:
+        result = _read_file_window(
+            file_path, request.offset, granted,
+            request.start_line, request.end_line, encoding,
+        )
+    except Exception:
+        budget.refund(granted)
+        raise
+    budget.refund(granted - result["length"])
+    return result
+
+
+@group_tool("filesystem")
+async def filesystem_read_files(
+    files: list[FileReadRequest | str],
+    encoding: str = "auto",
+    max_concurrency: int | None = None,
+    max_total_bytes: int | None = None,
+) -> str:
+    """Read several files, or windows of them, in one call.
+
+    Args:
+        files: Paths, or objects with path and optional offset/length or
+            start_line/end_line as in filesystem_read_file
+        encoding: 'auto' (UTF-8 text, base64 for binary data), 'text' or 'base64'
+        max_concurrency: Files read at once (default FILESYSTEM_BATCH_CONCURRENCY)
+        max_total_bytes: Byte budget for the whole batch (default and cap
+            FILESYSTEM_BATCH_MAX_BYTES)
+
+    Returns:
+        JSON string containing one result per requested file, in order.
+        Failed or skipped files carry an error instead of failing the batch.
+    """
+    if encoding not in ("auto", "text", "base64"):
+        return encode_result({"error": f"Unknown encoding: {encoding}"})
+
+    try:
+        requests = [
+            FileReadRequest(path=item) if isinstance(item, str)
+            else FileReadRequest.model_validate(item)
+            for item in files
+        ]
+        limit = FILESYSTEM_CONFIG["batch_max_bytes"]
+        budget = _ByteBudget(min(max_total_bytes, limit) if max_total_bytes is not None else limit)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or FILESYSTEM_CONFIG["batch_concurrency"]))
+
+        async def read(request: FileReadRequest) -> dict:
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(_read_batch_entry, request, encoding, budget)
+                except Exception as e:
+                    return {"path": request.path, "error": str(e)}
+
+        results = await asyncio.gather(*(read(request) for request in requests))
+
+        return encode_result({
+            "files": results,
+            "count": len(results),
+            "errors": sum(1 for result in results if "error" in result),
+            "bytes_read": sum(result.get("length", 0) for result in results),
+        })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
+
+
+_WRITE_MODES = ("overwrite", "append", "patch_bytes", "patch_lines", "diff")
+_FSYNC_POLICIES = ("none", "file", "full")
+_COPY_CHUNK = 1024 * 1024
+
+
+def _fsync_directory(path: Path) -> None:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:  # directories cannot be opened on Windows
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def _atomic_output(file_path: Path, fsync: str):
+    """Yield a temp file next to ``file_path`` that replaces it on success.
+
+    The original file's permission bits are kept. With ``fsync='file'`` the
+    data is flushed to disk before the rename; ``'full'`` also syncs the
+    directory so the rename itself survives a crash.
+    """
+    tmp_path = file_path.with_name(f".{file_path.name}.{secrets.token_hex(4)}.tmp")
+    f = open(tmp_path, "xb")
+    try:
+        yield f
+        f.flush()
+        if fsync != "none":
+            os.fsync(f.fileno())
+        f.close()
+        if file_path.exists():
+            os.chmod(tmp_path, file_path.stat().st_mode & 0o7777)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        f.close()
+        tmp_path.unlink(missing_ok=True)
+        raise
+    if fsync == "full":
+        _fsync_directory(file_path.parent)
+
+
+def _copy_bytes(src, dst, length: int | None = None) -> None:
+    """Copy ``length`` bytes (or the rest) of ``src`` to ``dst`` in chunks."""
+    while length is None or length > 0:
+        chunk = src.read(_COPY_CHUNK if length is None else min(_COPY_CHUNK, length))
+        if not chunk:
+            return
+        dst.write(chunk)
+        if length is not None:
+            length -= len(chunk)
+
+
+_HUNK_HEADER = re.compile(r"@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+_DIFF_HEADER_PREFIXES = (
+    "+++ ", "index ", "old mode ", "new mode ", "new file mode ", "deleted file mode ",
+    "similarity index ", "dissimilarity index ", "rename from ", "rename to ",
+    "copy from ", "copy to ",
+)
+
+
+def _split_lines(text: str) -> list[str]:
+    """Split on ``\n`` only, keeping line ends.
+
+    ``str.splitlines`` also breaks on form feeds, ``\x1c``-``\x1e`` and
+    Unicode line separators, which are ordinary characters in a diff line.
+    """
+    parts = text.split("\n")
+    lines = [part + "\n" for part in parts[:-1]]
+    if parts[-1]:
+        lines.append(parts[-1])
+    return lines
+
+
+def _parse_unified_diff(diff: str) -> list[tuple[int, list[str], list[str]]]:
+    """Parse unified diff hunks into ``(old_start, old_lines, new_lines)``.
+
+    Each hunk must hold exactly the number of lines its header states, and
+    the diff may only cover one file.
+    """
+    hunks: list[tuple[int, list[str], list[str]]] = []
+    last: list[list[str]] = []
+    old_left = new_left = 0
+    files = 0
+    in_file_header = False
+    for line in _split_lines(diff):
+        if old_left or new_left:
+            if line in ("\n", "\r\n"):
+                # Some editors strip the leading space of empty context lines.
+                line = " " + line
+            body = line[1:] if line.endswith("\n") else line[1:] + "\n"
+            _, old, new = hunks[-1]
+            if line[0] == " " and old_left and new_left:
+                old.append(body)
+                new.append(body)
+                old_left -= 1
+                new_left -= 1
+                last = [old, new]
+            elif line[0] == "-" and old_left:
+                old.append(body)
+                old_left -= 1
+                last = [old]
+            elif line[0] == "+" and new_left:
+                new.append(body)
+                new_left -= 1
+                last = [new]
+            elif line.startswith("\\"):
+                for side in last:
+                    side[-1] = side[-1].rstrip("\n")
+            else:
+                raise ValueError(f"Hunk {len(hunks)} does not match its header at: {line.rstrip()}")
+            continue
+
+        header = _HUNK_HEADER.match(line)
+        if header:
+            old_start, old_count, _, new_count = header.groups()
+            hunks.append((int(old_start), [], []))
+            old_left = 1 if old_count is None else int(old_count)
+            new_left = 1 if new_count is None else int(new_count)
+            last = []
+            in_file_header = False
+        elif line.startswith("\\"):
+            # "\ No newline at end of file" applies to the line before it.
+            for side in last:
+                side[-1] = side[-1].rstrip("\n")
+        elif line.startswith("diff "):
+            files += 1
+            in_file_header = True
+        elif line.startswith("--- "):
+            if not in_file_header:
+                files += 1
+            in_file_header = False
+        elif line.startswith(_DIFF_HEADER_PREFIXES) or not line.strip():
+            continue
+        elif hunks and line[0] in " +-":
+            raise ValueError(f"Hunk {len(hunks)} is longer than its header states")
+        else:
+            raise ValueError(f"Malformed diff line: {line.rstrip()}")
+        if files > 1:
+            raise ValueError("Diff covers more than one file")
+
+    if old_left or new_left:
+        raise ValueError(f"Hunk {len(hunks)} is shorter than its header states")
+    return hunks
+
+
+def _apply_unified_diff(text: str, diff: str) -> tuple[str, int]:
+    lines = _split_lines(text)
+    hunks = _parse_unified_diff(diff)
+    if not hunks:
+        raise ValueError("Diff contains no hunks")
+
+    shift = 0
+    for number, (old_start, old, new) in enumerate(hunks, 1):
+        expected = (old_start if not old else old_start - 1) + shift
+        # Look for the hunk's old lines at the stated position first, then
+        # progressively further away, as patch(1) does for shifted files.
+        for distance in range(len(lines) + 1):
+            candidates = [expected - distance, expected + distance] if distance else [expected]
+            position = next(
+                (pos for pos in candidates
+                 if 0 <= pos <= len(lines) - len(old) and lines[pos:pos + len(old)] == old),
+                None,
+            )
+            if position is not None:
+                break
+        else:
+            raise ValueError(f"Hunk {number} does not apply at line {old_start}")
+        lines[position:position + len(old)] = new
+        shift = position + len(new) - (old_start - 1 + len(old) if old else old_start)
+    return "".join(lines), len(hunks)
+
+
+def _write_file(
+    file_path: Path,
+    data: bytes,
+    mode: str,
+    offset: int | None,
+    length: int | None,
+    start_line: int | None,
+    end_line: int | None,
+    diff: str | None,
+    fsync: str,
+) -> dict:
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    result = {}
+
+    if mode == "overwrite":
+        with _atomic_output(file_path, fsync) as out:
+            out.write(data)
+        written = len(data)
+    elif mode == "append":
+        # Appends go straight to the file: rewriting it through a temp copy
+        # would cost as much as the full rewrite this mode exists to avoid.
+        with open(file_path, "ab") as out:
+            out.write(data)
+            out.flush()
+            if fsync != "none":
+                os.fsync(out.fileno())
+        written = len(data)
+    elif mode == "patch_bytes":
+        size = file_path.stat().st_size
+        offset = offset or 0
+        length = len(data) if length is None else length
+        if not 0 <= offset <= size or length < 0:
+            raise ValueError(f"Byte range {offset}+{length} is outside the file (size {size})")
+        with open(file_path, "rb") as src, _atomic_output(file_path, fsync) as out:
+            _copy_bytes(src, out, offset)
+            out.write(data)
+            src.seek(min(offset + length, size))
+            _copy_bytes(src, out)
+        written = len(data)
+    elif mode == "patch_lines":
+        first = start_line or 1
+        last = first - 1 if end_line is None else end_line
+        if first < 1 or last < first - 1:
+            raise ValueError(f"Invalid line range {start_line}-{end_line}")
+        with open(file_path, "rb") as src, _atomic_output(file_path, fsync) as out:
+            line_number = 0
+            for line_number in range(1, first):
+                line = src.readline()
+                if not line:
+                    raise ValueError(f"Line {first} is past the end of the file ({line_number - 1} lines)")
+                out.write(line)
+            if data and line_number and not line.endswith(b"\n"):
+                # Inserting after a final line without a newline would join the two.
+                data = b"\n" + data
+            for _ in range(first, last + 1):
+                if not src.readline():
+                    break
+            rest = src.read(1)
+            if data and rest and not data.endswith(b"\n"):
+                data += b"\n"
+            out.write(data)
+            out.write(rest)
+            _copy_bytes(src, out)
+        written = len(data)
+        result["lines_replaced"] = last - first + 1
+    else:
+        with open(file_path, "rb") as src:
+            text = src.read().decode("utf-8")
+        patched, hunks = _apply_unified_diff(text, diff or "")
+        encoded = patched.encode("utf-8")
+        with _atomic_output(file_path, fsync) as out:
+            out.write(encoded)
+        written = len(encoded)
+        result["hunks_applied"] = hunks
+
+    return {
+        "success": True,
+        "path": str(file_path),
+        "mode": mode,
+        "bytes_written": written,
+        "size": file_path.stat().st_size,
+        **result,
+    }
 
 
-@mcp.tool()
-async def filesystem_write_file(path: str, content: str) -> str:
-    """Write content to a file (creates or overwrites).
+@group_tool("filesystem")
+async def filesystem_write_file(
+    path: str,
+    content: str = "",
+    mode: str = "overwrite",
+    offset: int | None = None,
+    length: int | None = None,
+    start_line: int | None = None,
+    end_line: int | None = None,
+    diff: str | None = None,
+    encoding: str = "utf-8",
+    fsync: str | None = None,
+) -> str:
+    """Write content to a file (creates or overwrites), or edit it in part.
     
     Args:
         path: Absolute path to the file
         content: Content to write
+        mode: 'overwrite', 'append', 'patch_bytes' (replace length bytes at
+            offset with content), 'patch_lines' (replace lines start_line
+            through end_line with content; omit end_line to insert before
+            start_line) or 'diff' (apply a unified diff given in diff)
+        offset: Byte offset for patch_bytes
+        length: Bytes replaced by patch_bytes (default: len(content))
+        start_line: First line (1-based) replaced by patch_lines
+        end_line: Last line (inclusive) replaced by patch_lines
+        diff: Unified diff for mode 'diff'
+        encoding: 'utf-8' or 'base64' (content is base64-encoded bytes)
+        fsync: 'none', 'file' (sync data before the rename) or 'full' (also
+            sync the directory); default FILESYSTEM_WRITE_FSYNC
     
     Returns:
-        JSON string confirming the write operation
+        JSON string confirming the write operation. Every mode except append
+        writes a temp file and renames it over the original.
     """
+    fsync = fsync or FILESYSTEM_CONFIG["write_fsync"]
+    if mode not in _WRITE_MODES:
+        return encode_result({"error": f"Unknown mode: {mode}"})
+    if fsync not in _FSYNC_POLICIES:
+        return encode_result({"error": f"Unknown fsync policy: {fsync}"})
+    if encoding not in ("utf-8", "base64"):
+        return encode_result({"error": f"Unknown encoding: {encoding}"})
+    if mode == "diff" and not diff:
+        return encode_result({"error": "Mode 'diff' requires a diff"})
+
     try:
         file_path = Path(path).resolve()
         
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        async with aiofiles.open(file_path, "w", encoding="utf-8") as f:
-            await f.write(content)
+        if mode in ("patch_bytes", "patch_lines", "diff") and not file_path.is_file():
+            return encode_result({"error": f"File not found: {path}"})
         
-        return json.dumps({
-            "success": True,
-            "path": str(file_path),
-            "bytes_written": len(content.encode("utf-8")),
-        }, indent=2)
+        data = base64.b64decode(content) if encoding == "base64" else content.encode("utf-8")
+        result = await asyncio.to_thread(
+            _write_file, file_path, data, mode, offset, length,
+            start_line, end_line, diff, fsync,
+        )
+        return encode_result(result)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
+
+
+_LIST_FIELDS = ("name", "path", "type", "size", "modified", "is_symlink")
+_LIST_SORTS = ("name", "type", "size", "modified", "none")
+
+
+class _ListEntry:
+    """Directory listing entry with a lazily fetched ``stat`` result."""
+
+    __slots__ = ("name", "path", "rel", "is_dir", "is_symlink", "_source", "_stat")
+
+    def __init__(self, name: str, path: str, rel: str, is_dir: bool, is_symlink: bool, source=None):
+        self.name = name
+        self.path = path
+        self.rel = rel
+        self.is_dir = is_dir
+        self.is_symlink = is_symlink
+        self._source = source
+        self._stat = None
+
+    @classmethod
+    def from_dir_entry(cls, entry: os.DirEntry) -> "_ListEntry":
+        # DirEntry answers is_dir/is_symlink from the scandir data and caches stat.
+        return cls(entry.name, entry.path, entry.name, entry.is_dir(), entry.is_symlink(), entry)
+
+    def stat(self) -> os.stat_result | None:
+        if self._stat is None:
+            try:
+                self._stat = self._source.stat() if self._source else os.stat(self.path)
+            except OSError:
+                return None
+        return self._stat
+
+    def detach(self) -> "_ListEntry":
+        """Drop cached state so a stored entry is re-stat()ed when served again."""
+        return _ListEntry(self.name, self.path, self.rel, self.is_dir, self.is_symlink)
+
+
+def _list_sort_key(entry: _ListEntry, sort: str) -> list:
+    # The relative path breaks ties, which keeps keys unique for the cursor.
+    if sort == "type":
+        return [0 if entry.is_dir else 1, entry.rel]
+    if sort == "size":
+        stat = entry.stat()
+        return [stat.st_size if stat else -1, entry.rel]
+    if sort == "modified":
+        stat = entry.stat()
+        return [stat.st_mtime if stat else -1.0, entry.rel]
+    return [entry.rel]
+
+
+def _scan_listing(dir_path: Path, pattern: str) -> list[_ListEntry]:
+    if "/" in pattern or "**" in pattern:
+        # Sub-path and recursive patterns keep Path.glob semantics.
+        return [
+            _ListEntry(
+                item.name, str(item), item.relative_to(dir_path).as_posix(),
+                item.is_dir(), item.is_symlink(),
+            )
+            for item in dir_path.glob(pattern)
+        ]
+    regex = _glob_regex(pattern)
+    with os.scandir(dir_path) as it:
+        return [_ListEntry.from_dir_entry(entry) for entry in it if regex.match(entry.name)]
+
+
+class _ListingSnapshots:
+    """Sorted flat listings kept between pages of the same cursor.
+
+    A snapshot is reused only while the directory's mtime is unchanged, so a
+    follow-up page skips the rescan and re-sort without missing entries that
+    were added or removed in between.
+    """
+
+    def __init__(self, max_size: int = 8):
+        self.max_size = max_size
+        self._snapshots: OrderedDict[str, tuple[str, int, list]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str, dir_path: Path, mtime_ns: int) -> list | None:
+        with self._lock:
+            snapshot = self._snapshots.get(token)
+            if snapshot is None or snapshot[:2] != (str(dir_path), mtime_ns):
+                self._snapshots.pop(token, None)
+                return None
+            self._snapshots.move_to_end(token)
+            return snapshot[2]
 
+    def put(self, dir_path: Path, mtime_ns: int, ordered: list) -> str:
+        token = secrets.token_urlsafe(12)
+        stored = [(key, entry.detach()) for key, entry in ordered]
+        with self._lock:
+            self._snapshots[token] = (str(dir_path), mtime_ns, stored)
+            while len(self._snapshots) > self.max_size:
+                self._snapshots.popitem(last=False)
+        return token
 
-@mcp.tool()
-async def filesystem_list_directory(path: str, pattern: str = "*") -> str:
+
+listing_snapshots = _ListingSnapshots()
+
+
+def _list_directory(
+    dir_path: Path,
+    pattern: str,
+    fields: list[str],
+    sort: str,
+    descending: bool,
+    limit: int,
+    cursor: str | None,
+) -> dict:
+    payload = None
+    if cursor:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if payload["sort"] != [sort, descending, pattern]:
+            raise ValueError("cursor does not match the requested pattern and sort")
+
+    flat = "/" not in pattern and "**" not in pattern
+    mtime_ns = dir_path.stat().st_mtime_ns if flat else None
+    token = payload.get("snapshot") if payload else None
+    ordered = listing_snapshots.get(token, dir_path, mtime_ns) if token and flat else None
+
+    if ordered is not None:
+        start = payload["position"]
+    else:
+        token = None
+        entries = _scan_listing(dir_path, pattern)
+        # Only sorting by size or modification time needs a stat of every
+        # entry; otherwise stat is limited to the entries on the page.
+        if sort == "none":
+            ordered = [(None, entry) for entry in entries]
+        else:
+            ordered = [(_list_sort_key(entry, sort), entry) for entry in entries]
+            ordered.sort(key=lambda item: item[0], reverse=descending)
+        start = 0
+        if payload and sort == "none":
+            start = payload["position"]
+        elif payload:
+            after = payload["after"]
+            while start < len(ordered) and (
+                ordered[start][0] >= after if descending else ordered[start][0] <= after
+            ):
+                start += 1
+
+    page = ordered[start:start + limit]
+    items = []
+    for _, entry in page:
+        item = {}
+        stat = entry.stat() if "size" in fields or "modified" in fields else None
+        for field in fields:
+            if field == "name":
+                item["name"] = entry.name
+            elif field == "path":
+                item["path"] = entry.path
+            elif field == "type":
+                item["type"] = "directory" if entry.is_dir else "file"
+            elif field == "size":
+                item["size"] = stat.st_size if stat else None
+            elif field == "modified":
+                item["modified"] = datetime.fromtimestamp(stat.st_mtime).isoformat() if stat else None
+            elif field == "is_symlink":
+                item["is_symlink"] = entry.is_symlink
+        items.append(item)
+
+    position = start + len(page)
+    has_more = position < len(ordered)
+    next_cursor = None
+    if has_more:
+        if flat and token is None:
+            token = listing_snapshots.put(dir_path, mtime_ns, ordered)
+        next_cursor = base64.urlsafe_b64encode(json.dumps({
+            "sort": [sort, descending, pattern],
+            "after": page[-1][0],
+            "position": position,
+            "snapshot": token,
+        }).encode()).decode()
+
+    return {
+        "path": str(dir_path),
+        "items": items,
+        "count": len(items),
+        "total": len(ordered),
+        "has_more": has_more,
+        "next_cursor": next_cursor,
+    }
+
+
+@group_tool("filesystem")
+async def filesystem_list_directory(
+    path: str,
+    pattern: str = "*",
+    fields: list[str] | None = None,
+    sort: str = "name",
+    descending: bool = False,
+    limit: int = 1000,
+    cursor: str | None = None,
+) -> str:
     """List files and directories in a folder.
     
     Args:
         path: Absolute path to the directory
-        pattern: Glob pattern for filtering (default: all files)
+        pattern: Glob pattern (default: all entries). Patterns containing
+            "/" or "**" match sub-paths and recursively, as with Path.glob.
+        fields: Fields to return per entry, from name, path, type, size,
+            modified and is_symlink (default: name, path, type, size,
+            modified). Leaving out size and modified avoids a stat per entry.
+        sort: 'name', 'type' (directories first), 'size', 'modified' or
+            'none' (directory order)
+        descending: Reverse the sort order
+        limit: Maximum entries per page (default 1000)
+        cursor: next_cursor from a previous page
     
     Returns:
-        JSON string containing directory listing
+        JSON string containing directory listing. has_more and next_cursor
+        are set when further pages remain.
     """
+    fields = fields or ["name", "path", "type", "size", "modified"]
+    unknown = [field for field in fields if field not in _LIST_FIELDS]
+    if unknown:
+        return encode_result({"error": f"Unknown fields: {', '.join(unknown)}"})
+    if sort not in _LIST_SORTS:
+        return encode_result({"error": f"Unknown sort: {sort}"})
+
     try:
         dir_path = Path(path).resolve()
         
         if not dir_path.exists():
-            return json.dumps({"error": f"Directory not found: {path}"})
+            return encode_result({"error": f"Directory not found: {path}"})
         
         if not dir_path.is_dir():
-            return json.dumps({"error": f"Not a directory: {path}"})
+            return encode_result({"error": f"Not a directory: {path}"})
         
-        items = []
-        for item in dir_path.glob(pattern):
-            stat = item.stat()
-            items.append({
-                "name": item.name,
-                "path": str(item),
-                "type": "directory" if item.is_dir() else "file",
-                "size": stat.st_size,
-                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-            })
-        
-        return json.dumps({
-            "path": str(dir_path),
-            "items": items,
-            "count": len(items),
-        }, indent=2)
+        result = await asyncio.to_thread(
+            _list_directory, dir_path, pattern, fields, sort, descending, max(1, limit), cursor
+        )
+        return encode_result(result)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
-@mcp.tool()
+@group_tool("filesystem")
 async def filesystem_create_directory(path: str) -> str:
     """Create a new directory.
     
@@ -739,80 +3618,832 @@ async def filesystem_create_directory(path: str) -> str:
         dir_path = Path(path).resolve()
         dir_path.mkdir(parents=True, exist_ok=True)
         
-        return json.dumps({
+        return encode_result({
             "success": True,
             "path": str(dir_path),
-        }, indent=2)
+        })
+    except Exception as e:
+        return encode_result({"error": str(e)})
+
+
+@group_tool("filesystem")
+async def filesystem_delete_file(path: str) -> str:
+    """Delete a file.
+    
+    Args:
+        path: Absolute path to the file to delete
+    
+    Returns:
+        JSON string confirming the operation
+    """
+    try:
+        file_path = Path(path).resolve()
+        
+        if not file_path.exists():
+            return encode_result({"error": f"File not found: {path}"})
+        
+        file_path.unlink()
+        
+        return encode_result({
+            "success": True,
+            "path": str(file_path),
+        })
+    except Exception as e:
+        return encode_result({"error": str(e)})
+
+
+def _glob_regex(pattern: str) -> re.Pattern:
+    """Translate a glob into a regex over '/'-separated relative paths.
+
+    ``*`` and ``?`` stay within one path segment and ``**/`` spans any
+    number of directories, as with ``Path.glob``.
+    """
+    parts = []
+    i, n = 0, len(pattern)
+    while i < n:
+        if pattern.startswith("**/", i):
+            parts.append("(?:[^/]*/)*")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 2:]:
+            end = pattern.index("]", i + 2)
+            body = pattern[i + 1:end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            parts.append(f"[{body.replace(chr(92), chr(92) * 2)}]")
+            i = end + 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return re.compile("".join(parts) + r"\Z")
+
+
+def _read_gitignore(path: str, base: str) -> tuple:
+    """Parse a .gitignore into ``(base, regex, negate, dir_only)`` rules."""
+    rules = []
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return ()
+    for line in lines:
+        line = line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.strip("/") if dir_only else line
+        if "/" in line:
+            regex = _glob_regex(line.lstrip("/"))
+        else:
+            regex = _glob_regex("**/" + line)
+        rules.append((base, regex, negate, dir_only))
+    return tuple(rules)
+
+
+def _is_ignored(rules: tuple, rel: str, is_dir: bool) -> bool:
+    ignored = False
+    for base, regex, negate, dir_only in rules:
+        if dir_only and not is_dir:
+            continue
+        if base:
+            if not rel.startswith(base + "/"):
+                continue
+            candidate = rel[len(base) + 1:]
+        else:
+            candidate = rel
+        if regex.match(candidate):
+            ignored = not negate
+    return ignored
+
+
+def _scan_dir(path: str, rel: str, rules: tuple, gitignore: bool) -> tuple[tuple, list]:
+    """List one directory as ``(rel, path, is_dir, is_symlink)`` after pruning.
+
+    ``DirEntry`` caches the type from the directory read, so no extra stat
+    calls are made per entry.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return rules, []
+
+    if gitignore and any(entry.name == ".gitignore" for entry in entries):
+        rules = rules + _read_gitignore(os.path.join(path, ".gitignore"), rel)
+
+    exclude = FILESYSTEM_CONFIG["search_exclude"]
+    items = []
+    for entry in entries:
+        entry_rel = f"{rel}/{entry.name}" if rel else entry.name
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir and entry.name in exclude:
+            continue
+        if rules and _is_ignored(rules, entry_rel, is_dir):
+            continue
+        items.append((entry_rel, entry.path, is_dir, entry.is_symlink()))
+    return rules, items
+
+
+def _walk_tree(
+    path: str,
+    rel: str,
+    rules: tuple,
+    depth: int,
+    max_depth: int | None,
+    gitignore: bool,
+    stop: threading.Event,
+):
+    """Yield ``(rel, path, is_dir)`` depth-first until ``stop`` is set.
+
+    Directories deeper than ``max_depth`` are never opened, and symlinked
+    directories are reported but not followed.
+    """
+    stack = [(path, rel, rules, depth)]
+    while stack and not stop.is_set():
+        path, rel, rules, depth = stack.pop()
+        rules, items = _scan_dir(path, rel, rules, gitignore)
+        subdirs = []
+        for entry_rel, entry_path, is_dir, is_symlink in items:
+            yield entry_rel, entry_path, is_dir
+            if is_dir and not is_symlink and (max_depth is None or depth < max_depth):
+                subdirs.append((entry_path, entry_rel, rules, depth + 1))
+        stack.extend(reversed(subdirs))
+
+
+def _search_files(
+    root: Path,
+    pattern: str,
+    max_results: int,
+    gitignore: bool,
+    parallel: bool,
+) -> tuple[list[dict], bool]:
+    regex = _glob_regex(pattern.lstrip("/"))
+    max_depth = None if "**" in pattern else pattern.strip("/").count("/")
+    stop = threading.Event()
+    results: list[dict] = []
+    lock = threading.Lock()
+
+    def collect(walker) -> None:
+        for rel, path, is_dir in walker:
+            if not regex.match(rel):
+                continue
+            with lock:
+                if len(results) >= max_results:
+                    # One match past the limit shows the results are truncated.
+                    stop.set()
+                    return
+                results.append({
+                    "name": os.path.basename(path),
+                    "path": path,
+                    "type": "directory" if is_dir else "file",
+                })
+
+    if max_results <= 0:
+        return results, False
+    if not parallel:
+        collect(_walk_tree(str(root), "", (), 0, max_depth, gitignore, stop))
+        return results, stop.is_set()
+
+    # Match the top level here, then walk each top-level subtree on its own
+    # worker; the first worker to fill the result list stops the others.
+    rules, items = _scan_dir(str(root), "", (), gitignore)
+    collect((rel, path, is_dir) for rel, path, is_dir, _ in items)
+    subtrees = [
+        (path, rel) for rel, path, is_dir, is_symlink in items
+        if is_dir and not is_symlink and (max_depth is None or max_depth > 0)
+    ]
+    if subtrees and not stop.is_set():
+        workers = max(1, min(FILESYSTEM_CONFIG["search_workers"], len(subtrees)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fs-search") as pool:
+            for future in [
+                pool.submit(collect, _walk_tree(path, rel, rules, 1, max_depth, gitignore, stop))
+                for path, rel in subtrees
+            ]:
+                future.result()
+    return results, stop.is_set()
+
+
+@group_tool("filesystem")
+async def filesystem_search(
+    directory: str,
+    pattern: str,
+    max_results: int = 20,
+    respect_gitignore: bool = True,
+    parallel: bool = False,
+) -> str:
+    """Search for files matching a pattern.
+    
+    Args:
+        directory: Root directory to search
+        pattern: Glob pattern (e.g., '*.py', '**/*.js')
+        max_results: Maximum number of results (default 20); the walk stops
+            at the first match beyond this many
+        respect_gitignore: Skip paths excluded by .gitignore files in the tree
+        parallel: Walk top-level subdirectories concurrently
+    
+    Returns:
+        JSON string containing matching file paths; truncated is set only
+        when more than max_results paths match
+    """
+    try:
+        dir_path = Path(directory).resolve()
+        
+        if not dir_path.exists():
+            return encode_result({"error": f"Directory not found: {directory}"})
+        
+        results, truncated = await asyncio.to_thread(
+            _search_files, dir_path, pattern, max_results, respect_gitignore, parallel
+        )
+        
+        return encode_result({
+            "directory": str(dir_path),
+            "pattern": pattern,
+            "matches": results,
+            "count": len(results),
+            "truncated": truncated,
+        })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
+
+
+_CONTENT_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    root TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    indexed INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS trigrams (
+    trigram INTEGER NOT NULL,
+    file_id INTEGER NOT NULL,
+    PRIMARY KEY (trigram, file_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS trigrams_file ON trigrams (file_id);
+"""
+
+
+def _literal_trigrams(literal: str, case_sensitive: bool) -> list[int]:
+    # The index holds ASCII-lowercased bytes, so non-ASCII trigrams can only
+    # be used when the search is case-sensitive.
+    data = literal.encode("utf-8").lower()
+    grams = []
+    for i in range(len(data) - 2):
+        gram = data[i:i + 3]
+        if case_sensitive or gram.isascii():
+            grams.append((gram[0] << 16) | (gram[1] << 8) | gram[2])
+    return grams
+
+
+_REGEX_LITERAL_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "f": "\f", "v": "\v", "a": "\a"}
+_REGEX_REPEAT = re.compile(r"(\d*)(,\d*)?\}")
+_REGEX_ESCAPE_ARGUMENTS = {
+    "x": "[0-9a-fA-F]{2}", "u": "[0-9a-fA-F]{4}", "U": "[0-9a-fA-F]{8}", "N": r"\{[^}]*\}",
+}
+
+
+def _regex_literal_runs(query: str) -> tuple[list[str], bool] | None:
+    """Literal runs every match of ``query`` must contain.
+
+    Only characters outside groups and classes count, and a character
+    followed by a quantifier is dropped, so every run is a substring of every
+    match. Returns ``(runs, ignore_case)``, or ``None`` when a top-level
+    alternation or verbose mode makes no run certain.
+    """
+    runs: list[str] = []
+    current: list[str] = []
+    ignore_case = False
+    depth = 0
+    index = 0
+
+    def flush() -> None:
+        if current:
+            runs.append("".join(current))
+            current.clear()
+
+    while index < len(query):
+        char = query[index]
+        index += 1
+        if char == "\\" and index < len(query):
+            escaped = query[index]
+            index += 1
+            if depth:
+                continue
+            if escaped in _REGEX_LITERAL_ESCAPES:
+                current.append(_REGEX_LITERAL_ESCAPES[escaped])
+            elif not escaped.isalnum():
+                current.append(escaped)
+            else:
+                # Classes (\d, \w), anchors, backreferences and code escapes;
+                # skip the arguments of the latter.
+                flush()
+                if escaped in _REGEX_ESCAPE_ARGUMENTS or escaped.isdigit():
+                    argument = re.match(_REGEX_ESCAPE_ARGUMENTS.get(escaped, "[0-9]{0,2}"), query[index:])
+                    index += len(argument.group()) if argument else 0
+        elif char == "[":
+            flush()
+            # Skip the class; a leading "]" or "^]" is a literal member.
+            if query.startswith("^", index):
+                index += 1
+            if query.startswith("]", index):
+                index += 1
+            while index < len(query) and query[index] != "]":
+                index += 2 if query[index] == "\\" else 1
+            index += 1
+        elif char == "(":
+            flush()
+            if query.startswith("?", index):
+                flags = re.match(r"\?([aiLmsux]*)[):-]", query[index:])
+                if flags and "x" in flags.group(1):
+                    return None
+                if flags and "i" in flags.group(1):
+                    ignore_case = True
+            depth += 1
+        elif char == ")":
+            depth = max(0, depth - 1)
+        elif char == "|":
+            if depth == 0:
+                return None
+        elif char == "{" and (bounds := _REGEX_REPEAT.match(query, index)) and any(bounds.groups()):
+            index += len(bounds.group())
+            # With a zero minimum the previous character may be absent.
+            if current and depth == 0 and not int(bounds.group(1) or 0):
+                current.pop()
+            flush()
+        elif char in "*?":
+            # The previous character may be absent from a match.
+            if current and depth == 0:
+                current.pop()
+            flush()
+        elif char == "+":
+            flush()
+        elif char in ".^$":
+            flush()
+        elif depth == 0:
+            current.append(char)
+    flush()
+    return runs, ignore_case
+
+
+def _query_trigrams(query: str, regex: bool, case_sensitive: bool) -> set[int] | None:
+    """Trigrams every match must contain, or ``None`` if none are known."""
+    if not regex:
+        return set(_literal_trigrams(query, case_sensitive)) or None
+
+    scanned = _regex_literal_runs(query)
+    if scanned is None:
+        return None
+    runs, ignore_case = scanned
+    grams = set()
+    for run in runs:
+        grams.update(_literal_trigrams(run, case_sensitive and not ignore_case))
+    return grams or None
+
+
+class _IndexWorkers:
+    """Runs ``content_index_worker.py`` processes for a content index refresh.
+
+    The workers are plain scripts fed over pipes rather than a
+    multiprocessing pool: spawned multiprocessing children re-execute the
+    parent's ``__main__``, which would load this whole server in each one.
+    Every pool thread drives one worker process; batches keep their order.
+    """
+
+    batch_size = 64
+
+    def __init__(self, workers: int, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="content-index")
+        self._local = threading.local()
+        self._procs = []
+        self._lock = threading.Lock()
+
+    def _run(self, batch: list[str]) -> list:
+        import pickle
+        import subprocess
+        import sys
+
+        proc = getattr(self._local, "proc", None)
+        if proc is None:
+            proc = subprocess.Popen(
+                [sys.executable, str(Path(__file__).with_name("content_index_worker.py"))],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+            self._local.proc = proc
+            with self._lock:
+                self._procs.append(proc)
+        pickle.dump((batch, self.max_bytes), proc.stdin, protocol=pickle.HIGHEST_PROTOCOL)
+        proc.stdin.flush()
+        return pickle.load(proc.stdout)
+
+    def map(self, paths: list[str]):
+        from itertools import chain
+
+        batches = [paths[i:i + self.batch_size] for i in range(0, len(paths), self.batch_size)]
+        return chain.from_iterable(self._pool.map(self._run, batches))
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            procs, self._procs = self._procs, []
+        for proc in procs:
+            proc.kill()
+            proc.wait()
+            for stream in (proc.stdin, proc.stdout):
+                try:
+                    stream.close()
+                except OSError:
+                    pass
+
+
+class ContentIndex:
+    """Persistent trigram index over the configured search roots.
+
+    The index lives in SQLite: one row per file with the size and mtime it
+    was indexed at, and one ``(trigram, file_id)`` row per distinct
+    lower-cased byte trigram. A refresh walks the roots, recomputes only
+    new or changed files on a process pool and drops vanished ones. Queries
+    intersect the posting lists of the query's trigrams and verify the
+    candidates against the actual file contents.
+    """
+
+    def __init__(self, db_path: str, roots: list[str], workers: int, max_file_bytes: int):
+        self.db_path = str(Path(db_path).expanduser())
+        self.roots = [str(Path(root).expanduser().resolve()) for root in roots]
+        self.workers = workers or os.cpu_count() or 1
+        self.max_file_bytes = max_file_bytes
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._last_started = 0.0
+        self._schema_ready = False
+        self._state = {
+            "status": "idle",
+            "last_refresh": None,
+            "last_duration_s": None,
+            "files_updated": 0,
+            "files_removed": 0,
+            "pending": 0,
+            "error": None,
+        }
+
+    def _connect(self):
+        import sqlite3
+
+        if not self._schema_ready:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(self.db_path, timeout=30)
+        if not self._schema_ready:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.executescript(_CONTENT_INDEX_SCHEMA)
+            self._schema_ready = True
+        return db
+
+    @property
+    def status(self) -> str:
+        return self._state["status"]
+
+    @property
+    def refreshing(self) -> bool:
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def refresh(self, max_age: float = 0.0) -> bool:
+        """Start a background refresh unless one is running or ran recently."""
+        with self._lock:
+            if self.refreshing or self._stop.is_set():
+                return False
+            if self._last_started and time.monotonic() - self._last_started < max_age:
+                return False
+            self._last_started = time.monotonic()
+            self._thread = threading.Thread(
+                target=self._refresh, name="content-index", daemon=True
+            )
+            self._thread.start()
+            return True
+
+    def wait(self, timeout: float | None = None) -> bool:
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return not self.refreshing
+
+    def close(self) -> None:
+        self._stop.set()
+
+    def _scan_roots(self, known: dict[str, tuple[int, int, int]]) -> tuple[list, list[int]]:
+        from stat import S_ISREG
+
+        seen = set()
+        changed = []
+        for root in self.roots:
+            for _, path, is_dir in _walk_tree(root, "", (), 0, None, True, self._stop):
+                if is_dir:
+                    continue
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                if not S_ISREG(st.st_mode):
+                    continue
+                seen.add(path)
+                entry = known.get(path)
+                if entry is None or entry[1:] != (st.st_size, st.st_mtime_ns):
+                    changed.append((root, path))
+        removed = [entry[0] for path, entry in known.items() if path not in seen]
+        return changed, removed
+
+    def _refresh(self) -> None:
+        started = time.monotonic()
+        self._state.update(status="scanning", error=None, pending=0)
+        try:
+            db = self._connect()
+            try:
+                known = {
+                    path: (file_id, size, mtime_ns)
+                    for file_id, path, size, mtime_ns
+                    in db.execute("SELECT id, path, size, mtime_ns FROM files")
+                }
+                changed, removed = self._scan_roots(known)
+                if self._stop.is_set():
+                    return
+
+                for file_id in removed:
+                    db.execute("DELETE FROM trigrams WHERE file_id = ?", (file_id,))
+                    db.execute("DELETE FROM files WHERE id = ?", (file_id,))
+                db.commit()
+                self._state.update(status="indexing", pending=len(changed))
+                self._index(db, changed, known)
+            finally:
+                db.close()
+            self._state.update(
+                status="ready",
+                last_refresh=datetime.now().isoformat(),
+                last_duration_s=round(time.monotonic() - started, 3),
+                files_updated=len(changed),
+                files_removed=len(removed),
+                pending=0,
+            )
+        except Exception as e:
+            self._state.update(status="error", error=str(e))
+
+    def _index(self, db, changed: list[tuple[str, str]], known: dict) -> None:
+        from array import array
+        from itertools import repeat
+
+        from content_index_worker import index_file
+
+        paths = [path for _, path in changed]
+        if len(paths) < 64:
+            results = map(index_file, paths, repeat(self.max_file_bytes))
+            workers = None
+        else:
+            workers = _IndexWorkers(self.workers, self.max_file_bytes)
+            results = workers.map(paths)
+
+        try:
+            for done, ((root, path), result) in enumerate(zip(changed, results), 1):
+                if self._stop.is_set():
+                    break
+                previous = known.get(path)
+                if previous is not None:
+                    db.execute("DELETE FROM trigrams WHERE file_id = ?", (previous[0],))
+                    db.execute("DELETE FROM files WHERE id = ?", (previous[0],))
+                if result is not None:
+                    size, mtime_ns, grams = result
+                    file_id = db.execute(
+                        "INSERT INTO files (path, root, size, mtime_ns, indexed) VALUES (?, ?, ?, ?, ?)",
+                        (path, root, size, mtime_ns, grams is not None),
+                    ).lastrowid
+                    if grams:
+                        db.executemany(
+                            "INSERT INTO trigrams (trigram, file_id) VALUES (?, ?)",
+                            zip(array("I", grams), repeat(file_id)),
+                        )
+                if done % 256 == 0:
+                    db.commit()
+                    self._state["pending"] = len(changed) - done
+            db.commit()
+        finally:
+            if workers is not None:
+                workers.close()
+
+    def search(
+        self,
+        pattern: re.Pattern,
+        grams: set[int] | None,
+        path_regex: re.Pattern | None,
+        max_results: int,
+    ) -> dict:
+        db = self._connect()
+        try:
+            if grams:
+                # A handful of trigrams spread over the query narrows the
+                # candidates about as well as all of them, for far less work.
+                ordered = sorted(grams)
+                chosen = ordered[::max(1, len(ordered) // 16)][:16]
+                rows = db.execute(
+                    f"""
+                    SELECT f.path, f.root FROM files f
+                    JOIN (
+                        SELECT file_id FROM trigrams
+                        WHERE trigram IN ({", ".join("?" * len(chosen))})
+                        GROUP BY file_id HAVING COUNT(*) = ?
+                    ) t ON t.file_id = f.id
+                    ORDER BY f.path
+                    """,
+                    (*chosen, len(chosen)),
+                ).fetchall()
+            else:
+                rows = db.execute(
+                    "SELECT path, root FROM files WHERE indexed = 1 ORDER BY path"
+                ).fetchall()
+            # Text files over the size limit have no trigrams and are not
+            # searched; report them so callers know results may be incomplete.
+            oversized = db.execute(
+                "SELECT path, root FROM files WHERE indexed = 0 AND size > ? ORDER BY path",
+                (self.max_file_bytes,),
+            ).fetchall()
+        finally:
+            db.close()
+
+        if path_regex is not None:
+            oversized = [
+                (path, root) for path, root in oversized
+                if path_regex.match(os.path.relpath(path, root).replace(os.sep, "/"))
+            ]
+
+        matches = []
+        scanned = 0
+        truncated = False
+        for path, root in rows:
+            if path_regex is not None:
+                rel = os.path.relpath(path, root).replace(os.sep, "/")
+                if not path_regex.match(rel):
+                    continue
+            try:
+                with open(path, "rb") as f:
+                    text = f.read(self.max_file_bytes).decode("utf-8", errors="replace")
+            except OSError:
+                continue
+            scanned += 1
+            line, last = 1, 0
+            for match in pattern.finditer(text):
+                line += text.count("\n", last, match.start())
+                last = match.start()
+                line_start = text.rfind("\n", 0, match.start()) + 1
+                line_end = text.find("\n", match.start())
+                matches.append({
+                    "path": path,
+                    "line": line,
+                    "column": match.start() - line_start + 1,
+                    "text": text[line_start:line_end if line_end >= 0 else len(text)][:500],
+                })
+                if len(matches) >= max_results:
+                    break
+            if len(matches) >= max_results:
+                truncated = True
+                break
+
+        return {
+            "matches": matches,
+            "count": len(matches),
+            "candidates": len(rows),
+            "files_scanned": scanned,
+            "truncated": truncated,
+            "skipped_count": len(oversized),
+            "skipped_files": [path for path, _ in oversized[:100]],
+        }
 
+    def stats(self) -> dict:
+        result = {
+            "roots": self.roots,
+            "path": self.db_path,
+            "workers": self.workers,
+            "max_file_bytes": self.max_file_bytes,
+            **self._state,
+        }
+        if os.path.exists(self.db_path):
+            db = self._connect()
+            try:
+                files, indexed = db.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(indexed), 0) FROM files"
+                ).fetchone()
+            finally:
+                db.close()
+            result.update(
+                files=files,
+                indexed_files=indexed,
+                db_bytes=sum(
+                    os.path.getsize(self.db_path + suffix)
+                    for suffix in ("", "-wal")
+                    if os.path.exists(self.db_path + suffix)
+                ),
+            )
+        return result
+
+
+content_index = ContentIndex(
+    FILESYSTEM_CONFIG["index_path"],
+    FILESYSTEM_CONFIG["index_roots"],
+    FILESYSTEM_CONFIG["index_workers"],
+    FILESYSTEM_CONFIG["index_max_file_bytes"],
+)
+atexit.register(content_index.close)
+
+
+@group_tool("filesystem")
+async def filesystem_content_search(
+    query: str,
+    regex: bool = False,
+    case_sensitive: bool = True,
+    path_pattern: str | None = None,
+    max_results: int = 50,
+) -> str:
+    """Search file contents under the indexed roots (FILESYSTEM_INDEX_ROOTS).
 
-@mcp.tool()
-async def filesystem_delete_file(path: str) -> str:
-    """Delete a file.
-    
     Args:
-        path: Absolute path to the file to delete
-    
+        query: Text to find, or a regular expression if regex is true
+        regex: Treat query as a Python regular expression
+        case_sensitive: Match case exactly (default true)
+        path_pattern: Optional glob on paths relative to their root (e.g. '**/*.py')
+        max_results: Maximum number of matching lines (default 50)
+
     Returns:
-        JSON string confirming the operation
+        JSON string containing matching lines with path, line and column.
+        Files added since the last index refresh are not searched yet, and
+        files over FILESYSTEM_INDEX_MAX_FILE_BYTES are not searched at all;
+        those are listed in skipped_files (first 100) and skipped_count.
     """
+    if not content_index.roots:
+        return encode_result({"error": "No content index roots configured"})
+    if not query:
+        return encode_result({"error": "Empty query"})
+
     try:
-        file_path = Path(path).resolve()
-        
-        if not file_path.exists():
-            return json.dumps({"error": f"File not found: {path}"})
-        
-        file_path.unlink()
-        
-        return json.dumps({
-            "success": True,
-            "path": str(file_path),
-        }, indent=2)
+        pattern = re.compile(
+            query if regex else re.escape(query), 0 if case_sensitive else re.IGNORECASE
+        )
+        grams = _query_trigrams(query, regex, case_sensitive)
+        path_regex = _glob_regex(path_pattern) if path_pattern else None
+
+        content_index.refresh(max_age=FILESYSTEM_CONFIG["index_refresh_interval"])
+        started = time.perf_counter()
+        result = await asyncio.to_thread(
+            content_index.search, pattern, grams, path_regex, max(1, max_results)
+        )
+
+        return encode_result({
+            "query": query,
+            **result,
+            "trigram_filter": grams is not None,
+            "index_status": content_index.status,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
-@mcp.tool()
-async def filesystem_search(
-    directory: str,
-    pattern: str,
-    max_results: int = 20,
-) -> str:
-    """Search for files matching a pattern.
-    
+@group_tool("filesystem")
+async def filesystem_refresh_index(wait: bool = False) -> str:
+    """Update the content search index for new, changed and deleted files.
+
     Args:
-        directory: Root directory to search
-        pattern: Glob pattern (e.g., '*.py', '**/*.js')
-        max_results: Maximum number of results (default 20)
-    
+        wait: Block until the refresh has finished
+
     Returns:
-        JSON string containing matching file paths
+        JSON string containing index statistics
     """
+    if not content_index.roots:
+        return encode_result({"error": "No content index roots configured"})
+
     try:
-        dir_path = Path(directory).resolve()
-        
-        if not dir_path.exists():
-            return json.dumps({"error": f"Directory not found: {directory}"})
-        
-        matches = list(dir_path.glob(pattern))[:max_results]
-        
-        results = []
-        for match in matches:
-            results.append({
-                "name": match.name,
-                "path": str(match),
-                "type": "directory" if match.is_dir() else "file",
-            })
-        
-        return json.dumps({
-            "directory": str(dir_path),
-            "pattern": pattern,
-            "matches": results,
-            "count": len(results),
-        }, indent=2)
+        started = content_index.refresh()
+        if wait:
+            await asyncio.to_thread(content_index.wait)
+
+        return encode_result({
+            "started": started,
+            **await asyncio.to_thread(content_index.stats),
+        })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
 # =============================================================================
@@ -820,7 +4451,103 @@ async def filesystem_search(
 # =============================================================================
 
 
-@mcp.tool()
+def _build_custom_api_headers() -> dict[str, str]:
+    headers = {
+        "Content-Type": "application/json",
+        **CUSTOM_API_CONFIG["headers"],
+    }
+
+    if CUSTOM_API_CONFIG["api_key"]:
+        headers["Authorization"] = f"Bearer {CUSTOM_API_CONFIG['api_key']}"
+
+    return headers
+
+
+CUSTOM_API_HEADERS = _build_custom_api_headers()
+# HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 without it.
+CUSTOM_API_HTTP2 = CUSTOM_API_CONFIG["http2"] and importlib.util.find_spec("h2") is not None
+
+_custom_api_client: Any = None
+_custom_api_client_loop: asyncio.AbstractEventLoop | None = None
+_custom_api_client_closer: asyncio.Task | None = None
+
+
+async def _close_custom_api_client_on_shutdown(client: Any) -> None:
+    """Wait until the event loop shuts down, then close ``client`` on it.
+
+    ``asyncio.run`` cancels outstanding tasks before closing the loop, so the
+    client's connections are released while their transports still work.
+    """
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await client.aclose()
+
+
+async def _close_replaced_custom_api_client(
+    client: Any, loop: asyncio.AbstractEventLoop | None
+) -> None:
+    """Close a client that belonged to a previous event loop."""
+    if client.is_closed or loop is None or loop.is_closed():
+        # Closed by its loop's shutdown, or nothing left to close it with.
+        return
+    if loop.is_running():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        return
+    try:
+        await client.aclose()
+    except RuntimeError:
+        pass
+
+
+async def _get_custom_api_client():
+    """Return the shared keep-alive client, bound to the running event loop."""
+    global _custom_api_client, _custom_api_client_loop, _custom_api_client_closer
+    import httpx
+
+    loop = asyncio.get_running_loop()
+    if _custom_api_client is None or _custom_api_client_loop is not loop:
+        previous, previous_loop = _custom_api_client, _custom_api_client_loop
+        _custom_api_client = httpx.AsyncClient(
+            headers=CUSTOM_API_HEADERS,
+            http2=CUSTOM_API_HTTP2,
+            timeout=httpx.Timeout(
+                CUSTOM_API_CONFIG["timeout"],
+                connect=CUSTOM_API_CONFIG["connect_timeout"],
+            ),
+            limits=httpx.Limits(
+                max_connections=CUSTOM_API_CONFIG["max_connections"],
+                max_keepalive_connections=CUSTOM_API_CONFIG["max_keepalive_connections"],
+                keepalive_expiry=CUSTOM_API_CONFIG["keepalive_expiry"],
+            ),
+        )
+        _custom_api_client_loop = loop
+        # The loop holds tasks weakly; keep the closer referenced.
+        _custom_api_client_closer = loop.create_task(
+            _close_custom_api_client_on_shutdown(_custom_api_client)
+        )
+        if previous is not None:
+            await _close_replaced_custom_api_client(previous, previous_loop)
+    return _custom_api_client
+
+
+def _close_custom_api_client() -> None:
+    """Close the shared client at exit if its loop did not already close it."""
+    client, loop = _custom_api_client, _custom_api_client_loop
+    if client is None or client.is_closed or loop is None or loop.is_closed():
+        return
+    if not loop.is_running():
+        loop.run_until_complete(client.aclose())
+
+
+atexit.register(_close_custom_api_client)
+
+
+def _custom_api_url(endpoint: str) -> str:
+    return f"{CUSTOM_API_CONFIG['base_url'].rstrip('/')}/{endpoint.lstrip('/')}"
+
+
+@group_tool("custom_api")
 async def custom_api_get(endpoint: str, params: str = "{}") -> str:
     """Make a GET request to a custom API.
     
@@ -832,32 +4559,26 @@ async def custom_api_get(endpoint: str, params: str = "{}") -> str:
         JSON string containing API response
     """
     if not CUSTOM_API_CONFIG["base_url"]:
-        return json.dumps({"error": "CUSTOM_API_URL not configured"})
+        return encode_result({"error": "CUSTOM_API_URL not configured"})
     
     try:
-        headers = {
-            "Content-Type": "application/json",
-            **CUSTOM_API_CONFIG["headers"],
-        }
-        
-        if CUSTOM_API_CONFIG["api_key"]:
-            headers["Authorization"] = f"Bearer {CUSTOM_API_CONFIG['api_key']}"
-        
-        url = f"{CUSTOM_API_CONFIG['base_url'].rstrip('/')}/{endpoint.lstrip('/')}"
         query_params = json.loads(params)
         
-        response = requests.get(url, headers=headers, params=query_params, timeout=30)
+        client = await _get_custom_api_client()
+        response = await client.get(
+            _custom_api_url(endpoint), params=query_params
+        )
         response.raise_for_status()
         
-        return json.dumps({
+        return encode_result({
             "status_code": response.status_code,
             "data": response.json() if response.content else None,
-        }, indent=2)
+        })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
-@mcp.tool()
+@group_tool("custom_api")
 async def custom_api_post(endpoint: str, body: str = "{}") -> str:
     """Make a POST request to a custom API.
     
@@ -869,32 +4590,26 @@ async def custom_api_post(endpoint: str, body: str = "{}") -> str:
         JSON string containing API response
     """
     if not CUSTOM_API_CONFIG["base_url"]:
-        return json.dumps({"error": "CUSTOM_API_URL not configured"})
+        return encode_result({"error": "CUSTOM_API_URL not configured"})
     
     try:
-        headers = {
-            "Content-Type": "application/json",
-            **CUSTOM_API_CONFIG["headers"],
-        }
-        
-        if CUSTOM_API_CONFIG["api_key"]:
-            headers["Authorization"] = f"Bearer {CUSTOM_API_CONFIG['api_key']}"
-        
-        url = f"{CUSTOM_API_CONFIG['base_url'].rstrip('/')}/{endpoint.lstrip('/')}"
         request_body = json.loads(body)
         
-        response = requests.post(url, headers=headers, json=request_body, timeout=30)
+        client = await _get_custom_api_client()
+        response = await client.post(
+            _custom_api_url(endpoint), json=request_body
+        )
         response.raise_for_status()
         
-        return json.dumps({
+        return encode_result({
             "status_code": response.status_code,
             "data": response.json() if response.content else None,
-        }, indent=2)
+        })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
-@mcp.tool()
+@group_tool("custom_api")
 async def custom_api_put(endpoint: str, body: str = "{}") -> str:
     """Make a PUT request to a custom API.
     
@@ -906,32 +4621,26 @@ async def custom_api_put(endpoint: str, body: str = "{}") -> str:
         JSON string containing API response
     """
     if not CUSTOM_API_CONFIG["base_url"]:
-        return json.dumps({"error": "CUSTOM_API_URL not configured"})
+        return encode_result({"error": "CUSTOM_API_URL not configured"})
     
     try:
-        headers = {
-            "Content-Type": "application/json",
-            **CUSTOM_API_CONFIG["headers"],
-        }
-        
-        if CUSTOM_API_CONFIG["api_key"]:
-            headers["Authorization"] = f"Bearer {CUSTOM_API_CONFIG['api_key']}"
-        
-        url = f"{CUSTOM_API_CONFIG['base_url'].rstrip('/')}/{endpoint.lstrip('/')}"
         request_body = json.loads(body)
         
-        response = requests.put(url, headers=headers, json=request_body, timeout=30)
+        client = await _get_custom_api_client()
+        response = await client.put(
+            _custom_api_url(endpoint), json=request_body
+        )
         response.raise_for_status()
         
-        return json.dumps({
+        return encode_result({
             "status_code": response.status_code,
             "data": response.json() if response.content else None,
-        }, indent=2)
+        })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
-@mcp.tool()
+@group_tool("custom_api")
 async def custom_api_delete(endpoint: str) -> str:
     """Make a DELETE request to a custom API.
     
@@ -942,28 +4651,19 @@ async def custom_api_delete(endpoint: str) -> str:
         JSON string containing API response
     """
     if not CUSTOM_API_CONFIG["base_url"]:
-        return json.dumps({"error": "CUSTOM_API_URL not configured"})
+        return encode_result({"error": "CUSTOM_API_URL not configured"})
     
     try:
-        headers = {
-            "Content-Type": "application/json",
-            **CUSTOM_API_CONFIG["headers"],
-        }
-        
-        if CUSTOM_API_CONFIG["api_key"]:
-            headers["Authorization"] = f"Bearer {CUSTOM_API_CONFIG['api_key']}"
-        
-        url = f"{CUSTOM_API_CONFIG['base_url'].rstrip('/')}/{endpoint.lstrip('/')}"
-        
-        response = requests.delete(url, headers=headers, timeout=30)
+        client = await _get_custom_api_client()
+        response = await client.delete(_custom_api_url(endpoint))
         response.raise_for_status()
         
-        return json.dumps({
+        return encode_result({
             "status_code": response.status_code,
             "message": "Resource deleted successfully",
-        }, indent=2)
+        })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
 # =============================================================================
@@ -971,7 +4671,9 @@ async def custom_api_delete(endpoint: str) -> str:
 # =============================================================================
 
 
-def _get_git_repo(repo_path: str) -> Repo:
+@contextmanager
+def _get_git_repo(repo_path: str) -> Iterator["Repo"]:
+    """Check out a pooled ``Repo`` for a repository under the base path."""
     base_path = Path(LOCAL_GIT_CONFIG["base_path"])
     full_path = (base_path / repo_path).resolve()
     
@@ -984,10 +4686,12 @@ def _get_git_repo(repo_path: str) -> Repo:
     if not (full_path / ".git").exists():
         raise ValueError(f"Not a git repository: {repo_path}")
     
-    return Repo(full_path)
+    with git_repos.checkout(full_path) as repo:
+        commit_graphs.track(repo)
+        yield repo
 
 
-@mcp.tool()
+@group_tool("git")
 async def git_list_repos() -> str:
     """List available local git repositories.
     
@@ -998,7 +4702,7 @@ async def git_list_repos() -> str:
         base_path = Path(LOCAL_GIT_CONFIG["base_path"]).resolve()
         
         if not base_path.exists():
-            return json.dumps({"error": "Base path not configured or does not exist"})
+            return encode_result({"error": "Base path not configured or does not exist"})
         
         repos = []
         for item in base_path.iterdir():
@@ -1008,16 +4712,16 @@ async def git_list_repos() -> str:
                     "path": str(item.relative_to(base_path)),
                 })
         
-        return json.dumps({
+        return encode_result({
             "base_path": str(base_path),
             "repositories": repos,
             "count": len(repos),
-        }, indent=2)
+        })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
-@mcp.tool()
+@group_tool("git")
 async def git_list_branches(repo_path: str) -> str:
     """List branches in a local git repository.
     
@@ -1028,69 +4732,321 @@ async def git_list_branches(repo_path: str) -> str:
         JSON string containing list of branches
     """
     try:
-        repo = _get_git_repo(repo_path)
-        
-        branches = {
-            "current": repo.active_branch.name,
-            "local": [b.name for b in repo.branches],
-            "remote": [r.name for r in repo.remote().refs] if repo.remotes else [],
-        }
-        
-        return json.dumps(branches, indent=2)
+        with _get_git_repo(repo_path) as repo:
+            branches = {
+                "current": repo.active_branch.name,
+                "local": [b.name for b in repo.branches],
+                "remote": [r.name for r in repo.remote().refs] if repo.remotes else [],
+            }
+
+            return encode_result(branches)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
+
+
+_UNTRACKED_MODES = ("no", "normal", "all")
+
+
+def _parse_status_v2(output: str) -> dict:
+    """Parse ``git status --porcelain=v2 --branch -z`` output."""
+    result = {
+        "branch": None,
+        "detached": False,
+        "head": None,
+        "upstream": None,
+        "ahead": None,
+        "behind": None,
+        "staged": [],
+        "modified": [],
+        "renamed": [],
+        "conflicts": [],
+        "untracked": [],
+    }
+    tokens = iter(output.split("\0"))
+    for token in tokens:
+        if not token:
+            continue
+        kind = token[0]
+        if kind == "#":
+            _, key, value = token.split(" ", 2)
+            if key == "branch.oid":
+                result["head"] = None if value == "(initial)" else value
+            elif key == "branch.head":
+                result["detached"] = value == "(detached)"
+                result["branch"] = "HEAD" if result["detached"] else value
+            elif key == "branch.upstream":
+                result["upstream"] = value
+            elif key == "branch.ab":
+                ahead, behind = value.split(" ")
+                result["ahead"] = int(ahead)
+                result["behind"] = -int(behind)
+        elif kind == "1":
+            fields = token.split(" ", 8)
+            _add_status_entry(result, fields[1], fields[8])
+        elif kind == "2":
+            # The original path follows the record as its own NUL-terminated field.
+            fields = token.split(" ", 9)
+            path = fields[9]
+            _add_status_entry(result, fields[1], path)
+            result["renamed"].append({
+                "path": path,
+                "old_path": next(tokens),
+                "kind": "copied" if fields[8][0] == "C" else "renamed",
+                "score": int(fields[8][1:]),
+            })
+        elif kind == "u":
+            fields = token.split(" ", 10)
+            result["conflicts"].append({"path": fields[10], "status": fields[1]})
+        elif kind == "?":
+            result["untracked"].append(token[2:])
 
+    result["is_dirty"] = bool(result["staged"] or result["modified"] or result["conflicts"])
+    return result
 
-@mcp.tool()
-async def git_get_status(repo_path: str) -> str:
+
+def _add_status_entry(result: dict, xy: str, path: str) -> None:
+    if xy[0] != ".":
+        result["staged"].append(path)
+    if xy[1] != ".":
+        result["modified"].append(path)
+
+
+@group_tool("git")
+async def git_get_status(
+    repo_path: str,
+    untracked_files: str = "normal",
+    untracked_cache: bool | None = None,
+    fsmonitor: bool | None = None,
+) -> str:
     """Get working tree status of a local git repository.
     
+    Runs a single ``git status --porcelain=v2`` pass. On very large checkouts,
+    skip untracked files or enable the untracked cache and fsmonitor to avoid
+    rescanning the whole tree.
+
     Args:
         repo_path: Relative path to the repository
+        untracked_files: "no", "normal" or "all" (individual files in untracked
+            directories)
+        untracked_cache: Use git's untracked cache (default: LOCAL_GIT_STATUS_UNTRACKED_CACHE)
+        fsmonitor: Ask the filesystem monitor for changed paths
+            (default: LOCAL_GIT_STATUS_FSMONITOR)
     
     Returns:
-        JSON string containing modified, staged, and untracked files
+        JSON string containing branch tracking info and staged, modified,
+        renamed, conflicted and untracked files
     """
     try:
-        repo = _get_git_repo(repo_path)
-        
-        status = repo.git.status("--porcelain")
-        
-        modified = []
-        staged = []
-        untracked = []
+        if untracked_files not in _UNTRACKED_MODES:
+            raise ValueError(f"untracked_files must be one of {', '.join(_UNTRACKED_MODES)}")
+        if untracked_cache is None:
+            untracked_cache = LOCAL_GIT_CONFIG["status_untracked_cache"]
+        if fsmonitor is None:
+            fsmonitor = LOCAL_GIT_CONFIG["status_fsmonitor"]
         
-        for line in status.split("\n"):
-            if not line:
-                continue
-            index_status = line[0]
-            worktree_status = line[1]
-            file_path = line[3:] if len(line) > 3 else line[2:]
-            
-            if worktree_status == "?":
-                untracked.append(file_path)
-            elif index_status in ("M", "A", "D"):
-                staged.append(file_path)
-            elif worktree_status == "M":
-                modified.append(file_path)
-        
-        return json.dumps({
-            "repo": repo_path,
-            "branch": repo.active_branch.name,
-            "is_dirty": repo.is_dirty(),
-            "modified": modified,
-            "staged": staged,
-            "untracked": untracked,
-        }, indent=2)
+        with _get_git_repo(repo_path) as repo:
+            # Per-call -c options go on the command line rather than through
+            # repo.git(c=...), which would leave state on the pooled handle.
+            command = [repo.git.GIT_PYTHON_GIT_EXECUTABLE]
+            if untracked_cache:
+                command.extend(["-c", "core.untrackedCache=true"])
+            if fsmonitor:
+                command.extend(["-c", "core.fsmonitor=true"])
+            command.extend([
+                "status", "--porcelain=v2", "--branch", "-z", f"--untracked-files={untracked_files}",
+            ])
+
+            output = await asyncio.to_thread(repo.git.execute, command, strip_newline_in_stdout=False)
+
+            return encode_result({"repo": repo_path, **_parse_status_v2(output)})
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
+
+
+_GIT_LOG_FORMAT = "%x1e%H%x1f%P%x1f%an%x1f%ae%x1f%at%x1f%ct%x1f%B"
+
+
+def _git_records(stream, separator: bytes = b"\x1e"):
+    """Yield separator-delimited records from a git output stream as it arrives."""
+    buffer = b""
+    while True:
+        chunk = stream.read1(65536) if hasattr(stream, "read1") else stream.read(65536)
+        if not chunk:
+            break
+        buffer += chunk
+        *records, buffer = buffer.split(separator)
+        for record in records:
+            if record:
+                yield record
+    if buffer.strip():
+        yield buffer
+
+
+def _encode_log_cursor(frontier: list[str], first_parent: bool) -> str:
+    payload = {"frontier": frontier, "first_parent": first_parent}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def _decode_log_cursor(cursor: str, first_parent: bool) -> list[str]:
+    payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    if payload["first_parent"] != first_parent:
+        raise ValueError("cursor does not match first_parent")
+    return payload["frontier"]
+
+
+def _git_log_commit(fields: list[str], first_parent: bool) -> dict:
+    sha, parent_list, name, email, authored, committed, message = fields
+    parents = parent_list.split()
+    if first_parent:
+        parents = parents[:1]
+    return {
+        "sha": sha[:7],
+        "full_sha": sha,
+        "message": message.strip(),
+        "author": name,
+        "author_email": email,
+        "authored_date": datetime.fromtimestamp(int(authored)).isoformat(),
+        "committed_date": datetime.fromtimestamp(int(committed)).isoformat(),
+        "parents": [parent[:7] for parent in parents],
+    }
 
 
-@mcp.tool()
+def _git_log_frontier(
+    repo, walk: list[str], pending: set[str], stop: str, first_parent: bool
+) -> list[str] | None:
+    """Return the frontier of the unfiltered walk just before it reaches ``stop``.
+
+    Only ``rev-list --parents`` output is read, so this costs one line per
+    commit between the page's tips and ``stop``.
+    """
+    walked: set[str] = set()
+    proc = repo.git.rev_list("--parents", *walk, as_process=True)
+    try:
+        for record in _git_records(proc.proc.stdout, b"\n"):
+            sha, *parents = record.decode("ascii").split()
+            if sha == stop:
+                return sorted(pending | {sha})
+            if first_parent:
+                parents = parents[:1]
+            walked.add(sha)
+            pending.discard(sha)
+            pending.update(parent for parent in parents if parent not in walked)
+    finally:
+        proc.proc.kill()
+        proc.proc.wait()
+    return None
+
+
+def _git_log_page(
+    repo,
+    revision: str,
+    max_count: int,
+    skip: int,
+    cursor: str | None,
+    paths: list[str] | None,
+    author: str | None,
+    since: str | None,
+    until: str | None,
+    first_parent: bool,
+) -> tuple[list[dict], str | None]:
+    """Read one page of ``git log`` from a single streaming process.
+
+    The walk is resumed from a cursor holding its frontier: the parents of
+    walked commits that have not been walked yet. Starting a new walk from
+    that set continues the same date-ordered traversal, so a page costs the
+    same no matter how deep into the history it is.
+
+    Author and until filters are applied by git, which then prints only the
+    page and one commit past it. Commits git hides do not show up to advance
+    the frontier, so when there is a next page the frontier is found by an
+    unfiltered ``rev-list`` walk up to that commit.
+    """
+    tips = _decode_log_cursor(cursor, first_parent) if cursor else [revision]
+    # Options shared by the page and the frontier walk, so both traverse
+    # history in the same order.
+    options = []
+    if first_parent:
+        options.append("--first-parent")
+    if paths:
+        # Report rewritten parents so the frontier follows the simplified history.
+        options.append("--parents")
+    if since:
+        options.append(f"--since={since}")
+    revisions = [*tips, "--", *paths] if paths else tips
+    # Cursor tips are commits git will show; a tip nothing else reaches
+    # must survive into the next cursor until it is walked.
+    pending: set[str] = set(tips) if cursor else set()
+
+    if author or until:
+        filters = [f"--skip={skip}", f"--max-count={max_count + 1}"]
+        if author:
+            filters.extend(["--extended-regexp", f"--author={author}"])
+        if until:
+            filters.append(f"--until={until}")
+        output = repo.git.log(
+            "--no-color", f"--format={_GIT_LOG_FORMAT}", *options, *filters, *revisions,
+            strip_newline_in_stdout=False,
+        )
+        records = [
+            record.split("\x1f", 6) for record in output.split("\x1e") if record.strip()
+        ]
+        commits = [_git_log_commit(fields, first_parent) for fields in records[:max_count]]
+        if len(records) <= max_count:
+            return commits, None
+        frontier = _git_log_frontier(
+            repo, [*options, *revisions], pending, records[-1][0], first_parent
+        )
+        if frontier is None:
+            return commits, None
+        return commits, _encode_log_cursor(frontier, first_parent)
+
+    commits: list[dict] = []
+    walked: set[str] = set()
+    frontier: list[str] | None = None
+    proc = repo.git.log(
+        "--no-color", f"--format={_GIT_LOG_FORMAT}", *options, *revisions, as_process=True
+    )
+    try:
+        for record in _git_records(proc.proc.stdout):
+            fields = record.decode("utf-8", errors="replace").split("\x1f", 6)
+            sha = fields[0]
+            parents = fields[1].split()
+            if first_parent:
+                parents = parents[:1]
+
+            if skip > 0:
+                skip -= 1
+            elif len(commits) == max_count:
+                # One more commit exists: the page ends just before it.
+                frontier = sorted(pending | {sha})
+                break
+            else:
+                commits.append(_git_log_commit(fields, first_parent))
+
+            walked.add(sha)
+            pending.discard(sha)
+            pending.update(parent for parent in parents if parent not in walked)
+    finally:
+        proc.proc.kill()
+        proc.proc.wait()
+
+    if frontier is None:
+        return commits, None
+    return commits, _encode_log_cursor(frontier, first_parent)
+
+
+@group_tool("git")
 async def git_get_log(
     repo_path: str,
     max_count: int = 10,
     branch: str | None = None,
+    skip: int = 0,
+    cursor: str | None = None,
+    paths: list[str] | None = None,
+    author: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    first_parent: bool = False,
 ) -> str:
     """Get commit history from a local git repository.
     
@@ -1098,75 +5054,379 @@ async def git_get_log(
         repo_path: Relative path to the repository
         max_count: Maximum number of commits to return (default 10)
         branch: Branch name to get log from (optional, defaults to current branch)
+        skip: Number of matching commits to skip first (cost grows with skip)
+        cursor: next_cursor from a previous page; resumes the walk where it
+            stopped (pass the same filters again)
+        paths: Only commits touching these paths (git pathspecs)
+        author: Regular expression (git extended syntax) matched against
+            the author's "Name <email>"
+        since: Only commits committed after this date (any date git accepts,
+            e.g. ISO 8601 or "2 weeks ago")
+        until: Only commits committed before this date (same formats as since)
+        first_parent: Follow only the first parent of merge commits
     
     Returns:
-        JSON string containing commit history
+        JSON string containing commit history. has_more and next_cursor are
+        set when further commits match.
     """
     try:
-        repo = _get_git_repo(repo_path)
-        
-        if branch:
-            commit_range = branch
-        else:
-            commit_range = repo.active_branch.name
-        
-        commits = list(repo.iter_commits(commit_range, max_count=max_count))
-        
-        result = []
-        for commit in commits:
-            result.append({
-                "sha": commit.hexsha[:7],
-                "full_sha": commit.hexsha,
-                "message": commit.message.strip(),
-                "author": str(commit.author),
-                "author_email": commit.author.email,
-                "committed_date": datetime.fromtimestamp(commit.committed_date).isoformat(),
-                "parents": [p.hexsha[:7] for p in commit.parents],
+        with _get_git_repo(repo_path) as repo:
+            if branch:
+                revision = branch
+            else:
+                revision = "HEAD" if repo.head.is_detached else repo.active_branch.name
+
+            commits, next_cursor = await asyncio.to_thread(
+                _git_log_page, repo, revision, max(1, max_count), max(0, skip),
+                cursor, paths, author, since, until, first_parent,
+            )
+
+            return encode_result({
+                "repo": repo_path,
+                "branch": revision,
+                "commits": commits,
+                "count": len(commits),
+                "has_more": next_cursor is not None,
+                "next_cursor": next_cursor,
             })
-        
-        return json.dumps({
-            "repo": repo_path,
-            "branch": branch or repo.active_branch.name,
-            "commits": result,
-            "count": len(result),
-        }, indent=2)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
+
+
+_DIFF_STATUSES = {
+    "A": "added",
+    "C": "copied",
+    "D": "deleted",
+    "M": "modified",
+    "R": "renamed",
+    "T": "type_changed",
+    "U": "unmerged",
+}
+
+
+def _diff_tree_args(commit, detect_renames: bool, rename_limit: int) -> list[str]:
+    """Build ``git diff-tree`` arguments comparing a commit with its first parent."""
+    args = ["-r", "--no-commit-id"]
+    if detect_renames:
+        args.extend(["-M", f"-l{rename_limit}"])
+    if commit.parents:
+        args.extend([commit.parents[0].hexsha, commit.hexsha])
+    else:
+        args.extend(["--root", commit.hexsha])
+    return args
+
+
+def _diff_files(repo, commit, detect_renames: bool, rename_limit: int) -> list[dict]:
+    """List changed files with status and line counts from one diff-tree pass.
+
+    ``--raw --numstat -z`` prints every raw record followed by every numstat
+    record, in the same order, so the two are zipped positionally.
+    """
+    args = _diff_tree_args(commit, detect_renames, rename_limit)
+    output = repo.git.diff_tree("-z", "--raw", "--numstat", *args)
+    tokens = iter(output.split("\0"))
+
+    files = []
+    counts = []
+    for token in tokens:
+        if not token:
+            continue
+        if token.startswith(":"):
+            old_mode, new_mode, _, _, status = token[1:].split(" ")
+            entry = {"status": _DIFF_STATUSES.get(status[0], status[0]), "path": next(tokens)}
+            if status[0] in "RC":
+                entry["old_path"] = entry["path"]
+                entry["path"] = next(tokens)
+                entry["similarity"] = int(status[1:])
+            if old_mode != new_mode and "000000" not in (old_mode, new_mode):
+                entry["old_mode"] = old_mode
+                entry["new_mode"] = new_mode
+            files.append(entry)
+        else:
+            additions, deletions, path = token.split("\t", 2)
+            if not path:
+                # Renamed or copied: the old and new paths follow as separate fields.
+                next(tokens)
+                next(tokens)
+            counts.append((additions, deletions))
+
+    for entry, (additions, deletions) in zip(files, counts):
+        entry["binary"] = additions == "-"
+        entry["additions"] = None if entry["binary"] else int(additions)
+        entry["deletions"] = None if entry["binary"] else int(deletions)
+    return files
+
+
+_GIT_QUOTE_ESCAPES = {
+    ord("a"): 7, ord("b"): 8, ord("t"): 9, ord("n"): 10,
+    ord("v"): 11, ord("f"): 12, ord("r"): 13, ord('"'): 34, ord("\\"): 92,
+}
+
+
+def _git_path_token(text: bytes) -> tuple[str, bytes]:
+    """Split one path off ``text``, undoing git's C-style quoting.
+
+    Returns the path and the remaining bytes. An unquoted path runs to the
+    end of ``text``.
+    """
+    if not text.startswith(b'"'):
+        return text.decode("utf-8", errors="replace"), b""
+    out = bytearray()
+    index = 1
+    while text[index] != ord('"'):
+        byte = text[index]
+        if byte == ord("\\"):
+            escape = text[index + 1]
+            if ord("0") <= escape <= ord("7"):
+                out.append(int(text[index + 1:index + 4], 8))
+                index += 4
+                continue
+            out.append(_GIT_QUOTE_ESCAPES[escape])
+            index += 2
+            continue
+        out.append(byte)
+        index += 1
+    return out.decode("utf-8", errors="replace"), text[index + 1:].lstrip(b" ")
+
+
+def _patch_paths(header: list[bytes]) -> tuple[str, str] | None:
+    """Return the (old, new) paths a patch section applies to.
+
+    Renames and copies name their paths on ``rename from``/``rename to``
+    lines; otherwise both sides of the ``diff --git a/X b/X`` line are equal.
+    """
+    old = new = None
+    for line in header[1:]:
+        line = line.rstrip(b"\n")
+        for prefix in (b"rename from ", b"copy from "):
+            if line.startswith(prefix):
+                old = _git_path_token(line[len(prefix):])[0]
+        for prefix in (b"rename to ", b"copy to "):
+            if line.startswith(prefix):
+                new = _git_path_token(line[len(prefix):])[0]
+    if old is not None and new is not None:
+        return old, new
+
+    rest = header[0][len(b"diff --git "):].rstrip(b"\n")
+    if rest.startswith(b'"'):
+        path = _git_path_token(rest)[0][2:]
+        return path, path
+    # Unquoted: "a/X b/X" with both halves equal, even if X contains spaces.
+    half = (len(rest) - 5) // 2
+    path = rest[2:2 + half]
+    if rest != b"a/" + path + b" b/" + path:
+        return None
+    path = path.decode("utf-8", errors="replace")
+    return path, path
+
+
+def _stream_patches(
+    repo,
+    commit,
+    paths: list[str],
+    detect_renames: bool,
+    rename_limit: int,
+    max_file_bytes: int,
+    budget: list[int],
+    patches: dict,
+) -> bool:
+    """Collect capped patch sections for ``paths`` into ``patches``.
+
+    ``patches`` maps (old, new) paths to ``[text, clipped]``. ``budget`` holds
+    the remaining total byte allowance and is shared across calls. Returns
+    True if the budget ran out.
+    """
+    args = _diff_tree_args(commit, detect_renames, rename_limit)
+    proc = repo.git.diff_tree(
+        "-p", "--no-color", "--no-ext-diff", "--src-prefix=a/", "--dst-prefix=b/",
+        *args, "--", *paths,
+        as_process=True, env={"GIT_LITERAL_PATHSPECS": "1"},
+    )
+
+    # Each section: header lines (kept whole for path matching), capped patch
+    # bytes, and whether the patch was clipped.
+    sections: list[list] = []
+    in_header = False
+    truncated = False
+    try:
+        for line in proc.proc.stdout:
+            if line.startswith(b"diff --git "):
+                sections.append([[], bytearray(), False])
+                in_header = True
+            if not sections:
+                continue
+            section = sections[-1]
+            if in_header and line.startswith((b"--- ", b"@@", b"Binary files ")):
+                in_header = False
+            if in_header:
+                section[0].append(line)
+            room = min(max_file_bytes - len(section[1]), budget[0])
+            if len(line) > room:
+                section[2] = True
+                line = line[:max(0, room)]
+            section[1] += line
+            budget[0] -= len(line)
+            if budget[0] <= 0:
+                truncated = True
+                break
+    finally:
+        proc.proc.kill()
+        proc.proc.wait()
+
+    for header, patch, clipped in sections:
+        key = _patch_paths(header)
+        if key is None:
+            continue
+        # A type change is printed as a deletion and an addition of the same path.
+        if key in patches:
+            patches[key][0] += patch
+            patches[key][1] = patches[key][1] or clipped
+        else:
+            patches[key] = [patch, clipped]
+    return truncated
+
+
+def _diff_patches(
+    repo,
+    commit,
+    files: list[dict],
+    detect_renames: bool,
+    rename_limit: int,
+    max_file_bytes: int,
+    max_total_bytes: int,
+) -> bool:
+    """Attach capped patch text to ``files``; return True if the total cap was hit.
+
+    Only the given files are diffed, and each patch is matched to its file by
+    the paths in its header. Rename detection is limited to the files the
+    listing reported as renamed, so a subset diff cannot pair files that the
+    full diff left as separate additions and deletions. Files without a
+    matching patch get ``patch: null``.
+    """
+    renamed = [entry for entry in files if "old_path" in entry]
+    others = [entry for entry in files if "old_path" not in entry]
+    budget = [max_total_bytes]
+    patches: dict[tuple[str, str], list] = {}
+    truncated = False
+    for group, renames in ((renamed, True), (others, False)):
+        if not group or truncated:
+            continue
+        paths = []
+        for entry in group:
+            if "old_path" in entry:
+                paths.append(entry["old_path"])
+            paths.append(entry["path"])
+        truncated = _stream_patches(
+            repo, commit, paths, renames, rename_limit, max_file_bytes, budget, patches
+        )
+
+    for entry in files:
+        match = patches.get((entry.get("old_path", entry["path"]), entry["path"]))
+        if match is None:
+            entry["patch"] = None
+            entry["patch_truncated"] = truncated
+        else:
+            entry["patch"] = bytes(match[0]).decode("utf-8", errors="replace")
+            entry["patch_truncated"] = match[1]
+    return truncated
+
+
+def _show_commit(
+    repo,
+    sha: str,
+    include_patch: bool,
+    detect_renames: bool,
+    rename_limit: int,
+    file_offset: int,
+    max_files: int,
+    max_file_bytes: int,
+    max_patch_bytes: int,
+) -> dict:
+    commit = repo.commit(sha)
+    files = _diff_files(repo, commit, detect_renames, rename_limit)
+    page = files[file_offset:file_offset + max_files]
+
+    patch_truncated = False
+    if include_patch and page:
+        patch_truncated = _diff_patches(
+            repo, commit, page, detect_renames, rename_limit, max_file_bytes, max_patch_bytes
+        )
+
+    next_offset = file_offset + len(page)
+    return {
+        "sha": commit.hexsha[:7],
+        "full_sha": commit.hexsha,
+        "message": commit.message.strip(),
+        "author": str(commit.author),
+        "author_email": commit.author.email,
+        "committed_date": datetime.fromtimestamp(commit.committed_date).isoformat(),
+        "parents": [p.hexsha[:7] for p in commit.parents],
+        "stats": {
+            "files": len(files),
+            "additions": sum(f["additions"] or 0 for f in files),
+            "deletions": sum(f["deletions"] or 0 for f in files),
+        },
+        "files": page,
+        "patch_truncated": patch_truncated,
+        "next_file_offset": next_offset if next_offset < len(files) else None,
+    }
 
 
-@mcp.tool()
-async def git_show_commit(repo_path: str, sha: str) -> str:
+@group_tool("git")
+async def git_show_commit(
+    repo_path: str,
+    sha: str,
+    include_patch: bool = False,
+    detect_renames: bool = True,
+    rename_limit: int | None = None,
+    file_offset: int = 0,
+    max_files: int = 100,
+    max_file_bytes: int | None = None,
+    max_patch_bytes: int | None = None,
+) -> str:
     """Show details of a specific commit.
     
+    Changed files are listed with status, rename source and line counts
+    against the first parent. Without include_patch only ``--numstat`` data
+    is computed.
+
     Args:
         repo_path: Relative path to the repository
         sha: Commit SHA (full or short)
+        include_patch: Include unified diff text for the returned files
+        detect_renames: Pair deleted and added files into renames
+        rename_limit: Maximum files considered for rename detection
+            (default: LOCAL_GIT_RENAME_LIMIT)
+        file_offset: Index of the first changed file to return
+        max_files: Maximum number of changed files to return (default 100)
+        max_file_bytes: Patch bytes kept per file (default: LOCAL_GIT_DIFF_FILE_MAX_BYTES)
+        max_patch_bytes: Patch bytes kept in total (default: LOCAL_GIT_DIFF_MAX_BYTES)
     
     Returns:
-        JSON string containing commit details
+        JSON string containing commit details, per-file changes and
+        next_file_offset when more files remain
     """
     try:
-        repo = _get_git_repo(repo_path)
-        
-        commit = repo.commit(sha)
-        
-        result = {
-            "sha": commit.hexsha[:7],
-            "full_sha": commit.hexsha,
-            "message": commit.message.strip(),
-            "author": str(commit.author),
-            "author_email": commit.author.email,
-            "committed_date": datetime.fromtimestamp(commit.committed_date).isoformat(),
-            "parents": [p.hexsha[:7] for p in commit.parents],
-            "diff": commit.diff(commit.parents[0]).__str__() if commit.parents else "Initial commit",
-        }
-        
-        return json.dumps(result, indent=2)
+        with _get_git_repo(repo_path) as repo:
+            result = await asyncio.to_thread(
+                _show_commit,
+                repo,
+                sha,
+                include_patch,
+                detect_renames,
+                rename_limit if rename_limit is not None else LOCAL_GIT_CONFIG["rename_limit"],
+                max(0, file_offset),
+                max(1, max_files),
+                max_file_bytes or LOCAL_GIT_CONFIG["diff_file_max_bytes"],
+                max_patch_bytes or LOCAL_GIT_CONFIG["diff_max_bytes"],
+            )
+
+            return encode_result(result)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
-@mcp.tool()
+@group_tool("git")
 async def git_list_tags(repo_path: str) -> str:
     """List tags in a local git repository.
     
@@ -1177,25 +5437,24 @@ async def git_list_tags(repo_path: str) -> str:
         JSON string containing list of tags
     """
     try:
-        repo = _get_git_repo(repo_path)
-        
-        tags = []
-        for tag in repo.tags:
-            tags.append({
-                "name": tag.name,
-                "commit": tag.commit.hexsha[:7] if tag.commit else None,
+        with _get_git_repo(repo_path) as repo:
+            tags = []
+            for tag in repo.tags:
+                tags.append({
+                    "name": tag.name,
+                    "commit": tag.commit.hexsha[:7] if tag.commit else None,
+                })
+
+            return encode_result({
+                "repo": repo_path,
+                "tags": tags,
+                "count": len(tags),
             })
-        
-        return json.dumps({
-            "repo": repo_path,
-            "tags": tags,
-            "count": len(tags),
-        }, indent=2)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
-@mcp.tool()
+@group_tool("git")
 async def git_get_file_diff(repo_path: str, file_path: str, branch: str | None = None) -> str:
     """Get diff for a specific file.
     
@@ -1208,24 +5467,163 @@ async def git_get_file_diff(repo_path: str, file_path: str, branch: str | None =
         JSON string containing file diff
     """
     try:
-        repo = _get_git_repo(repo_path)
-        
-        if branch:
-            diff = repo.git.diff(branch, "--", file_path)
-        else:
-            diff = repo.git.diff("HEAD", "--", file_path)
-        
-        return json.dumps({
-            "repo": repo_path,
-            "file": file_path,
-            "branch": branch or repo.active_branch.name,
-            "diff": diff or "No changes",
-        }, indent=2)
+        with _get_git_repo(repo_path) as repo:
+            if branch:
+                diff = repo.git.diff(branch, "--", file_path)
+            else:
+                diff = repo.git.diff("HEAD", "--", file_path)
+
+            return encode_result({
+                "repo": repo_path,
+                "file": file_path,
+                "branch": branch or repo.active_branch.name,
+                "diff": diff or "No changes",
+            })
+    except Exception as e:
+        return encode_result({"error": str(e)})
+
+
+def _git_exit_status(error) -> int | None:
+    from git.exc import GitCommandError
+
+    return error.status if isinstance(error, GitCommandError) else None
+
+
+def _resolve_commits(repo, refs: list[str]) -> list[str]:
+    """Resolve refs to commit SHAs, failing with git's message for unknown ones."""
+    output = repo.git.rev_parse("--end-of-options", *[f"{ref}^{{commit}}" for ref in refs], "--")
+    # rev-parse echoes the option markers back; keep only the object names.
+    return [line for line in output.split() if not line.startswith("-")]
+
+
+@group_tool("git")
+async def git_merge_base(repo_path: str, refs: list[str], all_bases: bool = False) -> str:
+    """Find the best common ancestor of two or more commits.
+
+    Args:
+        repo_path: Relative path to the repository
+        refs: Two or more branches, tags or commit SHAs; with more than two,
+            the ancestor common to all of them is returned
+        all_bases: Return every best common ancestor instead of one
+
+    Returns:
+        JSON string containing the merge base SHAs (empty when the histories
+        are unrelated)
+    """
+    try:
+        if len(refs) < 2:
+            raise ValueError("refs must name at least two commits")
+        with _get_git_repo(repo_path) as repo:
+            def find_bases() -> list[str]:
+                shas = _resolve_commits(repo, refs)
+                args = ["--all"] if all_bases else []
+                if len(shas) > 2:
+                    args.append("--octopus")
+                try:
+                    return repo.git.merge_base(*args, *shas).split()
+                except Exception as e:
+                    # Exit status 1 without output means no common ancestor.
+                    if _git_exit_status(e) == 1:
+                        return []
+                    raise
+
+            bases = await asyncio.to_thread(find_bases)
+
+            return encode_result({
+                "repo": repo_path,
+                "refs": refs,
+                "merge_bases": [{"sha": sha[:7], "full_sha": sha} for sha in bases],
+                "count": len(bases),
+            })
+    except Exception as e:
+        return encode_result({"error": str(e)})
+
+
+@group_tool("git")
+async def git_is_ancestor(repo_path: str, ancestor: str, descendant: str) -> str:
+    """Check whether one commit is reachable from another.
+
+    Answers questions like "is this branch merged into main".
+
+    Args:
+        repo_path: Relative path to the repository
+        ancestor: Commit that may be contained in descendant's history
+        descendant: Commit whose history is searched
+
+    Returns:
+        JSON string containing is_ancestor
+    """
+    try:
+        with _get_git_repo(repo_path) as repo:
+            def check() -> bool:
+                shas = _resolve_commits(repo, [ancestor, descendant])
+                try:
+                    repo.git.merge_base("--is-ancestor", *shas)
+                    return True
+                except Exception as e:
+                    if _git_exit_status(e) == 1:
+                        return False
+                    raise
+
+            return encode_result({
+                "repo": repo_path,
+                "ancestor": ancestor,
+                "descendant": descendant,
+                "is_ancestor": await asyncio.to_thread(check),
+            })
+    except Exception as e:
+        return encode_result({"error": str(e)})
+
+
+@group_tool("git")
+async def git_count_commits(
+    repo_path: str,
+    head: str = "HEAD",
+    base: str | None = None,
+    paths: list[str] | None = None,
+    first_parent: bool = False,
+) -> str:
+    """Count commits between two refs with ``git rev-list --count``.
+
+    Args:
+        repo_path: Relative path to the repository
+        head: Commit to count from (default HEAD)
+        base: Optional commit to compare against; when given, commits only in
+            head (ahead) and only in base (behind) are counted separately
+        paths: Only count commits touching these paths
+        first_parent: Follow only the first parent of merge commits
+
+    Returns:
+        JSON string containing the commit count, plus ahead/behind when base
+        is given
+    """
+    try:
+        with _get_git_repo(repo_path) as repo:
+            args = ["--count"]
+            if first_parent:
+                args.append("--first-parent")
+            if base:
+                args.extend(["--left-right", "--end-of-options", f"{base}...{head}"])
+            else:
+                args.extend(["--end-of-options", head])
+            args.append("--")
+            args.extend(paths or [])
+
+            output = await asyncio.to_thread(repo.git.rev_list, *args)
+
+            result = {"repo": repo_path, "head": head, "base": base}
+            if base:
+                behind, ahead = (int(n) for n in output.split())
+                result.update(ahead=ahead, behind=behind, count=ahead)
+            else:
+                result["count"] = int(output)
+
+            return encode_result(result)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
-@mcp.tool()
+@group_tool("git")
 async def git_get_current_branch(repo_path: str) -> str:
     """Get current branch of a local git repository.
     
@@ -1236,17 +5634,16 @@ async def git_get_current_branch(repo_path: str) -> str:
         JSON string containing current branch name
     """
     try:
-        repo = _get_git_repo(repo_path)
-        
-        return json.dumps({
-            "repo": repo_path,
-            "branch": repo.active_branch.name,
-        }, indent=2)
+        with _get_git_repo(repo_path) as repo:
+            return encode_result({
+                "repo": repo_path,
+                "branch": repo.active_branch.name,
+            })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
-@mcp.tool()
+@group_tool("git")
 async def git_checkout_branch(repo_path: str, branch: str, create: bool = False) -> str:
     """Checkout a branch in a local git repository.
     
@@ -1259,27 +5656,26 @@ async def git_checkout_branch(repo_path: str, branch: str, create: bool = False)
         JSON string confirming the operation
     """
     try:
-        repo = _get_git_repo(repo_path)
-        
-        if create and branch not in [b.name for b in repo.branches]:
-            new_branch = repo.create_head(branch)
-            new_branch.checkout()
-            action = "created and checked out"
-        else:
-            repo.git.checkout(branch)
-            action = "checked out"
-        
-        return json.dumps({
-            "success": True,
-            "repo": repo_path,
-            "branch": branch,
-            "action": action,
-        }, indent=2)
+        with _get_git_repo(repo_path) as repo:
+            if create and branch not in [b.name for b in repo.branches]:
+                new_branch = repo.create_head(branch)
+                new_branch.checkout()
+                action = "created and checked out"
+            else:
+                repo.git.checkout(branch)
+                action = "checked out"
+
+            return encode_result({
+                "success": True,
+                "repo": repo_path,
+                "branch": branch,
+                "action": action,
+            })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
-@mcp.tool()
+@group_tool("git")
 async def git_stage_file(repo_path: str, file_path: str | None = None) -> str:
     """Stage files in a local git repository.
     
@@ -1291,26 +5687,25 @@ async def git_stage_file(repo_path: str, file_path: str | None = None) -> str:
         JSON string confirming the operation
     """
     try:
-        repo = _get_git_repo(repo_path)
-        
-        if file_path:
-            repo.git.add(file_path)
-            staged_files = [file_path]
-        else:
-            repo.git.add("--all")
-            status = repo.git.status("--porcelain")
-            staged_files = [line[3:] for line in status.split("\n") if line and line[0] in ("A", "M")]
-        
-        return json.dumps({
-            "success": True,
-            "repo": repo_path,
-            "staged": staged_files,
-        }, indent=2)
+        with _get_git_repo(repo_path) as repo:
+            if file_path:
+                repo.git.add(file_path)
+                staged_files = [file_path]
+            else:
+                repo.git.add("--all")
+                status = repo.git.status("--porcelain")
+                staged_files = [line[3:] for line in status.split("\n") if line and line[0] in ("A", "M")]
+
+            return encode_result({
+                "success": True,
+                "repo": repo_path,
+                "staged": staged_files,
+            })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
-@mcp.tool()
+@group_tool("git")
 async def git_commit(repo_path: str, message: str, author_name: str | None = None, author_email: str | None = None) -> str:
     """Commit staged changes in a local git repository.
     
@@ -1324,35 +5719,34 @@ async def git_commit(repo_path: str, message: str, author_name: str | None = Non
         JSON string containing commit details
     """
     try:
-        repo = _get_git_repo(repo_path)
-        
-        if not repo.is_dirty():
-            return json.dumps({"error": "Nothing to commit - working tree is clean"})
-        
-        if author_name or author_email:
-            env = {}
-            if author_name:
-                env["GIT_AUTHOR_NAME"] = author_name
-            if author_email:
-                env["GIT_AUTHOR_EMAIL"] = author_email
+        with _get_git_repo(repo_path) as repo:
+            if not repo.is_dirty():
+                return encode_result({"error": "Nothing to commit - working tree is clean"})
             
-            with repo.git.EnvironmentOverride(env):
+            if author_name or author_email:
+                env = {}
+                if author_name:
+                    env["GIT_AUTHOR_NAME"] = author_name
+                if author_email:
+                    env["GIT_AUTHOR_EMAIL"] = author_email
+
+                with repo.git.EnvironmentOverride(env):
+                    commit = repo.index.commit(message)
+            else:
                 commit = repo.index.commit(message)
-        else:
-            commit = repo.index.commit(message)
-        
-        return json.dumps({
-            "success": True,
-            "repo": repo_path,
-            "sha": commit.hexsha[:7],
-            "full_sha": commit.hexsha,
-            "message": message,
-        }, indent=2)
+
+            return encode_result({
+                "success": True,
+                "repo": repo_path,
+                "sha": commit.hexsha[:7],
+                "full_sha": commit.hexsha,
+                "message": message,
+            })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
-@mcp.tool()
+@group_tool("git")
 async def git_pull(repo_path: str) -> str:
     """Pull changes from remote in a local git repository.
     
@@ -1363,26 +5757,25 @@ async def git_pull(repo_path: str) -> str:
         JSON string containing pull result
     """
     try:
-        repo = _get_git_repo(repo_path)
-        
-        if not repo.remotes:
-            return json.dumps({"error": "No remotes configured"})
-        
-        origin = repo.remotes.origin
-        info = origin.pull()
-        
-        return json.dumps({
-            "success": True,
-            "repo": repo_path,
-            "remote": "origin",
-            "fetched_commits": len(info),
-            "branch": repo.active_branch.name,
-        }, indent=2)
+        with _get_git_repo(repo_path) as repo:
+            if not repo.remotes:
+                return encode_result({"error": "No remotes configured"})
+
+            origin = repo.remotes.origin
+            info = origin.pull()
+
+            return encode_result({
+                "success": True,
+                "repo": repo_path,
+                "remote": "origin",
+                "fetched_commits": len(info),
+                "branch": repo.active_branch.name,
+            })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
-@mcp.tool()
+@group_tool("git")
 async def git_push(repo_path: str, remote: str = "origin", branch: str | None = None) -> str:
     """Push changes to remote in a local git repository.
     
@@ -1395,28 +5788,27 @@ async def git_push(repo_path: str, remote: str = "origin", branch: str | None =
         JSON string containing push result
     """
     try:
-        repo = _get_git_repo(repo_path)
-        
-        if remote not in [r.name for r in repo.remotes]:
-            return json.dumps({"error": f"Remote '{remote}' not found"})
-        
-        target_branch = branch or repo.active_branch.name
-        remote_ref = f"{remote}/{target_branch}"
-        
-        repo.git.push(remote, target_branch)
-        
-        return json.dumps({
-            "success": True,
-            "repo": repo_path,
-            "remote": remote,
-            "branch": target_branch,
-            "message": f"Pushed to {remote_ref}",
-        }, indent=2)
+        with _get_git_repo(repo_path) as repo:
+            if remote not in [r.name for r in repo.remotes]:
+                return encode_result({"error": f"Remote '{remote}' not found"})
+
+            target_branch = branch or repo.active_branch.name
+            remote_ref = f"{remote}/{target_branch}"
+
+            repo.git.push(remote, target_branch)
+
+            return encode_result({
+                "success": True,
+                "repo": repo_path,
+                "remote": remote,
+                "branch": target_branch,
+                "message": f"Pushed to {remote_ref}",
+            })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
-@mcp.tool()
+@group_tool("git")
 async def git_get_remote(repo_path: str) -> str:
     """Get remote information for a local git repository.
     
@@ -1427,28 +5819,27 @@ async def git_get_remote(repo_path: str) -> str:
         JSON string containing remote information
     """
     try:
-        repo = _get_git_repo(repo_path)
-        
-        if not repo.remotes:
-            return json.dumps({"remotes": [], "message": "No remotes configured"})
-        
-        remotes = []
-        for remote in repo.remotes:
-            remotes.append({
-                "name": remote.name,
-                "urls": list(remote.urls),
-                "push_urls": list(remote.push_urls),
+        with _get_git_repo(repo_path) as repo:
+            if not repo.remotes:
+                return encode_result({"remotes": [], "message": "No remotes configured"})
+
+            remotes = []
+            for remote in repo.remotes:
+                remotes.append({
+                    "name": remote.name,
+                    "urls": list(remote.urls),
+                    "push_urls": list(remote.push_urls),
+                })
+
+            return encode_result({
+                "repo": repo_path,
+                "remotes": remotes,
             })
-        
-        return json.dumps({
-            "repo": repo_path,
-            "remotes": remotes,
-        }, indent=2)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
-@mcp.tool()
+@group_tool("git")
 async def git_clone(source_url: str, target_path: str) -> str:
     """Clone a git repository to local path.
     
@@ -1464,23 +5855,25 @@ async def git_clone(source_url: str, target_path: str) -> str:
         full_path = (base_path / target_path).resolve()
         
         if not str(full_path).startswith(str(base_path)):
-            return json.dumps({"error": "Access denied: target path outside allowed directory"})
+            return encode_result({"error": "Access denied: target path outside allowed directory"})
         
         if full_path.exists():
-            return json.dumps({"error": f"Target path already exists: {target_path}"})
+            return encode_result({"error": f"Target path already exists: {target_path}"})
         
         full_path.parent.mkdir(parents=True, exist_ok=True)
         
+        from git import Repo
+
         Repo.clone_from(source_url, str(full_path))
         
-        return json.dumps({
+        return encode_result({
             "success": True,
             "source_url": source_url,
             "target_path": str(full_path.relative_to(base_path)),
             "message": "Repository cloned successfully",
-        }, indent=2)
+        })
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return encode_result({"error": str(e)})
 
 
 # =============================================================================
@@ -1497,7 +5890,49 @@ async def get_database_status() -> str:
         configured = bool(DATABASE_CONFIG[db_type].get("database"))
         status[db_type] = "configured" if configured else "not configured"
     
-    return json.dumps(status, indent=2)
+    return encode_result(status)
+
+
+@mcp.resource("config://database-pools")
+async def get_database_pools() -> str:
+    """Get connection pool statistics for the database backends."""
+    return encode_result({
+        "mysql": mysql_conn.pool.stats(),
+        "postgresql": postgresql_conn.pool.stats(),
+        "mongodb": mongodb_conn.stats(),
+        "executors": _db_executor_stats(),
+        "cursors": {
+            "mysql": mysql_cursors.stats(),
+            "postgresql": postgresql_cursors.stats(),
+        },
+    })
+
+
+@mcp.resource("config://schema-cache")
+async def get_schema_cache_status() -> str:
+    """Get schema metadata cache settings and hit/miss counters."""
+    return encode_result({
+        "ttl": {
+            "mysql": DATABASE_CONFIG["mysql"]["schema_cache_ttl"],
+            "postgresql": DATABASE_CONFIG["postgresql"]["schema_cache_ttl"],
+        },
+        **schema_cache.stats(),
+    })
+
+
+@mcp.resource("config://query-cache")
+async def get_query_cache_status() -> str:
+    """Get SQL result cache settings and hit/miss/eviction counters."""
+    return encode_result({
+        backend: {"default_ttl": DATABASE_CONFIG[backend]["result_cache_ttl"], **cache.stats()}
+        for backend, cache in query_caches.items()
+    })
+
+
+@mcp.resource("config://content-index")
+async def get_content_index_status() -> str:
+    """Get content search index roots, size and refresh state."""
+    return encode_result(await asyncio.to_thread(content_index.stats))
 
 
 @mcp.resource("config://github-status")
@@ -1507,8 +5942,9 @@ async def get_github_status() -> str:
         "configured": bool(GITHUB_CONFIG["token"]),
         "owner": GITHUB_CONFIG["owner"] or "not set",
         "repo": GITHUB_CONFIG["repo"] or "not set",
+        "response_cache": github_conn.stats(),
     }
-    return json.dumps(status, indent=2)
+    return encode_result(status)
 
 
 @mcp.resource("config://custom-api-status")
@@ -1517,8 +5953,21 @@ async def get_custom_api_status() -> str:
     status = {
         "configured": bool(CUSTOM_API_CONFIG["base_url"]),
         "base_url": CUSTOM_API_CONFIG["base_url"] or "not set",
+        "http2": CUSTOM_API_HTTP2,
+        "client_open": _custom_api_client is not None and not _custom_api_client.is_closed,
+        "max_connections": CUSTOM_API_CONFIG["max_connections"],
+        "max_keepalive_connections": CUSTOM_API_CONFIG["max_keepalive_connections"],
     }
-    return json.dumps(status, indent=2)
+    return encode_result(status)
+
+
+@mcp.resource("config://tool-groups")
+async def get_tool_groups() -> str:
+    """Get which tool groups are enabled on this server."""
+    return encode_result({
+        "enabled": sorted(ENABLED_TOOL_GROUPS),
+        "disabled": sorted(set(TOOL_GROUPS) - ENABLED_TOOL_GROUPS),
+    })
 
 
 @mcp.resource("config://local-git-status")
@@ -1536,8 +5985,10 @@ async def get_local_git_status() -> str:
         "base_path": str(base_path),
         "configured": base_path.exists(),
         "available_repos": repos,
+        "repo_cache": git_repos.stats(),
+        "commit_graph": commit_graphs.stats(),
     }
-    return json.dumps(status, indent=2)
+    return encode_result(status)
 
 
 # =============================================================================
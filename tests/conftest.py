@@ -0,0 +1,61 @@
+import json
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import server
+
+
+def git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-C", str(repo), *args], capture_output=True, text=True, check=True
+    ).stdout
+
+
+def commit_file(repo: Path, name: str, content: str, message: str) -> None:
+    path = repo / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    git(repo, "add", "-A")
+    git(repo, "commit", "-q", "-m", message)
+
+
+def decode(result: str) -> dict:
+    data = json.loads(result)
+    assert "error" not in data, data["error"]
+    return data
+
+
+@pytest.fixture
+def git_base(tmp_path, monkeypatch):
+    """Point the local git tools at an empty base directory."""
+    monkeypatch.setitem(server.LOCAL_GIT_CONFIG, "base_path", str(tmp_path))
+    monkeypatch.setattr(server, "git_repos", server.GitRepoCache(4))
+    monkeypatch.setattr(server, "commit_graphs", server.CommitGraphMaintainer(0))
+    yield tmp_path
+    server.git_repos.close()
+
+
+@pytest.fixture
+def make_repo(git_base):
+    def make(name: str = "repo") -> Path:
+        repo = git_base / name
+        repo.mkdir()
+        git(repo, "init", "-q", "-b", "main")
+        git(repo, "config", "user.email", "dev@example.com")
+        git(repo, "config", "user.name", "Dev")
+        return repo
+
+    return make
+
+
+@pytest.fixture
+def postgresql_dsn():
+    """DSN of a scratch PostgreSQL database; tests using it are skipped without one."""
+    dsn = os.environ.get("TEST_POSTGRES_DSN")
+    if not dsn:
+        pytest.skip("TEST_POSTGRES_DSN is not set")
+    pytest.importorskip("psycopg2")
+    return dsn
@@ -0,0 +1,254 @@
+import threading
+import time
+
+import pytest
+
+import server
+
+
+class _FakeConnection:
+    def __init__(self, number):
+        self.number = number
+        self.closed = False
+        self.healthy = True
+
+    def close(self):
+        self.closed = True
+
+
+class _Connector:
+    def __init__(self):
+        self.opened = []
+        self.fail = False
+
+    def __call__(self):
+        if self.fail:
+            raise ConnectionError("connect failed")
+        conn = _FakeConnection(len(self.opened))
+        self.opened.append(conn)
+        return conn
+
+
+def _check(conn):
+    if not conn.healthy:
+        raise ConnectionError("connection went away")
+
+
+def _pool(**kwargs):
+    connector = _Connector()
+    kwargs.setdefault("timeout", 1.0)
+    return server.ConnectionPool("test", connector, **kwargs), connector
+
+
+def test_released_connection_is_reused():
+    pool, connector = _pool(max_size=2)
+
+    first = pool.acquire()
+    pool.release(first)
+    second = pool.acquire()
+
+    assert second is first
+    assert len(connector.opened) == 1
+    stats = pool.stats()
+    assert stats["checkouts"] == 2
+    assert stats["connections_created"] == 1
+    assert stats["in_use"] == 1
+    assert stats["size"] == 1
+
+
+def test_connection_context_manager_returns_or_discards():
+    pool, _ = _pool()
+
+    with pool.connection() as conn:
+        pass
+    assert pool.stats()["idle"] == 1
+
+    with pytest.raises(RuntimeError):
+        with pool.connection() as conn:
+            conn.closed = True
+            raise RuntimeError("driver error")
+    stats = pool.stats()
+    assert stats["idle"] == 0
+    assert stats["size"] == 0
+    assert stats["in_use"] == 0
+
+
+def test_failed_liveness_check_replaces_the_connection():
+    pool, connector = _pool(check=_check)
+
+    stale = pool.acquire()
+    pool.release(stale)
+    stale.healthy = False
+    fresh = pool.acquire()
+
+    assert fresh is not stale
+    assert stale.closed
+    assert len(connector.opened) == 2
+    stats = pool.stats()
+    assert stats["failed_checks"] == 1
+    assert stats["checkouts"] == 2
+    assert stats["connections_closed"] == 1
+    assert stats["size"] == 1
+
+
+def test_failed_reset_discards_the_connection():
+    def reset(conn):
+        raise ConnectionError("rollback failed")
+
+    pool, _ = _pool(reset=reset)
+
+    conn = pool.acquire()
+    pool.release(conn)
+
+    assert conn.closed
+    assert pool.stats()["size"] == 0
+
+
+def test_acquire_times_out_when_pool_is_exhausted():
+    pool, _ = _pool(max_size=1, timeout=0.05)
+    pool.acquire()
+
+    started = time.monotonic()
+    with pytest.raises(server.PoolTimeoutError):
+        pool.acquire()
+
+    assert time.monotonic() - started >= 0.05
+    stats = pool.stats()
+    assert stats["timeouts"] == 1
+    assert stats["waits"] == 1
+    assert stats["checkouts"] == 1
+
+
+def test_waiter_gets_the_released_connection():
+    pool, _ = _pool(max_size=1)
+    held = pool.acquire()
+    result = []
+
+    waiter = threading.Thread(target=lambda: result.append(pool.acquire()))
+    waiter.start()
+    time.sleep(0.05)
+    pool.release(held)
+    waiter.join(1.0)
+
+    assert result == [held]
+    assert pool.stats()["waits"] == 1
+
+
+def test_failed_connect_frees_the_slot_and_is_not_a_checkout():
+    pool, connector = _pool(max_size=1)
+    connector.fail = True
+
+    with pytest.raises(ConnectionError):
+        pool.acquire()
+
+    stats = pool.stats()
+    assert stats["checkouts"] == 0
+    assert stats["size"] == 0
+    assert stats["in_use"] == 0
+
+    connector.fail = False
+    pool.acquire()
+    assert pool.stats()["checkouts"] == 1
+
+
+def test_expired_connections_are_not_reused():
+    pool, connector = _pool(max_lifetime=0.01)
+
+    first = pool.acquire()
+    time.sleep(0.02)
+    pool.release(first)
+    second = pool.acquire()
+
+    assert second is not first
+    assert first.closed
+    assert len(connector.opened) == 2
+
+
+def test_idle_surplus_is_reaped_down_to_min_size():
+    pool, _ = _pool(min_size=1, max_size=3, idle_timeout=0.01)
+    conns = [pool.acquire() for _ in range(3)]
+    for conn in conns:
+        pool.release(conn)
+
+    time.sleep(0.02)
+    pool.release(pool.acquire())
+
+    stats = pool.stats()
+    assert stats["size"] == 1
+    assert stats["connections_closed"] == 2
+
+
+def test_closed_pool_rejects_checkouts_and_closes_returns():
+    pool, _ = _pool()
+    idle = pool.acquire()
+    busy = pool.acquire()
+    pool.release(idle)
+
+    pool.close()
+
+    assert idle.closed
+    with pytest.raises(RuntimeError, match="closed"):
+        pool.acquire()
+    pool.release(busy)
+    assert busy.closed
+    assert pool.stats()["size"] == 0
+
+
+def test_session_setup_runs_once_per_new_connection(monkeypatch):
+    setups = []
+    postgresql = server.PostgreSQLConnection(session_setup=setups.append)
+    monkeypatch.setattr(postgresql, "get_connection", lambda: _FakeConnection(0))
+    monkeypatch.setattr(postgresql.pool, "_check", None)
+    monkeypatch.setattr(postgresql.pool, "_reset", None)
+
+    with postgresql.connection() as conn:
+        pass
+    with postgresql.connection() as again:
+        pass
+
+    assert again is conn
+    assert setups == [conn]
+
+
+def test_failed_session_setup_closes_the_connection(monkeypatch):
+    opened = []
+
+    def get_connection():
+        opened.append(_FakeConnection(len(opened)))
+        return opened[-1]
+
+    def session_setup(conn):
+        raise ValueError("bad search_path")
+
+    postgresql = server.PostgreSQLConnection(session_setup=session_setup)
+    monkeypatch.setattr(postgresql, "get_connection", get_connection)
+
+    with pytest.raises(ValueError):
+        postgresql.pool.acquire()
+
+    assert opened[0].closed
+    stats = postgresql.pool.stats()
+    assert stats["checkouts"] == 0
+    assert stats["size"] == 0
+
+
+def test_default_session_setup_on_live_server(postgresql_dsn, monkeypatch):
+    import psycopg2
+
+    monkeypatch.setitem(server.DATABASE_CONFIG["postgresql"], "search_path", "pg_catalog")
+    monkeypatch.setitem(server.DATABASE_CONFIG["postgresql"], "read_only", True)
+    postgresql = server.PostgreSQLConnection()
+    monkeypatch.setattr(postgresql, "get_connection", lambda: psycopg2.connect(postgresql_dsn))
+
+    try:
+        with postgresql.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("SHOW search_path")
+                search_path = cursor.fetchone()[0]
+                cursor.execute("SHOW transaction_read_only")
+                read_only = cursor.fetchone()[0]
+    finally:
+        postgresql.close()
+
+    assert search_path == "pg_catalog"
+    assert read_only == "on"
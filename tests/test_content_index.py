@@ -0,0 +1,111 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import server
+
+
+@pytest.fixture
+def index(tmp_path, monkeypatch):
+    root = tmp_path / "root"
+    root.mkdir()
+    content_index = server.ContentIndex(str(tmp_path / "index.db"), [str(root)], 2, 4096)
+    monkeypatch.setattr(server, "content_index", content_index)
+    yield root, content_index
+    content_index.close()
+
+
+def _refresh(content_index) -> dict:
+    assert content_index.refresh()
+    assert content_index.wait(60)
+    stats = content_index.stats()
+    assert stats["status"] == "ready", stats["error"]
+    return stats
+
+
+async def _search(query: str, **kwargs) -> dict:
+    result = json.loads(await server.filesystem_content_search(query, **kwargs))
+    assert "error" not in result, result["error"]
+    return result
+
+
+async def test_search_after_refresh_through_worker_processes(index):
+    root, content_index = index
+    # Enough files to go through the worker processes rather than in-process.
+    for i in range(150):
+        (root / f"file{i:03d}.txt").write_text(f"header\nvalue {i} needle{i % 7}\n")
+
+    stats = _refresh(content_index)
+    assert stats["files"] == stats["indexed_files"] == 150
+
+    result = await _search("needle3", max_results=100)
+    paths = {Path(match["path"]).name for match in result["matches"]}
+    assert paths == {f"file{i:03d}.txt" for i in range(150) if i % 7 == 3}
+    assert all(match["line"] == 2 for match in result["matches"])
+    assert result["trigram_filter"] is True
+
+
+def test_worker_script_imports_only_the_standard_library(tmp_path):
+    probe = (
+        "import sys, runpy; sys.argv = ['worker']; sys.stdin = open(__import__('os').devnull);"
+        f"runpy.run_path({str(Path(server.__file__).with_name('content_index_worker.py'))!r},"
+        " run_name='__main__')"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        capture_output=True, text=True,
+    )
+    imported = {line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines()}
+    assert not imported & {"server", "fastmcp", "pydantic"}
+
+
+async def test_oversized_files_are_reported_as_skipped(index):
+    root, content_index = index
+    (root / "small.txt").write_text("needle\n")
+    (root / "big.log").write_text("x" * 5000 + "\nneedle\n")
+    (root / "big.txt").write_text("y" * 5000)
+
+    _refresh(content_index)
+
+    result = await _search("needle")
+    assert [Path(match["path"]).name for match in result["matches"]] == ["small.txt"]
+    assert result["skipped_count"] == 2
+    assert [Path(path).name for path in result["skipped_files"]] == ["big.log", "big.txt"]
+    assert result["index_status"] == "ready"
+
+    filtered = await _search("needle", path_pattern="*.log")
+    assert [Path(path).name for path in filtered["skipped_files"]] == ["big.log"]
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        (r"def \w+\(", (["def ", "("], False)),
+        (r"error: [0-9]+ failed", (["error: ", " failed"], False)),
+        (r"ab{2}c", (["ab", "c"], False)),
+        (r"colou?r", (["colo", "r"], False)),
+        (r"(?i)Hello", (["Hello"], True)),
+        (r"\x41bc\.txt", (["bc.txt"], False)),
+        (r"prefix(?:one|two)suffix", (["prefix", "suffix"], False)),
+        (r"foo|bar", None),
+        (r"(?x) foo", None),
+    ],
+)
+def test_regex_literal_runs(query, expected):
+    assert server._regex_literal_runs(query) == expected
+
+
+async def test_regex_search_uses_trigram_filter(index):
+    root, content_index = index
+    (root / "a.py").write_text("def handler(event):\n    pass\n")
+    (root / "b.py").write_text("class Handler:\n    pass\n")
+
+    _refresh(content_index)
+
+    result = await _search(r"def \w+\(", regex=True)
+    assert [Path(match["path"]).name for match in result["matches"]] == ["a.py"]
+    assert result["trigram_filter"] is True
+    assert result["candidates"] == 1
@@ -0,0 +1,206 @@
+import json
+import time
+
+import pytest
+
+import server
+
+
+class _FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.closed = False
+        self.fail_close = False
+
+    def execute(self, query, params):
+        self.query = query
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def close(self):
+        if self.fail_close:
+            raise RuntimeError("close failed")
+        self.closed = True
+
+
+class _Releases(list):
+    def __call__(self, conn, discard=False):
+        self.append((conn, discard))
+
+
+def _stream(rows, key=None):
+    releases = _Releases()
+    return server.CursorStream("conn", _FakeCursor(rows), releases, key), releases
+
+
+def test_read_page_respects_rows_and_bytes():
+    stream, _ = _stream([{"n": i} for i in range(5)])
+
+    assert stream.read_page(2, 1_000) == ([{"n": 0}, {"n": 1}], False)
+    # Each row encodes to 7 bytes: the second row would exceed 10.
+    assert stream.read_page(10, 10) == ([{"n": 2}], False)
+    assert stream.read_page(10, 1_000) == ([{"n": 3}, {"n": 4}], True)
+    assert stream.rows_sent == 5
+
+
+def test_oversized_row_is_still_returned_alone():
+    stream, _ = _stream([{"blob": "x" * 100}, {"blob": "y"}])
+
+    rows, exhausted = stream.read_page(10, 5)
+
+    assert [row["blob"][0] for row in rows] == ["x"]
+    assert exhausted is False
+
+
+def test_close_releases_and_discards_on_failure():
+    stream, releases = _stream([])
+    stream.close()
+    assert releases == [("conn", False)]
+
+    stream, releases = _stream([])
+    stream.cursor.fail_close = True
+    stream.close()
+    assert releases == [("conn", True)]
+
+
+def test_take_rejects_a_different_query_and_keeps_the_stream():
+    registry = server.CursorRegistry("test", idle_timeout=0)
+    stream, releases = _stream([], key=("SELECT 1", []))
+    token = registry.put(stream)
+
+    with pytest.raises(ValueError, match="different query"):
+        registry.take(token, ("SELECT 2", []))
+    with pytest.raises(ValueError):
+        registry.take(token, ("SELECT 1", [5]))
+
+    assert registry.take(token, ("SELECT 1", [])) is stream
+    assert releases == []
+    with pytest.raises(KeyError):
+        registry.take(token)
+
+
+def test_idle_and_aged_streams_expire():
+    registry = server.CursorRegistry("test", idle_timeout=60, max_age=600)
+    idle, idle_releases = _stream([])
+    aged, aged_releases = _stream([])
+    idle_token = registry.put(idle)
+    aged_token = registry.put(aged)
+    idle.last_used -= 61
+    aged.created_at -= 601
+
+    with pytest.raises(KeyError, match="expired"):
+        registry.take(idle_token)
+    assert idle_releases == [("conn", True)]
+
+    assert registry.reap() == 1
+    assert aged_releases == [("conn", True)]
+    assert registry.stats()["reclaimed"] == 2
+    with pytest.raises(KeyError):
+        registry.take(aged_token)
+    registry.close()
+
+
+def test_least_recently_used_stream_is_evicted():
+    registry = server.CursorRegistry("test", idle_timeout=0, max_open=2)
+    streams = [_stream([]) for _ in range(3)]
+    tokens = []
+    for stream, _ in streams:
+        tokens.append(registry.put(stream))
+        time.sleep(0.001)
+
+    assert streams[0][1] == [("conn", True)]
+    with pytest.raises(KeyError):
+        registry.take(tokens[0])
+    assert registry.take(tokens[2]) is streams[2][0]
+
+
+class _FakePool:
+    def __init__(self, rows):
+        self.rows = rows
+        self.released = []
+
+    def acquire(self):
+        pool = self
+
+        class Conn:
+            def cursor(self, cursor_class=None):
+                pool.cursor = _FakeCursor(pool.rows)
+                return pool.cursor
+
+        return Conn()
+
+    def release(self, conn, discard=False):
+        self.released.append(discard)
+
+
+@pytest.fixture
+def mysql_pool(monkeypatch):
+    pool = _FakePool([{"id": i} for i in range(5)])
+    monkeypatch.setattr(server.mysql_conn, "pool", pool)
+    monkeypatch.setattr(server, "mysql_cursors", server.CursorRegistry("mysql", idle_timeout=0))
+    return pool
+
+
+def _page(query, token=None, params=None) -> dict:
+    return json.loads(server._mysql_execute_query_paged(query, params, 2, 1_000_000, token))
+
+
+def test_paged_mysql_query_continues_only_for_its_query(mysql_pool):
+    first = _page("SELECT id FROM t")
+    assert [row["id"] for row in first["rows"]] == [0, 1]
+    token = first["continuation_token"]
+
+    with pytest.raises(ValueError, match="different query"):
+        _page("SELECT * FROM other", token)
+
+    second = _page("SELECT id FROM t", token)
+    assert [row["id"] for row in second["rows"]] == [2, 3]
+    assert second["continuation_token"] == token
+
+    last = _page("SELECT id FROM t", token)
+    assert [row["id"] for row in last["rows"]] == [4]
+    assert last["has_more"] is False
+    assert last["continuation_token"] is None
+    assert mysql_pool.released == [False]
+    assert mysql_pool.cursor.closed
+
+
+@pytest.fixture
+def postgresql_pool(postgresql_dsn, monkeypatch):
+    from psycopg2.extensions import parse_dsn
+
+    params = parse_dsn(postgresql_dsn)
+    config = server.DATABASE_CONFIG["postgresql"]
+    for key, name in (("host", "host"), ("user", "user"), ("password", "password"),
+                      ("database", "dbname")):
+        monkeypatch.setitem(config, key, params.get(name, config[key]))
+    monkeypatch.setitem(config, "port", int(params.get("port", config["port"])))
+    conn = server.PostgreSQLConnection()
+    monkeypatch.setattr(server, "postgresql_conn", conn)
+    monkeypatch.setattr(
+        server, "postgresql_cursors", server.CursorRegistry("postgresql", idle_timeout=0)
+    )
+    yield conn
+    conn.close()
+
+
+async def test_paged_postgresql_query_on_live_server(postgresql_pool):
+    query = "SELECT n FROM generate_series(1, %s) AS n ORDER BY n"
+    seen, token = [], None
+    while True:
+        result = json.loads(await server.postgresql_execute_query(
+            query, [7], paged=True, max_rows=3, continuation_token=token
+        ))
+        assert "error" not in result, result["error"]
+        seen.extend(row["n"] for row in result["rows"])
+        token = result["continuation_token"]
+        if token is None:
+            break
+        other = json.loads(await server.postgresql_execute_query(
+            query, [8], continuation_token=token
+        ))
+        assert "different query" in other["error"]
+
+    assert seen == list(range(1, 8))
+    assert postgresql_pool.pool.stats()["in_use"] == 0
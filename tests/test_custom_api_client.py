@@ -0,0 +1,77 @@
+import asyncio
+import http.server
+import json
+import threading
+
+import pytest
+
+import server
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def api(monkeypatch):
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    monkeypatch.setitem(
+        server.CUSTOM_API_CONFIG, "base_url", f"http://127.0.0.1:{httpd.server_address[1]}"
+    )
+    monkeypatch.setattr(server, "_custom_api_client", None)
+    monkeypatch.setattr(server, "_custom_api_client_loop", None)
+    yield
+    httpd.shutdown()
+    httpd.server_close()
+
+
+async def _get() -> object:
+    result = json.loads(await server.custom_api_get("/status"))
+    assert result["status_code"] == 200, result
+    return server._custom_api_client
+
+
+async def _cancel_other_tasks() -> None:
+    tasks = asyncio.all_tasks() - {asyncio.current_task()}
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@pytest.mark.filterwarnings("error::ResourceWarning")
+def test_client_is_closed_with_its_event_loop(api):
+    first = asyncio.run(_get())
+    assert first.is_closed
+
+    second = asyncio.run(_get())
+    assert second is not first
+    assert second.is_closed
+
+
+def test_client_replaced_for_a_running_loop_in_another_thread(api):
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        first = asyncio.run_coroutine_threadsafe(_get(), loop).result(10)
+        second = asyncio.run(_get())
+        assert second is not first
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0.1), loop).result(10)
+        assert first.is_closed
+    finally:
+        asyncio.run_coroutine_threadsafe(_cancel_other_tasks(), loop).result(10)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(10)
+        loop.close()
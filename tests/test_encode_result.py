@@ -0,0 +1,92 @@
+import json
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from bson import ObjectId
+
+import server
+
+
+class _Opaque:
+    def __str__(self):
+        return "opaque"
+
+
+PAYLOAD = {
+    "when": datetime(2024, 1, 2, 3, 4, 5, 678901),
+    "aware": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    "day": date(2024, 1, 2),
+    "clock": time(3, 4, 5),
+    "elapsed": timedelta(minutes=90),
+    "price": Decimal("12.50"),
+    "id": ObjectId("65a1b2c3d4e5f60718293a4b"),
+    "uuid": UUID("12345678-1234-5678-1234-567812345678"),
+    "text": b"caf\xc3\xa9",
+    "binary": b"\xff\x00\x01",
+    "buffer": bytearray(b"abc"),
+    "view": memoryview(b"xyz"),
+    "tags": {"only"},
+    "frozen": frozenset({1}),
+    "nested": [{"n": 1, "f": 1.5, "none": None, "ok": True}, "ünïcode"],
+    1: "int key",
+    "opaque": _Opaque(),
+}
+
+EXPECTED = {
+    "when": "2024-01-02T03:04:05.678901",
+    "aware": "2024-01-02T03:04:05+00:00",
+    "day": "2024-01-02",
+    "clock": "03:04:05",
+    "elapsed": "1:30:00",
+    "price": "12.50",
+    "id": "65a1b2c3d4e5f60718293a4b",
+    "uuid": "12345678-1234-5678-1234-567812345678",
+    "text": "café",
+    "binary": "/wAB",
+    "buffer": "abc",
+    "view": "xyz",
+    "tags": ["only"],
+    "frozen": [1],
+    "nested": [{"n": 1, "f": 1.5, "none": None, "ok": True}, "ünïcode"],
+    "1": "int key",
+    "opaque": "opaque",
+}
+
+
+@pytest.fixture
+def without_orjson(monkeypatch):
+    monkeypatch.setattr(server, "orjson", None)
+
+
+def test_orjson_encoding():
+    assert server.orjson is not None
+    encoded = server.encode_result(PAYLOAD)
+    assert json.loads(encoded) == EXPECTED
+    assert ", " not in encoded and ": " not in encoded
+
+
+def test_standard_library_fallback(without_orjson):
+    assert json.loads(server.encode_result(PAYLOAD)) == EXPECTED
+
+
+def test_both_encoders_give_identical_output(monkeypatch):
+    with_orjson = server.encode_result(PAYLOAD)
+    monkeypatch.setattr(server, "orjson", None)
+    assert server.encode_result(PAYLOAD) == with_orjson
+
+
+def test_both_encoders_give_identical_pretty_output(monkeypatch):
+    monkeypatch.setattr(server, "_JSON_OPTIONS", {"indent": 2})
+    monkeypatch.setattr(
+        server, "_ORJSON_OPTIONS", server.orjson.OPT_NON_STR_KEYS | server.orjson.OPT_INDENT_2
+    )
+    with_orjson = server.encode_result(PAYLOAD)
+    monkeypatch.setattr(server, "orjson", None)
+    assert server.encode_result(PAYLOAD) == with_orjson
+    assert with_orjson.startswith('{\n  "when": ')
+
+
+def test_integers_wider_than_64_bits_fall_back():
+    assert server.encode_result({"big": 2**70}) == '{"big":1180591620717411303424}'
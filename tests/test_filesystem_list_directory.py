@@ -0,0 +1,86 @@
+import json
+
+import pytest
+
+import server
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "sub" / "deep").mkdir(parents=True)
+    for name in ("a.py", "b.txt", "sub/c.py", "sub/d.txt", "sub/deep/a.py"):
+        (tmp_path / name).write_text(name)
+    return tmp_path
+
+
+async def _list(path, **kwargs) -> dict:
+    result = json.loads(await server.filesystem_list_directory(str(path), **kwargs))
+    assert "error" not in result, result["error"]
+    return result
+
+
+async def _all_pages(path, **kwargs) -> list[str]:
+    names = []
+    cursor = None
+    while True:
+        result = await _list(path, cursor=cursor, fields=["path"], **kwargs)
+        names.extend(item["path"] for item in result["items"])
+        cursor = result["next_cursor"]
+        if not result["has_more"]:
+            return names
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        ("*.py", ["a.py"]),
+        ("**/*.py", ["a.py", "sub/c.py", "sub/deep/a.py"]),
+        ("sub/*", ["sub/c.py", "sub/d.txt", "sub/deep"]),
+    ],
+)
+async def test_pattern_follows_path_glob(tree, pattern, expected):
+    result = await _list(tree, pattern=pattern)
+    paths = sorted(item["path"] for item in result["items"])
+    assert paths == sorted(str(tree / name) for name in expected)
+    assert paths == sorted(str(path) for path in tree.glob(pattern))
+
+
+@pytest.mark.parametrize("sort", ["name", "type", "size", "modified", "none"])
+@pytest.mark.parametrize("pattern", ["*", "**/*"])
+async def test_cursor_pages_cover_listing_once(tree, sort, pattern):
+    for i in range(25):
+        (tree / f"file{i:02d}.dat").write_text("x" * i)
+
+    full = await _list(tree, pattern=pattern, sort=sort, fields=["path"])
+    paged = await _all_pages(tree, pattern=pattern, sort=sort, limit=4)
+
+    assert paged == [item["path"] for item in full["items"]]
+    assert len(set(paged)) == full["total"]
+
+
+async def test_pages_reuse_snapshot_until_directory_changes(tree, monkeypatch):
+    for i in range(10):
+        (tree / f"file{i}.dat").write_text("")
+    scans = []
+    scan = server._scan_listing
+    monkeypatch.setattr(
+        server, "_scan_listing", lambda *args: scans.append(args) or scan(*args)
+    )
+
+    first = await _list(tree, limit=3)
+    second = await _list(tree, limit=3, cursor=first["next_cursor"])
+    assert len(scans) == 1
+
+    (tree / "zzz.dat").write_text("")
+    third = await _list(tree, limit=20, cursor=second["next_cursor"])
+    assert len(scans) == 2
+    names = [item["name"] for item in first["items"] + second["items"] + third["items"]]
+    assert names == sorted(path.name for path in tree.iterdir())
+
+
+async def test_cursor_rejects_other_pattern(tree):
+    first = await _list(tree, limit=1)
+    result = json.loads(await server.filesystem_list_directory(
+        str(tree), pattern="*.py", cursor=first["next_cursor"]
+    ))
+    assert "error" in result
@@ -0,0 +1,135 @@
+import json
+import threading
+import time
+
+import server
+
+
+async def _read(path, **kwargs) -> dict:
+    result = json.loads(await server.filesystem_read_file(str(path), **kwargs))
+    assert "error" not in result, result["error"]
+    return result
+
+
+async def test_line_window_pages_by_line(tmp_path):
+    path = tmp_path / "f.txt"
+    path.write_text("one\ntwo\nthree\n")
+
+    result = await _read(path, start_line=2, end_line=2)
+
+    assert result["content"] == "two\n"
+    assert result["next_line"] is None
+    assert result["line_truncated"] is False
+
+    result = await _read(path, start_line=1, length=8)
+    assert result["content"] == "one\ntwo\n"
+    assert result["end_line"] == 2
+    assert result["next_line"] == 3
+
+
+async def test_first_line_longer_than_window_continues_by_offset(tmp_path):
+    path = tmp_path / "f.txt"
+    path.write_text("short\n" + "x" * 25 + "\nlast\n")
+
+    result = await _read(path, start_line=2, length=10)
+
+    assert result["content"] == "x" * 10
+    assert result["line_truncated"] is True
+    assert result["next_line"] is None
+    assert result["next_offset"] == 16
+
+    content = result["content"]
+    offset = result["next_offset"]
+    while offset is not None:
+        chunk = await _read(path, offset=offset, length=10)
+        content += chunk["content"]
+        offset = chunk["next_offset"]
+    assert content == "x" * 25 + "\nlast\n"
+
+
+async def _read_many(files, **kwargs) -> dict:
+    result = json.loads(await server.filesystem_read_files(files, **kwargs))
+    assert "error" not in result, result["error"]
+    return result
+
+
+async def test_batch_accepts_paths_and_requests_in_order(tmp_path):
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.txt").write_text(f"{name}1\n{name}2\n{name}3\n")
+
+    result = await _read_many([
+        str(tmp_path / "a.txt"),
+        {"path": str(tmp_path / "b.txt"), "start_line": 2, "end_line": 2},
+        server.FileReadRequest(path=str(tmp_path / "c.txt"), offset=3, length=3),
+    ])
+
+    assert [entry["content"] for entry in result["files"]] == ["a1\na2\na3\n", "b2\n", "c2\n"]
+    assert result["count"] == 3
+    assert result["errors"] == 0
+    assert result["bytes_read"] == 9 + 3 + 3
+
+
+async def test_batch_reports_per_file_errors(tmp_path):
+    (tmp_path / "ok.txt").write_text("ok")
+    (tmp_path / "dir").mkdir()
+
+    result = await _read_many([
+        str(tmp_path / "ok.txt"), str(tmp_path / "missing.txt"), str(tmp_path / "dir"),
+    ])
+
+    files = result["files"]
+    assert files[0]["content"] == "ok"
+    assert "not found" in files[1]["error"]
+    assert "not found" in files[2]["error"]
+    assert result["errors"] == 2
+
+
+async def test_batch_byte_budget_truncates_then_skips(tmp_path, monkeypatch):
+    paths = []
+    for i in range(4):
+        paths.append(str(tmp_path / f"f{i}.txt"))
+        (tmp_path / f"f{i}.txt").write_text(str(i) * 100)
+
+    result = await _read_many(paths, max_concurrency=1, max_total_bytes=250)
+
+    files = result["files"]
+    assert [entry.get("length") for entry in files[:3]] == [100, 100, 50]
+    assert files[2]["next_offset"] == 50
+    assert files[3] == {
+        "path": paths[3], "error": "Batch byte budget exhausted", "skipped": True,
+    }
+    assert result["bytes_read"] == 250
+
+    # The configured budget caps a larger request.
+    monkeypatch.setitem(server.FILESYSTEM_CONFIG, "batch_max_bytes", 120)
+    result = await _read_many(paths, max_concurrency=1, max_total_bytes=10_000)
+    assert result["bytes_read"] == 120
+
+
+async def test_batch_respects_concurrency_cap(tmp_path, monkeypatch):
+    paths = []
+    for i in range(8):
+        paths.append(str(tmp_path / f"f{i}.txt"))
+        (tmp_path / f"f{i}.txt").write_text("x")
+    lock = threading.Lock()
+    running, peak = 0, 0
+    read = server._read_batch_entry
+
+    def tracked(*args):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        try:
+            time.sleep(0.05)
+            return read(*args)
+        finally:
+            with lock:
+                running -= 1
+
+    monkeypatch.setattr(server, "_read_batch_entry", tracked)
+
+    result = await _read_many(paths, max_concurrency=3)
+
+    assert result["errors"] == 0
+    assert peak == 3
@@ -0,0 +1,38 @@
+import json
+
+import pytest
+
+import server
+
+
+async def _search(directory, pattern, **kwargs) -> dict:
+    result = json.loads(await server.filesystem_search(str(directory), pattern, **kwargs))
+    assert "error" not in result, result["error"]
+    return result
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+@pytest.mark.parametrize(("matches", "truncated"), [(2, False), (3, False), (4, True)])
+async def test_truncated_only_when_more_matches_exist(tmp_path, parallel, matches, truncated):
+    for i in range(matches):
+        (tmp_path / f"sub{i}").mkdir()
+        (tmp_path / f"sub{i}" / "match.py").write_text("")
+    (tmp_path / "other.txt").write_text("")
+
+    result = await _search(tmp_path, "**/*.py", max_results=3, parallel=parallel)
+
+    assert result["count"] == min(matches, 3)
+    assert result["truncated"] is truncated
+
+
+async def test_gitignored_paths_are_skipped(tmp_path):
+    (tmp_path / ".gitignore").write_text("build/\n")
+    (tmp_path / "build").mkdir()
+    (tmp_path / "build" / "out.py").write_text("")
+    (tmp_path / "main.py").write_text("")
+
+    result = await _search(tmp_path, "**/*.py")
+    assert [match["name"] for match in result["matches"]] == ["main.py"]
+
+    result = await _search(tmp_path, "**/*.py", respect_gitignore=False)
+    assert result["count"] == 2
@@ -0,0 +1,127 @@
+import difflib
+import json
+import random
+
+import pytest
+
+import server
+
+
+async def _write(path, **kwargs) -> dict:
+    return json.loads(await server.filesystem_write_file(str(path), **kwargs))
+
+
+def _unified(old: str, new: str, name: str = "f.txt") -> str:
+    return "".join(difflib.unified_diff(
+        old.splitlines(keepends=True), new.splitlines(keepends=True),
+        f"a/{name}", f"b/{name}",
+    ))
+
+
+async def test_patch_lines_insert_after_last_line_without_newline(tmp_path):
+    path = tmp_path / "f.txt"
+    path.write_bytes(b"a\nb")
+
+    result = await _write(path, content="c\n", mode="patch_lines", start_line=3)
+
+    assert "error" not in result
+    assert path.read_bytes() == b"a\nb\nc\n"
+
+
+async def test_patch_lines_replace_range(tmp_path):
+    path = tmp_path / "f.txt"
+    path.write_text("1\n2\n3\n4\n")
+
+    result = await _write(path, content="x\ny", mode="patch_lines", start_line=2, end_line=3)
+
+    assert result["lines_replaced"] == 2
+    assert path.read_text() == "1\nx\ny\n4\n"
+
+
+async def test_diff_mode_keeps_form_feed_and_separators(tmp_path):
+    path = tmp_path / "f.txt"
+    old = "x\fy\nkeep line\nend\n"
+    path.write_text(old)
+    new = "x\fy\nchanged line\nend\n"
+    # difflib splits on \f too, so the diff is written out by hand.
+    diff = (
+        "--- a/f.txt\n+++ b/f.txt\n@@ -1,3 +1,3 @@\n"
+        " x\fy\n-keep line\n+changed line\n end\n"
+    )
+
+    result = await _write(path, mode="diff", diff=diff)
+
+    assert result.get("hunks_applied") == 1, result
+    assert path.read_text() == new
+
+
+async def test_diff_mode_rejects_multi_file_diff(tmp_path):
+    path = tmp_path / "f.txt"
+    path.write_text("a\n")
+    diff = _unified("a\n", "b\n", "f.txt") + _unified("a\n", "c\n", "g.txt")
+
+    result = await _write(path, mode="diff", diff=diff)
+
+    assert result["error"] == "Diff covers more than one file"
+    assert path.read_text() == "a\n"
+
+
+@pytest.mark.parametrize(
+    "header",
+    ["@@ -1,2 +1,2 @@", "@@ -1,3 +1,2 @@", "@@ -1 +1,3 @@"],
+)
+async def test_diff_mode_checks_hunk_length(tmp_path, header):
+    path = tmp_path / "f.txt"
+    path.write_text("a\nb\nc\n")
+    diff = f"--- a/f.txt\n+++ b/f.txt\n{header}\n a\n-b\n+B\n c\n"
+
+    result = await _write(path, mode="diff", diff=diff)
+
+    assert "header" in result["error"]
+    assert path.read_text() == "a\nb\nc\n"
+
+
+async def test_diff_mode_round_trips_random_edits(tmp_path):
+    rng = random.Random(1234)
+    path = tmp_path / "f.txt"
+    for _ in range(150):
+        old_lines = [f"line {rng.randrange(12)}\n" for _ in range(rng.randrange(1, 30))]
+        new_lines = list(old_lines)
+        for _ in range(rng.randrange(1, 5)):
+            position = rng.randrange(len(new_lines) + 1)
+            action = rng.choice(("insert", "delete", "replace"))
+            if action == "insert" or not new_lines:
+                new_lines.insert(position, f"new {rng.random()}\n")
+            elif action == "delete":
+                del new_lines[min(position, len(new_lines) - 1)]
+            else:
+                new_lines[min(position, len(new_lines) - 1)] = "replaced\n"
+        if rng.random() < 0.3 and new_lines:
+            new_lines[-1] = new_lines[-1].rstrip("\n")
+        old, new = "".join(old_lines), "".join(new_lines)
+        if old == new:
+            continue
+        path.write_text(old)
+        diff = "".join(
+            line if line.endswith("\n") else line + "\n\\ No newline at end of file\n"
+            for line in difflib.unified_diff(
+                old.splitlines(keepends=True), new.splitlines(keepends=True), "a", "b"
+            )
+        )
+
+        result = await _write(path, mode="diff", diff=diff)
+
+        assert "error" not in result, (old, new, diff, result)
+        assert path.read_text() == new
+
+
+async def test_append_and_overwrite(tmp_path):
+    path = tmp_path / "nested" / "f.txt"
+
+    await _write(path, content="one\n")
+    await _write(path, content="two\n", mode="append")
+    assert path.read_text() == "one\ntwo\n"
+
+    await _write(path, content="fresh")
+    assert path.read_text() == "fresh"
+    assert [p.name for p in path.parent.iterdir()] == ["f.txt"]
@@ -0,0 +1,131 @@
+import json
+import time
+
+import pytest
+from conftest import commit_file, decode, git
+
+import server
+
+
+@pytest.fixture
+def branches(make_repo):
+    """main: base - main1; feature: base - feat1 - feat2; other: base - other1."""
+    repo = make_repo()
+    commit_file(repo, "base.txt", "base\n", "base")
+    for branch, count in (("feature", 2), ("other", 1)):
+        git(repo, "checkout", "-q", "-b", branch, "main")
+        for i in range(count):
+            commit_file(repo, f"{branch}{i}.txt", f"{i}\n", f"{branch} {i}")
+    git(repo, "checkout", "-q", "main")
+    commit_file(repo, "main.txt", "main\n", "main 1")
+    return repo
+
+
+def _sha(repo, ref: str) -> str:
+    return git(repo, "rev-parse", ref).strip()
+
+
+async def test_merge_base_of_two_and_more_refs(branches):
+    base = _sha(branches, "main~1")
+
+    result = decode(await server.git_merge_base("repo", ["main", "feature"]))
+    assert [entry["full_sha"] for entry in result["merge_bases"]] == [base]
+
+    result = decode(await server.git_merge_base("repo", ["main", "feature", "other"]))
+    assert [entry["full_sha"] for entry in result["merge_bases"]] == [base]
+
+    result = decode(await server.git_merge_base("repo", ["feature", "feature~1"]))
+    assert result["merge_bases"][0]["full_sha"] == _sha(branches, "feature~1")
+
+
+async def test_merge_base_of_unrelated_histories_is_empty(branches):
+    git(branches, "checkout", "-q", "--orphan", "island")
+    commit_file(branches, "island.txt", "island\n", "island")
+
+    result = decode(await server.git_merge_base("repo", ["main", "island"]))
+    assert result["merge_bases"] == []
+    assert result["count"] == 0
+
+
+@pytest.mark.parametrize(
+    "refs", [["main", "no-such-branch"], ["main"], ["main", "--all"]]
+)
+async def test_merge_base_rejects_bad_refs(branches, refs):
+    result = json.loads(await server.git_merge_base("repo", refs))
+    assert "error" in result
+
+
+@pytest.mark.parametrize(
+    ("ancestor", "descendant", "expected"),
+    [
+        ("main~1", "main", True),
+        ("main~1", "feature", True),
+        ("feature", "main", False),
+        ("main", "main", True),
+    ],
+)
+async def test_is_ancestor(branches, ancestor, descendant, expected):
+    result = decode(await server.git_is_ancestor("repo", ancestor, descendant))
+    assert result["is_ancestor"] is expected
+
+
+async def test_is_ancestor_reports_unknown_ref(branches):
+    result = json.loads(await server.git_is_ancestor("repo", "nope", "main"))
+    assert "error" in result
+
+
+async def test_count_commits(branches):
+    assert decode(await server.git_count_commits("repo"))["count"] == 2
+    assert decode(await server.git_count_commits("repo", head="feature"))["count"] == 3
+
+    result = decode(await server.git_count_commits("repo", head="feature", base="main"))
+    assert (result["ahead"], result["behind"], result["count"]) == (2, 1, 2)
+
+    result = decode(await server.git_count_commits("repo", head="feature", paths=["feature1.txt"]))
+    assert result["count"] == 1
+
+
+async def test_count_commits_reports_unknown_ref(branches):
+    result = json.loads(await server.git_count_commits("repo", head="nope"))
+    assert "error" in result
+
+
+def _wait_for(predicate, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.02)
+
+
+def test_maintainer_rewrites_graph_only_after_ref_changes(branches):
+    maintainer = server.CommitGraphMaintainer(3600)
+    try:
+        with server.git_repos.checkout(branches) as repo:
+            maintainer.track(repo)
+        _wait_for(lambda: maintainer.stats()["writes"] == 1)
+        graphs = branches / ".git" / "objects" / "info" / "commit-graphs"
+        assert any(graphs.glob("*.graph"))
+
+        path, state = next(iter(maintainer._repos.items()))
+        maintainer._write(path, state)
+        assert maintainer.stats()["skips"] == 1
+
+        git(branches, "checkout", "-q", "-b", "topic/nested")
+        commit_file(branches, "nested.txt", "n\n", "nested")
+        maintainer._write(path, state)
+        stats = maintainer.stats()
+        assert (stats["writes"], stats["skips"], stats["failures"]) == (2, 1, 0)
+        assert stats["repos"][str(path)]["error"] is None
+    finally:
+        maintainer.close()
+
+
+def test_maintainer_records_failures(tmp_path):
+    maintainer = server.CommitGraphMaintainer(3600)
+    state = {
+        "git_dir": tmp_path, "common_dir": tmp_path, "fingerprint": None,
+        "last_write": None, "duration_s": None, "error": None,
+    }
+    maintainer._write(tmp_path, state)
+    assert maintainer.stats()["failures"] == 1
+    assert state["error"]
@@ -0,0 +1,113 @@
+import json
+from datetime import datetime
+
+import pytest
+from conftest import commit_file, decode, git
+
+import server
+
+
+@pytest.fixture
+def history(make_repo, monkeypatch):
+    repo = make_repo()
+    clock = iter(range(1_700_000_000, 1_800_000_000, 60))
+
+    def commit(name: str, message: str) -> None:
+        stamp = f"{next(clock)} +0000"
+        monkeypatch.setenv("GIT_AUTHOR_DATE", stamp)
+        monkeypatch.setenv("GIT_COMMITTER_DATE", stamp)
+        # Alternate authors so author filters hide commits mid-walk.
+        author = "Ann" if len(message) % 2 else "Bob"
+        monkeypatch.setenv("GIT_AUTHOR_NAME", author)
+        monkeypatch.setenv("GIT_AUTHOR_EMAIL", f"{author.lower()}@example.com")
+        commit_file(repo, name, message, message)
+
+    commit("base.txt", "base")
+    for branch in ("one", "two"):
+        git(repo, "checkout", "-q", "-b", branch, "main")
+        for i in range(3):
+            commit(f"{branch}/{i}.txt", f"{branch} {i}")
+        git(repo, "checkout", "-q", "main")
+        commit("main.txt", f"main before {branch}")
+        stamp = f"{next(clock)} +0000"
+        monkeypatch.setenv("GIT_COMMITTER_DATE", stamp)
+        git(repo, "merge", "-q", "--no-ff", "-m", f"merge {branch}", branch)
+    commit("main.txt", "tip")
+    return repo
+
+
+async def _log(**kwargs) -> dict:
+    return decode(await server.git_get_log("repo", **kwargs))
+
+
+async def _pages(page_size: int, **kwargs) -> list[str]:
+    shas, cursor = [], None
+    while True:
+        result = await _log(max_count=page_size, cursor=cursor, **kwargs)
+        assert len(result["commits"]) <= page_size
+        shas.extend(commit["full_sha"] for commit in result["commits"])
+        cursor = result["next_cursor"]
+        assert result["has_more"] is (cursor is not None)
+        if cursor is None:
+            return shas
+
+
+@pytest.mark.parametrize("page_size", [1, 2, 3, 5])
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"first_parent": True},
+        {"paths": ["one"]},
+        {"author": "^Ann "},
+        {"author": "ann@", "paths": ["two"]},
+        {"until": "@1700000600"},
+        {"author": "Ann", "until": "@1700000900", "first_parent": True},
+    ],
+)
+async def test_cursor_pages_match_single_walk(history, page_size, filters):
+    options = ["--first-parent"] if filters.get("first_parent") else []
+    if "author" in filters:
+        options += ["-E", f"--author={filters['author']}"]
+    if "until" in filters:
+        options.append(f"--until={filters['until']}")
+    expected = git(
+        history, "log", "--format=%H", *options, "HEAD", "--", *filters.get("paths", [])
+    ).split()
+    assert expected
+
+    assert [c["full_sha"] for c in (await _log(max_count=100, **filters))["commits"]] == expected
+    assert await _pages(page_size, **filters) == expected
+
+
+async def test_skip_and_exact_page_end(history):
+    everything = (await _log(max_count=100))["commits"]
+
+    skipped = await _log(max_count=3, skip=2)
+    assert skipped["commits"] == everything[2:5]
+
+    last = await _log(max_count=len(everything))
+    assert last["has_more"] is False
+    assert last["next_cursor"] is None
+
+
+async def test_cursor_rejects_other_first_parent(history):
+    first = await _log(max_count=2)
+    result = json.loads(await server.git_get_log(
+        "repo", max_count=2, cursor=first["next_cursor"], first_parent=True
+    ))
+    assert "error" in result
+
+
+async def test_until_and_since_accept_the_same_formats(history):
+    everything = (await _log(max_count=100))["commits"]
+    cutoff = datetime.fromtimestamp(1_700_000_300).isoformat()
+
+    for date in ("@1700000300", "2023-11-14T22:18:20Z"):
+        until = (await _log(max_count=100, until=date))["commits"]
+        since = (await _log(max_count=100, since=date))["commits"]
+        assert until == [c for c in everything if c["committed_date"] <= cutoff]
+        assert since == [c for c in everything if c["committed_date"] >= cutoff]
+
+    assert (await _log(max_count=100, until="tomorrow"))["commits"] == everything
+    assert (await _log(max_count=100, since="tomorrow"))["commits"] == []
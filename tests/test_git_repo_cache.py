@@ -0,0 +1,129 @@
+import asyncio
+import threading
+
+from conftest import commit_file, decode, git
+
+import server
+
+
+def test_checkout_reuses_idle_handle(make_repo):
+    path = make_repo()
+    commit_file(path, "a.txt", "a\n", "first")
+
+    with server.git_repos.checkout(path) as first:
+        pass
+    with server.git_repos.checkout(path) as second:
+        assert second is first
+
+    stats = server.git_repos.stats()
+    assert stats["hits"] == 1
+    assert stats["idle_repos"] == 1
+
+
+def test_concurrent_checkouts_get_distinct_handles(make_repo):
+    path = make_repo()
+    commit_file(path, "a.txt", "a\n", "first")
+
+    with server.git_repos.checkout(path) as outer:
+        with server.git_repos.checkout(path) as inner:
+            assert inner is not outer
+            assert server.git_repos.stats()["in_use"] == 2
+    assert server.git_repos.stats()["in_use"] == 0
+
+
+def test_handle_in_use_is_not_closed_by_ref_change(make_repo):
+    path = make_repo()
+    commit_file(path, "a.txt", "a\n", "first")
+
+    with server.git_repos.checkout(path) as repo:
+        commit_file(path, "b.txt", "b\n", "second")
+        # The stale handle stays usable until it is released.
+        assert repo.commit("HEAD").message.strip() == "second"
+    assert server.git_repos.stats()["invalidations"] == 1
+    assert server.git_repos.stats()["idle_repos"] == 0
+
+
+def test_eviction_closes_only_idle_handles(make_repo):
+    paths = [make_repo(f"repo{i}") for i in range(6)]
+    for path in paths:
+        commit_file(path, "a.txt", "a\n", "first")
+
+    for path in paths:
+        with server.git_repos.checkout(path):
+            pass
+
+    stats = server.git_repos.stats()
+    assert stats["idle_repos"] == 4
+    assert stats["evictions"] == 2
+
+
+def test_threads_share_repository_safely(make_repo):
+    path = make_repo()
+    for i in range(5):
+        commit_file(path, "a.txt", f"{i}\n", f"commit {i}")
+    expected = git(path, "rev-parse", "HEAD").strip()
+    errors = []
+
+    def worker():
+        try:
+            for _ in range(20):
+                with server.git_repos.checkout(path) as repo:
+                    assert repo.commit("HEAD").hexsha == expected
+                    assert repo.commit("HEAD~4").message.strip() == "commit 0"
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(30)
+    assert not errors
+    assert server.git_repos.stats()["in_use"] == 0
+
+
+async def test_concurrent_show_commit_calls(make_repo):
+    path = make_repo()
+    for i in range(3):
+        commit_file(path, f"f{i}.txt", f"{i}\n", f"commit {i}")
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*[
+            server.git_show_commit("repo", "HEAD", include_patch=True) for _ in range(40)
+        ]),
+        timeout=30,
+    )
+    assert {decode(result)["full_sha"] for result in results} == {
+        git(path, "rev-parse", "HEAD").strip()
+    }
+
+
+def test_commit_on_nested_branch_changes_fingerprint(make_repo):
+    path = make_repo()
+    commit_file(path, "a.txt", "a\n", "first")
+    git(path, "checkout", "-q", "-b", "feature/x")
+    commit_file(path, "b.txt", "b\n", "on feature")
+    git(path, "checkout", "-q", "main")
+    git_dir = path / ".git"
+
+    before = server._git_ref_fingerprint(git_dir, git_dir)
+    git(path, "update-ref", "refs/heads/feature/x", "HEAD")
+    assert server._git_ref_fingerprint(git_dir, git_dir) != before
+
+    before = server._git_ref_fingerprint(git_dir, git_dir)
+    git(path, "update-ref", "refs/remotes/origin/main", "HEAD")
+    assert server._git_ref_fingerprint(git_dir, git_dir) != before
+
+
+def test_commit_on_nested_branch_invalidates_idle_handle(make_repo):
+    path = make_repo()
+    commit_file(path, "a.txt", "a\n", "first")
+    git(path, "checkout", "-q", "-b", "feature/x")
+
+    with server.git_repos.checkout(path) as first:
+        pass
+    commit_file(path, "b.txt", "b\n", "on feature")
+    with server.git_repos.checkout(path) as second:
+        assert second is not first
+        assert second.commit("feature/x").message.strip() == "on feature"
+    assert server.git_repos.stats()["invalidations"] == 1
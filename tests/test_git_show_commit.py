@@ -0,0 +1,97 @@
+from conftest import commit_file, decode, git
+
+import server
+
+
+def _files(result: dict) -> dict:
+    return {entry["path"]: entry for entry in result["files"]}
+
+
+async def test_lists_status_counts_and_renames(make_repo):
+    repo = make_repo()
+    commit_file(repo, "old.txt", "".join(f"line {i}\n" for i in range(20)), "add")
+    commit_file(repo, "keep.txt", "keep\n", "keep")
+    git(repo, "mv", "old.txt", "new.txt")
+    (repo / "keep.txt").write_text("kept\nmore\n")
+    commit_file(repo, "added.txt", "x\n", "change")
+
+    result = decode(await server.git_show_commit("repo", "HEAD"))
+
+    files = _files(result)
+    assert files["new.txt"]["status"] == "renamed"
+    assert files["new.txt"]["old_path"] == "old.txt"
+    assert files["keep.txt"]["additions"] == 2
+    assert files["keep.txt"]["deletions"] == 1
+    assert files["added.txt"]["status"] == "added"
+    assert result["stats"] == {"files": 3, "additions": 3, "deletions": 1}
+    assert "patch" not in files["keep.txt"]
+
+
+async def test_patch_matches_file_when_page_would_pair_differently(make_repo):
+    repo = make_repo()
+    for name in ("a", "b", "c"):
+        commit_file(repo, f"{name}_old", f"{name} content\n" * 10, f"add {name}")
+    for name in ("a", "b", "c"):
+        git(repo, "mv", f"{name}_old", f"{name}_new")
+        # Exact renames are always detected; the limit applies to inexact ones.
+        with open(repo / f"{name}_new", "a") as handle:
+            handle.write("edited\n")
+    git(repo, "add", "-A")
+    git(repo, "commit", "-q", "-m", "rename all")
+
+    # Nine rename candidates exceed the limit, so the listing reports plain
+    # additions and deletions; a two-file page alone would still pair them.
+    result = decode(await server.git_show_commit(
+        "repo", "HEAD", include_patch=True, rename_limit=2, max_files=2
+    ))
+
+    files = _files(result)
+    assert files["a_new"]["status"] == "added"
+    assert files["a_old"]["status"] == "deleted"
+    assert files["a_new"]["patch"].startswith("diff --git a/a_new b/a_new\nnew file mode")
+    assert files["a_old"]["patch"].startswith("diff --git a/a_old b/a_old\ndeleted file mode")
+    assert result["next_file_offset"] == 2
+
+
+async def test_patch_matches_quoted_paths(make_repo):
+    repo = make_repo()
+    names = ["with space.txt", 'quote".txt', "tab\there.txt", "café.txt"]
+    for name in names:
+        commit_file(repo, name, "one\n", f"add {name}")
+    for name in names:
+        (repo / name).write_text("one\ntwo\n")
+    git(repo, "commit", "-q", "-am", "edit")
+
+    result = decode(await server.git_show_commit("repo", "HEAD", include_patch=True))
+
+    files = _files(result)
+    assert sorted(files) == sorted(names)
+    for name in names:
+        assert files[name]["patch"].endswith("+two\n"), name
+
+
+async def test_patch_caps_and_file_paging(make_repo):
+    repo = make_repo()
+    for i in range(5):
+        (repo / f"f{i}.txt").write_text("".join(f"row {n}\n" for n in range(200)))
+    git(repo, "add", "-A")
+    git(repo, "commit", "-q", "-m", "bulk")
+
+    result = decode(await server.git_show_commit(
+        "repo", "HEAD", include_patch=True, max_files=3, max_file_bytes=100,
+        max_patch_bytes=200,
+    ))
+
+    assert [entry["path"] for entry in result["files"]] == ["f0.txt", "f1.txt", "f2.txt"]
+    assert result["patch_truncated"] is True
+    assert len(result["files"][0]["patch"].encode()) == 100
+    assert result["files"][0]["patch_truncated"] is True
+    assert result["files"][2]["patch"] is None
+    assert result["next_file_offset"] == 3
+
+    rest = decode(await server.git_show_commit(
+        "repo", "HEAD", include_patch=True, file_offset=3, max_files=3
+    ))
+    assert [entry["path"] for entry in rest["files"]] == ["f3.txt", "f4.txt"]
+    assert rest["next_file_offset"] is None
+    assert all(not entry["patch_truncated"] for entry in rest["files"])
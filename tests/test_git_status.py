@@ -0,0 +1,114 @@
+import subprocess
+
+import pytest
+from conftest import commit_file, decode, git
+
+import server
+
+
+def _records(*records: str) -> str:
+    return "".join(f"{record}\0" for record in records)
+
+
+def test_parse_rename_and_copy_records_with_spaces():
+    output = _records(
+        "# branch.oid 1111111111111111111111111111111111111111",
+        "# branch.head main",
+        "2 R. N... 100644 100644 100644 aaaa bbbb R100 new name.txt",
+        "old name.txt",
+        "2 C. N... 100644 100644 100644 aaaa cccc C75 copy of file.txt",
+        "file.txt",
+        "1 .M N... 100644 100644 100644 aaaa aaaa dir with space/edited file.txt",
+        "? untracked file.txt",
+    )
+
+    result = server._parse_status_v2(output)
+
+    assert result["renamed"] == [
+        {"path": "new name.txt", "old_path": "old name.txt", "kind": "renamed", "score": 100},
+        {"path": "copy of file.txt", "old_path": "file.txt", "kind": "copied", "score": 75},
+    ]
+    assert result["staged"] == ["new name.txt", "copy of file.txt"]
+    assert result["modified"] == ["dir with space/edited file.txt"]
+    assert result["untracked"] == ["untracked file.txt"]
+    assert result["is_dirty"] is True
+
+
+def test_parse_conflict_record():
+    output = _records(
+        "# branch.head main",
+        "u UU N... 100644 100644 100644 100644 aaaa bbbb cccc both changed.txt",
+    )
+
+    result = server._parse_status_v2(output)
+
+    assert result["conflicts"] == [{"path": "both changed.txt", "status": "UU"}]
+    assert result["is_dirty"] is True
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        (
+            ["# branch.oid abc", "# branch.head main", "# branch.upstream origin/main",
+             "# branch.ab +3 -2"],
+            {"branch": "main", "detached": False, "upstream": "origin/main",
+             "ahead": 3, "behind": 2},
+        ),
+        (
+            ["# branch.oid abc", "# branch.head (detached)"],
+            {"branch": "HEAD", "detached": True, "upstream": None, "ahead": None,
+             "behind": None},
+        ),
+        (
+            ["# branch.oid (initial)", "# branch.head main"],
+            {"branch": "main", "head": None, "upstream": None, "ahead": None},
+        ),
+    ],
+)
+def test_parse_branch_headers(headers, expected):
+    result = server._parse_status_v2(_records(*headers))
+
+    assert {key: result[key] for key in expected} == expected
+    assert result["is_dirty"] is False
+
+
+async def test_status_of_real_repository(make_repo):
+    repo = make_repo()
+    commit_file(repo, "old name.txt", "".join(f"line {i}\n" for i in range(10)), "add")
+    commit_file(repo, "conflict.txt", "base\n", "base")
+    git(repo, "checkout", "-q", "-b", "topic")
+    commit_file(repo, "conflict.txt", "topic\n", "topic")
+    git(repo, "checkout", "-q", "main")
+    commit_file(repo, "conflict.txt", "main\n", "main")
+    git(repo, "branch", "-q", "--set-upstream-to=topic")
+    with pytest.raises(subprocess.CalledProcessError):
+        git(repo, "merge", "-q", "topic")
+    git(repo, "mv", "old name.txt", "new name.txt")
+    (repo / "new file.txt").write_text("x\n")
+
+    result = decode(await server.git_get_status("repo"))
+
+    assert result["branch"] == "main"
+    assert result["upstream"] == "topic"
+    assert (result["ahead"], result["behind"]) == (1, 1)
+    assert result["conflicts"] == [{"path": "conflict.txt", "status": "UU"}]
+    assert result["renamed"][0]["path"] == "new name.txt"
+    assert result["renamed"][0]["old_path"] == "old name.txt"
+    assert result["untracked"] == ["new file.txt"]
+
+
+async def test_status_of_detached_head_without_upstream(make_repo):
+    repo = make_repo()
+    commit_file(repo, "a.txt", "a\n", "first")
+    commit_file(repo, "a.txt", "b\n", "second")
+    git(repo, "checkout", "-q", "--detach", "HEAD~1")
+
+    result = decode(await server.git_get_status("repo"))
+
+    assert result["detached"] is True
+    assert result["branch"] == "HEAD"
+    assert result["head"] == git(repo, "rev-parse", "HEAD").strip()
+    assert result["upstream"] is None
+    assert result["ahead"] is None
+    assert result["is_dirty"] is False
@@ -0,0 +1,113 @@
+import json
+import random
+
+import pytest
+
+import server
+
+
+def _value(doc: dict, path: str):
+    return server._mongo_field_value(doc, path)
+
+
+def _matches(doc: dict, query: dict) -> bool:
+    for key, condition in query.items():
+        if key == "$and":
+            if not all(_matches(doc, clause) for clause in condition):
+                return False
+        elif key == "$or":
+            if not any(_matches(doc, clause) for clause in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = _value(doc, key)
+            for op, operand in condition.items():
+                if op == "$gt" and not value > operand:
+                    return False
+                if op == "$lt" and not value < operand:
+                    return False
+        elif _value(doc, key) != condition:
+            return False
+    return True
+
+
+class _Cursor:
+    def __init__(self, docs: list[dict]):
+        self.docs = docs
+
+    def sort(self, spec):
+        for field, direction in reversed(spec):
+            self.docs.sort(key=lambda doc: _value(doc, field), reverse=direction < 0)
+        return self
+
+    def limit(self, count):
+        self.docs = self.docs[:count]
+        return self
+
+    def __iter__(self):
+        return iter(self.docs)
+
+
+class _Collection:
+    def __init__(self, docs: list[dict]):
+        self.docs = docs
+
+    def find(self, query, fields=None):
+        return _Cursor([dict(doc) for doc in self.docs if _matches(doc, query)])
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    rng = random.Random(7)
+    docs = [
+        {"_id": i, "score": rng.randrange(5), "meta": {"group": rng.choice("ab")}}
+        for i in range(40)
+    ]
+    rng.shuffle(docs)
+    client = {"test": {"items": _Collection(docs)}}
+    monkeypatch.setitem(server.DATABASE_CONFIG["mongodb"], "database", "test")
+    monkeypatch.setattr(server.mongodb_conn, "get_client", lambda: client)
+    return docs
+
+
+def _find(**kwargs) -> dict:
+    args = {"filter": "{}", "limit": 10, "sort_field": None, "sort_order": -1, **kwargs}
+    return json.loads(server._mongodb_find("items", **args))
+
+
+@pytest.mark.parametrize(
+    "sort", [None, '{"score": -1}', '{"score": 1, "meta.group": -1}', '[["meta.group", 1]]']
+)
+@pytest.mark.parametrize("limit", [1, 7, 40])
+def test_keyset_pages_cover_the_sorted_collection_once(collection, sort, limit):
+    full = _find(sort=sort, limit=100, paginate=True)
+    assert full["has_more"] is False
+
+    ids, token = [], None
+    while True:
+        page = _find(sort=sort, limit=limit, paginate=True, continuation_token=token)
+        ids.extend(doc["_id"] for doc in page["documents"])
+        token = page["continuation_token"]
+        assert page["has_more"] is (token is not None)
+        if token is None:
+            break
+
+    assert ids == [doc["_id"] for doc in full["documents"]]
+    assert sorted(ids) == list(range(40))
+
+
+def test_filter_applies_to_every_page(collection):
+    query = '{"meta.group": "a"}'
+    first = _find(filter=query, sort='{"score": 1}', limit=3, paginate=True)
+    second = _find(
+        filter=query, sort='{"score": 1}', limit=100,
+        continuation_token=first["continuation_token"],
+    )
+    documents = first["documents"] + second["documents"]
+    assert all(doc["meta"]["group"] == "a" for doc in documents)
+    assert len(documents) == sum(doc["meta"]["group"] == "a" for doc in collection)
+
+
+def test_token_rejects_other_sort(collection):
+    first = _find(sort='{"score": 1}', limit=3, paginate=True)
+    with pytest.raises(ValueError, match="does not match"):
+        _find(sort='{"score": -1}', limit=3, continuation_token=first["continuation_token"])
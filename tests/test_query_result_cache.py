@@ -0,0 +1,71 @@
+import pytest
+
+import server
+
+
+@pytest.mark.parametrize(
+    ("backend", "query", "read_only", "tables"),
+    [
+        ("postgresql", "SELECT * FROM users WHERE id = 1", True, {"users"}),
+        ("postgresql", "select u.id from public.users u join orders o on o.user_id = u.id",
+         True, {"users", "orders"}),
+        ("postgresql", "SELECT 'drop table x' FROM logs -- update audit", True, {"logs"}),
+        ("postgresql", "SELECT $$ delete from t $$ FROM notes", True, {"notes"}),
+        ("postgresql", "WITH moved AS (DELETE FROM a RETURNING *) SELECT * FROM moved",
+         False, {"a", "moved"}),
+        ("postgresql", "UPDATE accounts SET balance = 0", False, {"accounts"}),
+        ("mysql", "SELECT * FROM `Orders`, customers", True, {"orders", "customers"}),
+        ("mysql", "INSERT INTO audit VALUES (1) # trailing", False, {"audit"}),
+        ("mysql", "SELECT nextval('s') FROM dual", False, {"dual"}),
+    ],
+)
+def test_scan_sql_classifies_statements(backend, query, read_only, tables):
+    _, scanned_read_only, scanned_tables = server._scan_sql(backend, query)
+    assert scanned_read_only is read_only
+    assert scanned_tables == tables
+
+
+def test_scan_sql_normalizes_outside_literals():
+    statement, _, _ = server._scan_sql(
+        "postgresql", "SELECT  *\n  FROM t /* note */ WHERE name = 'a  b' ;"
+    )
+    assert statement == "SELECT * FROM t WHERE name = 'a  b'"
+
+
+@pytest.fixture
+def runs(monkeypatch):
+    monkeypatch.setitem(
+        server.query_caches, "postgresql", server.QueryResultCache("postgresql", 1 << 20)
+    )
+    calls = []
+
+    async def run_db(backend, runner, query, params):
+        calls.append(query)
+        return f'{{"run": {len(calls)}}}'
+
+    monkeypatch.setattr(server, "_run_db", run_db)
+    return calls
+
+
+async def _query(query: str) -> str:
+    return await server._cached_query("postgresql", None, query, None, 60)
+
+
+async def test_writes_invalidate_only_the_tables_they_touch(runs):
+    users = await _query("SELECT * FROM users")
+    orders = await _query("SELECT * FROM orders")
+    assert await _query("SELECT *\n  FROM users;") == users
+    assert len(runs) == 2
+
+    await _query("UPDATE users SET name = 'x'")
+
+    assert await _query("SELECT * FROM users") != users
+    assert await _query("SELECT * FROM orders") == orders
+    assert len(runs) == 4
+
+
+async def test_write_without_known_tables_drops_everything(runs):
+    await _query("SELECT * FROM users")
+    await _query("VACUUM")
+    await _query("SELECT * FROM users")
+    assert len(runs) == 3
@@ -0,0 +1,148 @@
+import json
+import secrets
+from contextlib import contextmanager
+from decimal import Decimal
+
+import pytest
+
+import server
+
+
+class _FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.conn.queries.append(sql)
+
+    def fetchone(self):
+        return self.conn.row
+
+
+class _FakeConnection:
+    def __init__(self, row):
+        self.row = row
+        self.queries = []
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+
+def test_mysql_fingerprint_covers_columns_indexes_and_foreign_keys():
+    conn = _FakeConnection({
+        "columns": 3, "column_checksum": Decimal(12), "index_columns": 2,
+        "index_checksum": Decimal(34), "foreign_key_columns": 1,
+        "foreign_key_checksum": Decimal(56),
+    })
+
+    version = server._mysql_schema_version(conn)
+
+    assert version == (3, 12, 2, 34, 1, 56)
+    sql = conn.queries[0]
+    for table in ("COLUMNS", "STATISTICS", "KEY_COLUMN_USAGE"):
+        assert f"information_schema.{table}" in sql
+
+
+def test_entries_are_reloaded_only_when_the_fingerprint_changes():
+    cache = server.SchemaCache()
+    conn = _FakeConnection(None)
+    versions = iter([1, 1, 2])
+    loads = []
+
+    @contextmanager
+    def connection():
+        yield conn
+
+    def loader(conn):
+        loads.append(1)
+        return f"value {len(loads)}"
+
+    cache.register("fake", connection, lambda conn: next(versions))
+
+    # A tiny TTL checks the fingerprint on every load.
+    assert cache.load("fake", "dump:public:%", 1e-9, loader) == "value 1"
+    assert cache.load("fake", "dump:public:%", 1e-9, loader) == "value 1"
+    assert cache.load("fake", "dump:public:%", 1e-9, loader) == "value 2"
+    assert cache.stats()["revalidations"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+async def test_invalidating_a_table_drops_dumps_that_include_it(monkeypatch):
+    cache = server.SchemaCache()
+    monkeypatch.setattr(server, "schema_cache", cache)
+
+    @contextmanager
+    def connection():
+        yield None
+
+    cache.register("postgresql", connection, lambda conn: 1)
+    cache.register("mysql", connection, lambda conn: 1)
+    for key in ("tables", "describe:users", "describe:orders", "dump:public:%"):
+        cache.load("postgresql", key, 60, lambda conn: key)
+    cache.load("mysql", "describe:users", 60, lambda conn: "mysql")
+
+    result = json.loads(await server.database_invalidate_schema_cache("postgresql", "users"))
+
+    assert result["invalidated"] == 4
+    assert cache.peek("postgresql", "dump:public:%", 60) is None
+    assert cache.peek("mysql", "describe:users", 60) == "mysql"
+
+
+def test_postgresql_fingerprint_reads_only_user_relations():
+    conn = _FakeConnection((2, 740, 741, 1, 742))
+
+    assert server._postgresql_schema_version(conn) == (2, 740, 741, 1, 742)
+    sql = conn.queries[0]
+    assert "nspname !~ '^pg_'" in sql
+    assert "count(*) FROM pg_catalog.pg_attribute" not in sql
+
+
+@pytest.fixture
+def postgresql(postgresql_dsn):
+    import psycopg2
+
+    conn = psycopg2.connect(postgresql_dsn)
+    conn.autocommit = True
+    schema = f"fingerprint_{secrets.token_hex(4)}"
+    with conn.cursor() as cursor:
+        cursor.execute(f"CREATE SCHEMA {schema}")
+    yield conn, schema
+    with conn.cursor() as cursor:
+        cursor.execute(f"DROP SCHEMA {schema} CASCADE")
+    conn.close()
+
+
+def test_postgresql_fingerprint_changes_with_ddl(postgresql):
+    conn, schema = postgresql
+    statements = [
+        f"CREATE TABLE {schema}.parent (id int PRIMARY KEY, name text)",
+        f"ALTER TABLE {schema}.parent ADD COLUMN age int",
+        f"ALTER TABLE {schema}.parent ALTER COLUMN age SET NOT NULL",
+        f"ALTER TABLE {schema}.parent ALTER COLUMN name SET DEFAULT 'x'",
+        f"ALTER TABLE {schema}.parent ALTER COLUMN name TYPE varchar(20)",
+        f"ALTER TABLE {schema}.parent RENAME COLUMN age TO years",
+        f"ALTER TABLE {schema}.parent DROP COLUMN years",
+        f"CREATE TABLE {schema}.child (id int, parent_id int)",
+        f"CREATE INDEX ON {schema}.child (parent_id)",
+        f"ALTER TABLE {schema}.child ADD CONSTRAINT child_fk"
+        f" FOREIGN KEY (parent_id) REFERENCES {schema}.parent (id)",
+        f"ALTER TABLE {schema}.child DROP CONSTRAINT child_fk",
+        f"DROP TABLE {schema}.child",
+    ]
+    version = server._postgresql_schema_version(conn)
+    for statement in statements:
+        with conn.cursor() as cursor:
+            cursor.execute(statement)
+        changed = server._postgresql_schema_version(conn)
+        assert changed != version, statement
+        version = changed
+
+    with conn.cursor() as cursor:
+        cursor.execute(f"INSERT INTO {schema}.parent VALUES (1, 'a')")
+    assert server._postgresql_schema_version(conn) == version